@@ -8,7 +8,7 @@ const REPORTS_DIR = path.join(process.cwd(), "content", "_reports");
 export async function GET() {
   try {
     const entries = await fs.readdir(REPORTS_DIR);
-    const files = entries.filter((entry) => !entry.startsWith("."));
+    const files = entries.filter((entry) => !entry.startsWith(".") && entry !== "index.json");
 
     if (files.length === 0) {
       return NextResponse.json({ lastRun: null });
@@ -146,6 +146,24 @@ export default function PulseDigest({ digest }: { digest: PulseDigest }) {
                       </span>
                     ) : null}
                   </div>
+                  {item.alternates.length ? (
+                    <p className="mt-2 text-xs text-slate-500">
+                      Also covered by{" "}
+                      {item.alternates.map((alternate, index) => (
+                        <span key={alternate.id || alternate.link}>
+                          {index > 0 ? ", " : null}
+                          <a
+                            href={alternate.link}
+                            target="_blank"
+                            rel="noopener noreferrer"
+                            className="font-medium text-slate-600 hover:underline"
+                          >
+                            {alternate.source.name}
+                          </a>
+                        </span>
+                      ))}
+                    </p>
+                  ) : null}
                 </article>
               );
             })}
@@ -45,6 +45,22 @@ const storySchema = z
     community_impact: z.string().default(""),
     priority: z.enum(["high", "medium", "low"]).default("medium"),
     suggested_action: z.string().nullable().optional(),
+    alternates: z
+      .array(
+        z.object({
+          id: z.string().default(""),
+          source: z
+            .object({
+              id: z.string().default(""),
+              name: z.string().default("Kirkwood Pulse"),
+            })
+            .default({ id: "", name: "Kirkwood Pulse" }),
+          title: z.string().default(""),
+          link: z.string().url(),
+        }),
+      )
+      // A malformed alternate should not cost the whole story.
+      .catch([]),
   })
   .transform((story) => ({
     ...story,
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Benchmark the Kirkwood Pulse pipeline against local fixtures.
+
+Starts a fixture HTTP server that serves synthetic RSS feeds, HTML listing pages and
+article bodies, points the OpenAI client at scripts/fake_openai_server.py, and runs the
+full fetch_pulse pipeline once per scale in a fresh subprocess (so peak RSS is per scale).
+Results are printed as JSON: wall time, per-stage time, peak RSS and request counts.
+
+Example:
+  python scripts/bench_pulse.py --scales 4,20,100 --output bench.json -- --fetch-backend async
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+RESULT_MARKER = "BENCH_RESULT "
+FILLER_WORDS = (
+  "Kirkwood aldermen reviewed the budget for Argonne Drive repairs while residents asked about "
+  "parks staffing, library hours, stormwater fees and the farmers market schedule"
+).split()
+
+
+class FixtureState:
+  def __init__(self, *, items: int, article_words: int, latency: float) -> None:
+    self.items = items
+    self.article_words = article_words
+    self.latency = latency
+    self.started = datetime.now(tz=UTC)
+    self.lock = threading.Lock()
+    self.counts: Dict[str, int] = {}
+
+  def count(self, kind: str) -> None:
+    with self.lock:
+      self.counts[kind] = self.counts.get(kind, 0) + 1
+
+  def snapshot(self) -> Dict[str, int]:
+    with self.lock:
+      return dict(self.counts)
+
+  def published(self, index: int) -> datetime:
+    # Spread items across the default 36h window so cutoff filtering does real work.
+    return self.started - timedelta(hours=index * 3 + 1)
+
+
+def article_html(state: FixtureState, source: int, index: int) -> str:
+  # Seeded per article so bodies are distinct (no near-duplicate folding) yet identical across runs.
+  rng = random.Random(f"{source}/{index}")
+  words = [rng.choice(FILLER_WORDS) for _ in range(state.article_words)]
+  paragraphs = [" ".join(words[start : start + 80]) + "." for start in range(0, len(words), 80)]
+  body = "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+  return (
+    f"<html><head><title>Source {source} story {index}</title>"
+    f"<meta property='article:published_time' content='{state.published(index).isoformat()}'></head>"
+    f"<body><nav><a href='/'>Home</a></nav><article><h1>Source {source} story {index}</h1>{body}</article></body></html>"
+  )
+
+
+def feed_xml(state: FixtureState, base: str, source: int) -> str:
+  items = "".join(
+    f"<item><title>Source {source} story {index}</title>"
+    f"<link>{base}/articles/{source}/{index}.html</link>"
+    f"<pubDate>{format_datetime(state.published(index))}</pubDate>"
+    f"<description>Synthetic item {index} from source {source}.</description></item>"
+    for index in range(state.items)
+  )
+  return f"<?xml version='1.0' encoding='utf-8'?><rss version='2.0'><channel><title>Source {source}</title>{items}</channel></rss>"
+
+
+def listing_html(state: FixtureState, source: int) -> str:
+  links = "".join(
+    f"<li><a href='/articles/{source}/{index}.html'>Source {source} headline number {index} for the listing page</a></li>"
+    for index in range(state.items)
+  )
+  return f"<html><body><header><a href='/'>Home</a></header><ul>{links}</ul></body></html>"
+
+
+def make_fixture_handler(state: FixtureState) -> type:
+  class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+      pass
+
+    def send_body(self, body: str, content_type: str) -> None:
+      data = body.encode("utf-8")
+      self.send_response(200)
+      self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+      self.send_header("Content-Length", str(len(data)))
+      self.end_headers()
+      self.wfile.write(data)
+
+    def do_GET(self) -> None:
+      if state.latency:
+        time.sleep(state.latency)
+      base = f"http://{self.headers.get('Host')}"
+      parts = self.path.split("?")[0].strip("/").split("/")
+      try:
+        if len(parts) == 2 and parts[0] == "feeds":
+          state.count("feed")
+          self.send_body(feed_xml(state, base, int(parts[1].split(".")[0])), "application/rss+xml")
+          return
+        if len(parts) == 2 and parts[0] == "lists":
+          state.count("listing")
+          self.send_body(listing_html(state, int(parts[1].split(".")[0])), "text/html")
+          return
+        if len(parts) == 3 and parts[0] == "articles":
+          state.count("article")
+          self.send_body(article_html(state, int(parts[1]), int(parts[2].split(".")[0])), "text/html")
+          return
+      except ValueError:
+        pass
+      state.count("not_found")
+      self.send_response(404)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+
+  return Handler
+
+
+def start_fixture_servers(hosts: int, state: FixtureState) -> List[ThreadingHTTPServer]:
+  """One listener per simulated host, so per-host politeness limits behave as they would live."""
+  servers: List[ThreadingHTTPServer] = []
+  for _ in range(max(1, hosts)):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_fixture_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="bench-fixture", daemon=True).start()
+    servers.append(server)
+  return servers
+
+
+def sources_yaml(sources: int, ports: List[int], html_every: int) -> str:
+  lines = ["window_hours: 36", "max_items_per_source: 8", "", "sources:"]
+  for index in range(sources):
+    base = f"http://127.0.0.1:{ports[index % len(ports)]}"
+    if html_every and index % html_every == html_every - 1:
+      lines += [f'  - name: "Bench Listing {index}"', "    type: html", f'    url: "{base}/lists/{index}.html"']
+    else:
+      lines += [f'  - name: "Bench Feed {index}"', "    type: rss", f'    url: "{base}/feeds/{index}.xml"']
+  return "\n".join(lines) + "\n"
+
+
+def peak_rss_mb() -> float:
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Linux reports kilobytes, macOS bytes.
+  return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_child(config: Dict[str, Any]) -> int:
+  """Run one pipeline pass inside this process against a throwaway working tree."""
+  sys.path.insert(0, str(SCRIPTS_DIR))
+  import fetch_pulse
+
+  workdir = Path(config["workdir"])
+  sources_file = workdir / "sources.yml"
+  sources_file.write_text(config["sources_yaml"], encoding="utf-8")
+  fetch_pulse.SOURCES_FILE = sources_file
+  fetch_pulse.STATE_FILE = workdir / "data" / "pulse_state.json"
+  fetch_pulse.STATE_DB_FILE = workdir / "data" / "pulse_state.sqlite3"
+  fetch_pulse.JOURNAL_FILE = workdir / "data" / "pulse_journal.jsonl"
+  fetch_pulse.CACHE_DIR = workdir / "data" / "cache"
+  fetch_pulse.HTTP_CACHE_DIR = fetch_pulse.CACHE_DIR / "http"
+  fetch_pulse.EXTRACT_CACHE_DIR = fetch_pulse.CACHE_DIR / "extracted"
+  fetch_pulse.SUMMARY_CACHE_FILE = fetch_pulse.CACHE_DIR / "summaries.json"
+  fetch_pulse.BATCH_DIR = workdir / "data" / "batches"
+  fetch_pulse.LATEST_JSON_FILE = workdir / "content" / "pulse" / "latest.json"
+  fetch_pulse.MARKDOWN_DIR = workdir / "content" / "pulse"
+  fetch_pulse.REPORTS_DIR = workdir / "content" / "_reports"
+  fetch_pulse.REPORT_INDEX_FILE = fetch_pulse.REPORTS_DIR / "index.json"
+  fetch_pulse.ROLLUP_DIR = workdir / "content" / "_index" / "pulse"
+  fetch_pulse.ROLLUP_SUMMARY_FILE = fetch_pulse.ROLLUP_DIR / "summary.json"
+
+  started = time.perf_counter()
+  exit_code = fetch_pulse.main(config["pipeline_args"])
+  wall = time.perf_counter() - started
+
+  result = {
+    "exit_code": exit_code,
+    "wall_seconds": round(wall, 3),
+    "stages": {stage: round(seconds, 3) for stage, seconds in fetch_pulse.STAGE_SECONDS.items()},
+    "peak_rss_mb": peak_rss_mb(),
+    "stats": dict(fetch_pulse.STATS),
+  }
+  print(RESULT_MARKER + json.dumps(result), flush=True)
+  return 0
+
+
+def run_scale(
+  sources: int,
+  args: argparse.Namespace,
+  fixture: FixtureState,
+  ports: List[int],
+  openai_state: Any,
+  openai_url: str,
+) -> Dict[str, Any]:
+  with tempfile.TemporaryDirectory(prefix=f"pulse-bench-{sources}-") as workdir:
+    config = {
+      "workdir": workdir,
+      "sources_yaml": sources_yaml(sources, ports, args.html_every),
+      "pipeline_args": args.pipeline_args,
+    }
+    env = {
+      **os.environ,
+      "OPENAI_BASE_URL": openai_url,
+      "OPENAI_API_KEY": "bench",
+      "PULSE_MAX_FEATURED": str(args.featured),
+      "NO_PROXY": "127.0.0.1,localhost",
+    }
+    fixture_before = fixture.snapshot()
+    with openai_state.lock:
+      openai_before = dict(openai_state.request_counts)
+    completed = subprocess.run(
+      [sys.executable, str(Path(__file__).resolve()), "--child", json.dumps(config)],
+      capture_output=True,
+      text=True,
+      env=env,
+    )
+    fixture_after = fixture.snapshot()
+    with openai_state.lock:
+      openai_after = dict(openai_state.request_counts)
+
+  result: Dict[str, Any] = {"sources": sources}
+  for line in completed.stdout.splitlines():
+    if line.startswith(RESULT_MARKER):
+      result.update(json.loads(line[len(RESULT_MARKER) :]))
+  if "wall_seconds" not in result:
+    result["error"] = (completed.stderr or completed.stdout).strip().splitlines()[-20:]
+  result["requests"] = {
+    "fixture": {kind: fixture_after.get(kind, 0) - fixture_before.get(kind, 0) for kind in fixture_after},
+    "openai": {route: openai_after.get(route, 0) - openai_before.get(route, 0) for route in openai_after},
+  }
+  return result
+
+
+def run_parse_benchmark(archive_path: Optional[Path], repeat: int) -> Dict[str, Any]:
+  """Time listing_candidates per parser on each HTML source's page (from an archive, else a fixture page)."""
+  sys.path.insert(0, str(SCRIPTS_DIR))
+  import fetch_pulse
+
+  with contextlib.redirect_stdout(sys.stderr):
+    _, _, sources = fetch_pulse.load_sources_config()
+  archive = fetch_pulse.open_response_archive(archive_path, replaying=True) if archive_path else None
+  fixture = FixtureState(items=60, article_words=0, latency=0)
+
+  pages: List[Dict[str, Any]] = []
+  for source in sources:
+    if source.type != "html":
+      continue
+    if archive:
+      page = archive.get(source.url)
+      if page is None:
+        pages.append({"source": source.slug, "error": "not in archive"})
+        continue
+      html = page.text
+    else:
+      html = listing_html(fixture, 0)
+    timings: Dict[str, Any] = {}
+    baseline = fetch_pulse.listing_candidates(source, html, None, "bs4")
+    for parser in fetch_pulse.LISTING_PARSERS:
+      samples = []
+      for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        candidates = fetch_pulse.listing_candidates(source, html, None, parser)
+        samples.append(time.perf_counter() - started)
+      timings[parser] = {
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "candidates": len(candidates),
+        "matches_bs4": candidates == baseline,
+      }
+    pages.append({"source": source.slug, "bytes": len(html.encode("utf-8")), "parsers": timings})
+  return {
+    "generated_at": datetime.now(tz=UTC).isoformat(),
+    "archive": str(archive_path) if archive_path else None,
+    "repeat": repeat,
+    "pages": pages,
+  }
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+  pipeline_args: List[str] = []
+  if "--" in argv:
+    split = argv.index("--")
+    argv, pipeline_args = argv[:split], argv[split + 1 :]
+
+  parser = argparse.ArgumentParser(description="Benchmark fetch_pulse.py against local fixture and OpenAI stand-in servers.")
+  parser.add_argument("--scales", default="4,20,100", help="Comma-separated source counts to run (default 4,20,100).")
+  parser.add_argument("--items", type=int, default=12, help="Items per feed or listing page (default 12).")
+  parser.add_argument("--article-words", type=int, default=800, help="Words per synthetic article (default 800).")
+  parser.add_argument("--latency-ms", type=float, default=50.0, help="Fixture response latency in ms (default 50).")
+  parser.add_argument("--hosts", type=int, default=8, help="Distinct fixture hosts the sources are spread over (default 8).")
+  parser.add_argument("--html-every", type=int, default=4, help="Make every Nth source an HTML listing (0 for RSS only).")
+  parser.add_argument("--openai-delay", type=float, default=0.3, help="Seconds the OpenAI stand-in waits per response.")
+  parser.add_argument("--featured", type=int, default=10, help="PULSE_MAX_FEATURED for the pipeline (default 10).")
+  parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here as well as stdout.")
+  parser.add_argument(
+    "--parse-only",
+    action="store_true",
+    help="Only time listing-page parsing per parser for each HTML source in sources.yml.",
+  )
+  parser.add_argument(
+    "--parse-archive",
+    type=Path,
+    default=None,
+    help="With --parse-only, read the real listing pages from a fetch_pulse.py --record archive.",
+  )
+  parser.add_argument("--parse-repeat", type=int, default=20, help="Timed repetitions per parser with --parse-only.")
+  parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+  args = parser.parse_args(argv)
+  args.pipeline_args = pipeline_args
+  return args
+
+
+def main(argv: List[str]) -> int:
+  args = parse_args(argv)
+  if args.child:
+    return run_child(json.loads(args.child))
+  if args.parse_only:
+    report = run_parse_benchmark(args.parse_archive, args.parse_repeat)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+      args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+  from fake_openai_server import start_server
+
+  fixture = FixtureState(items=args.items, article_words=args.article_words, latency=args.latency_ms / 1000)
+  servers = start_fixture_servers(args.hosts, fixture)
+  ports = [server.server_port for server in servers]
+  openai_server, openai_state = start_server(0, delay=args.openai_delay)
+  openai_url = f"http://127.0.0.1:{openai_server.server_port}/v1"
+
+  scales = [int(value) for value in args.scales.split(",") if value.strip()]
+  results: List[Dict[str, Any]] = []
+  for sources in scales:
+    print(f"Running {sources} sources...", file=sys.stderr)
+    results.append(run_scale(sources, args, fixture, ports, openai_state, openai_url))
+
+  report = {
+    "generated_at": datetime.now(tz=UTC).isoformat(),
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "config": {
+      "items": args.items,
+      "article_words": args.article_words,
+      "latency_ms": args.latency_ms,
+      "hosts": args.hosts,
+      "html_every": args.html_every,
+      "openai_delay": args.openai_delay,
+      "featured": args.featured,
+      "pipeline_args": args.pipeline_args,
+    },
+    "results": results,
+  }
+  text = json.dumps(report, indent=2)
+  print(text)
+  if args.output:
+    args.output.write_text(text + "\n", encoding="utf-8")
+
+  for server in servers:
+    server.shutdown()
+  openai_server.shutdown()
+  return 0 if all(result.get("exit_code") == 0 for result in results) else 1
+
+
+if __name__ == "__main__":
+  sys.path.insert(0, str(SCRIPTS_DIR))
+  sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Local stand-in for the OpenAI endpoints used by the Kirkwood Pulse pipeline.
+
+Serves /v1/responses, /v1/files and /v1/batches with schema-valid story summaries so batch
+backfills and benchmarks can run without network access or a real API key. Point the
+pipeline at it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 and any OPENAI_API_KEY.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import re
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class StandInState:
+  def __init__(self, *, delay: float = 0.0, batch_seconds: float = 2.0, fail_every: int = 0) -> None:
+    self.delay = delay
+    self.batch_seconds = batch_seconds
+    self.fail_every = fail_every
+    self.lock = threading.Lock()
+    self.ids = itertools.count(1)
+    self.processed_lines = 0
+    self.files: Dict[str, bytes] = {}
+    self.batches: Dict[str, Dict[str, Any]] = {}
+    self.request_counts: Dict[str, int] = {}
+
+  def next_id(self, prefix: str) -> str:
+    with self.lock:
+      return f"{prefix}_{next(self.ids)}"
+
+  def count(self, route: str) -> None:
+    with self.lock:
+      self.request_counts[route] = self.request_counts.get(route, 0) + 1
+
+
+def summary_for_prompt(body: Dict[str, Any]) -> Dict[str, Any]:
+  prompt = ""
+  for message in body.get("input") or []:
+    if message.get("role") == "user":
+      prompt = str(message.get("content", ""))
+  match = re.search(r"^\s*Title:\s*(.+)$", prompt, re.MULTILINE)
+  title = match.group(1).strip() if match else "this item"
+  score = int(hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:4], 16) % 121 - 60
+  label = "positive" if score >= 15 else "negative" if score <= -15 else "neutral"
+  return {
+    "summary": f"Stand-in summary of {title}.",
+    "sentiment_label": label,
+    "sentiment_score": score,
+    "priority": ("high", "medium", "low")[abs(score) % 3],
+    "community_impact": "Residents may want to follow this item.",
+    "suggested_action": None,
+  }
+
+
+def response_body(state: StandInState, body: Dict[str, Any]) -> Dict[str, Any]:
+  text = json.dumps(summary_for_prompt(body))
+  return {
+    "id": state.next_id("resp"),
+    "object": "response",
+    "created_at": int(time.time()),
+    "model": body.get("model", "stand-in"),
+    "status": "completed",
+    "output": [
+      {
+        "type": "message",
+        "id": state.next_id("msg"),
+        "role": "assistant",
+        "status": "completed",
+        "content": [{"type": "output_text", "text": text, "annotations": []}],
+      }
+    ],
+    "parallel_tool_calls": False,
+    "tool_choice": "auto",
+    "tools": [],
+    "usage": {
+      "input_tokens": len(json.dumps(body)) // 4,
+      "output_tokens": len(text) // 4,
+      "total_tokens": (len(json.dumps(body)) + len(text)) // 4,
+      "input_tokens_details": {"cached_tokens": 0},
+      "output_tokens_details": {"reasoning_tokens": 0},
+    },
+  }
+
+
+def finish_batch(state: StandInState, batch: Dict[str, Any]) -> None:
+  lines: List[str] = []
+  failed = 0
+  for raw in state.files[batch["input_file_id"]].decode("utf-8").splitlines():
+    if not raw.strip():
+      continue
+    request = json.loads(raw)
+    with state.lock:
+      state.processed_lines += 1
+      fail = bool(state.fail_every) and state.processed_lines % state.fail_every == 0
+    if fail:
+      failed += 1
+      record = {
+        "id": state.next_id("batch_req"),
+        "custom_id": request["custom_id"],
+        "response": {"status_code": 500, "request_id": state.next_id("req"), "body": {"error": {"message": "stand-in failure"}}},
+        "error": None,
+      }
+    else:
+      record = {
+        "id": state.next_id("batch_req"),
+        "custom_id": request["custom_id"],
+        "response": {"status_code": 200, "request_id": state.next_id("req"), "body": response_body(state, request["body"])},
+        "error": None,
+      }
+    lines.append(json.dumps(record))
+  output_id = state.next_id("file")
+  state.files[output_id] = ("\n".join(lines) + "\n").encode("utf-8")
+  batch.update(
+    {
+      "status": "completed",
+      "output_file_id": output_id,
+      "completed_at": int(time.time()),
+      "request_counts": {"total": len(lines), "completed": len(lines) - failed, "failed": failed},
+    }
+  )
+
+
+def parse_multipart(content_type: str, body: bytes) -> Dict[str, Tuple[Optional[str], bytes]]:
+  message = BytesParser(policy=default_policy).parsebytes(
+    b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+  )
+  fields: Dict[str, Tuple[Optional[str], bytes]] = {}
+  for part in message.iter_parts():
+    name = part.get_param("name", header="content-disposition")
+    if name:
+      fields[str(name)] = (part.get_filename(), part.get_payload(decode=True) or b"")
+  return fields
+
+
+def make_handler(state: StandInState) -> type:
+  class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+      pass
+
+    def send_json(self, payload: Any, status: int = 200) -> None:
+      data = json.dumps(payload).encode("utf-8")
+      self.send_response(status)
+      self.send_header("Content-Type", "application/json")
+      self.send_header("Content-Length", str(len(data)))
+      self.end_headers()
+      self.wfile.write(data)
+
+    def read_body(self) -> bytes:
+      return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_GET(self) -> None:
+      path = self.path.split("?")[0].rstrip("/")
+      if path == "/stats":
+        with state.lock:
+          self.send_json({"requests": dict(state.request_counts)})
+        return
+      match = re.fullmatch(r"/v1/files/([\w-]+)/content", path)
+      if match and match.group(1) in state.files:
+        state.count("files.content")
+        data = state.files[match.group(1)]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return
+      if path == "/v1/batches":
+        state.count("batches.list")
+        batches = [
+          {key: value for key, value in batch.items() if not key.startswith("_")} for batch in reversed(list(state.batches.values()))
+        ]
+        self.send_json(
+          {
+            "object": "list",
+            "data": batches,
+            "first_id": batches[0]["id"] if batches else None,
+            "last_id": batches[-1]["id"] if batches else None,
+            "has_more": False,
+          }
+        )
+        return
+      match = re.fullmatch(r"/v1/batches/([\w-]+)", path)
+      if match and match.group(1) in state.batches:
+        state.count("batches.retrieve")
+        batch = state.batches[match.group(1)]
+        if batch["status"] == "in_progress" and time.monotonic() >= batch["_ready_at"]:
+          finish_batch(state, batch)
+        self.send_json({key: value for key, value in batch.items() if not key.startswith("_")})
+        return
+      self.send_json({"error": {"message": f"Unknown route {path}"}}, status=404)
+
+    def do_POST(self) -> None:
+      path = self.path.split("?")[0].rstrip("/")
+      body = self.read_body()
+      if path == "/v1/responses":
+        state.count("responses")
+        if state.delay:
+          time.sleep(state.delay)
+        self.send_json(response_body(state, json.loads(body)))
+        return
+      if path == "/v1/files":
+        state.count("files.create")
+        fields = parse_multipart(self.headers.get("Content-Type", ""), body)
+        filename, data = fields.get("file", ("upload.jsonl", b""))
+        file_id = state.next_id("file")
+        state.files[file_id] = data
+        self.send_json(
+          {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename or "upload.jsonl",
+            "purpose": (fields.get("purpose", (None, b"batch"))[1] or b"batch").decode("utf-8"),
+            "status": "processed",
+          }
+        )
+        return
+      if path == "/v1/batches":
+        state.count("batches.create")
+        request = json.loads(body)
+        if request.get("input_file_id") not in state.files:
+          self.send_json({"error": {"message": "Unknown input_file_id"}}, status=400)
+          return
+        batch_id = state.next_id("batch")
+        state.batches[batch_id] = {
+          "id": batch_id,
+          "object": "batch",
+          "endpoint": request.get("endpoint", "/v1/responses"),
+          "input_file_id": request["input_file_id"],
+          "completion_window": request.get("completion_window", "24h"),
+          "status": "in_progress",
+          "created_at": int(time.time()),
+          "output_file_id": None,
+          "error_file_id": None,
+          "request_counts": {"total": 0, "completed": 0, "failed": 0},
+          "_ready_at": time.monotonic() + state.batch_seconds,
+        }
+        self.send_json({key: value for key, value in state.batches[batch_id].items() if not key.startswith("_")})
+        return
+      self.send_json({"error": {"message": f"Unknown route {path}"}}, status=404)
+
+  return Handler
+
+
+def start_server(
+  port: int = 0,
+  *,
+  delay: float = 0.0,
+  batch_seconds: float = 2.0,
+  fail_every: int = 0,
+) -> Tuple[ThreadingHTTPServer, StandInState]:
+  """Start the stand-in on a daemon thread; port 0 picks a free port (see server.server_port)."""
+  state = StandInState(delay=delay, batch_seconds=batch_seconds, fail_every=fail_every)
+  server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+  server.daemon_threads = True
+  threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+  return server, state
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description="Serve a local stand-in for the OpenAI Responses, Files and Batch APIs.")
+  parser.add_argument("--port", type=int, default=8089, help="Port to listen on (default 8089).")
+  parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before answering /v1/responses.")
+  parser.add_argument("--batch-seconds", type=float, default=2.0, help="Seconds before a submitted batch completes.")
+  parser.add_argument(
+    "--fail-every",
+    type=int,
+    default=0,
+    help="Fail every Nth batch line with a 500 so resubmission can be exercised (0 disables).",
+  )
+  return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+  args = parse_args(argv)
+  server, _ = start_server(args.port, delay=args.delay, batch_seconds=args.batch_seconds, fail_every=args.fail_every)
+  print(f"Fake OpenAI listening on http://127.0.0.1:{server.server_port}/v1 (Ctrl+C to stop).")
+  try:
+    while True:
+      time.sleep(3600)
+  except KeyboardInterrupt:
+    server.shutdown()
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv[1:]))
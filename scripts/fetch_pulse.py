@@ -9,38 +9,146 @@ and writes both JSON + Markdown outputs for the site.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import base64
+import gzip
 import hashlib
+import heapq
+import io
 import json
 import os
+import random
 import re
+import signal
+import sqlite3
+import subprocess
 import sys
+import tempfile
 import textwrap
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from xml.etree import ElementTree
 
-import feedparser
-import requests
-import trafilatura
 import yaml
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
 import traceback
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from html.parser import HTMLParser
+
+# The heavy dependencies (openai, trafilatura, feedparser, bs4, lxml, dateutil, tenacity, requests,
+# httpx, tiktoken) are imported where they are first needed, so `--no-openai`, cached or
+# replayed runs and argument errors skip what they never use. See --import-profile.
+LAZY_IMPORTS = ("openai", "tenacity", "trafilatura", "feedparser", "bs4", "lxml", "dateutil", "requests", "httpx", "tiktoken")
+if TYPE_CHECKING:
+  from openai import OpenAI, RateLimitError
+
+try:
+  import resource
+except ImportError:  # Not on Windows; run reports leave out peak RSS there.
+  resource = None
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 SOURCES_FILE = ROOT_DIR / "scripts" / "sources.yml"
 STATE_FILE = ROOT_DIR / "data" / "pulse_state.json"
+STATE_DB_FILE = ROOT_DIR / "data" / "pulse_state.sqlite3"
+STATE_BACKENDS = ("sqlite", "json")
+STATE_BACKEND = os.environ.get("PULSE_STATE_BACKEND", "sqlite")
+STATE_RETENTION_DAYS = int(os.environ.get("PULSE_STATE_DAYS", "21"))
+DUPLICATE_THRESHOLD = float(os.environ.get("PULSE_DUPLICATE_THRESHOLD", "0.5"))
+SHINGLE_WORDS = 3
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 32
+CACHE_DIR = ROOT_DIR / "data" / "cache"
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+EXTRACT_CACHE_DIR = CACHE_DIR / "extracted"
+SUMMARY_CACHE_FILE = CACHE_DIR / "summaries.json"
+BATCH_DIR = ROOT_DIR / "data" / "batches"
+JOURNAL_FILE = ROOT_DIR / "data" / "pulse_journal.jsonl"
 LATEST_JSON_FILE = ROOT_DIR / "content" / "pulse" / "latest.json"
 MARKDOWN_DIR = ROOT_DIR / "content" / "pulse"
+REPORTS_DIR = ROOT_DIR / "content" / "_reports"
+REPORT_INDEX_FILE = REPORTS_DIR / "index.json"
+REPORT_KEEP = int(os.environ.get("PULSE_REPORT_KEEP", "90"))
+ROLLUP_DIR = ROOT_DIR / "content" / "_index" / "pulse"
+ROLLUP_SUMMARY_FILE = ROLLUP_DIR / "summary.json"
+INDEX_WORKERS = int(os.environ.get("PULSE_INDEX_WORKERS", str(os.cpu_count() or 1)))
+# Upper bounds (seconds) of the latency histogram buckets in run reports; the last bucket is open-ended.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 DEFAULT_SOURCE_URL = "https://kirkwoodsteves.com/pulse"
 USER_AGENT = "KirkwoodPulseBot/2.0 (+https://kirkwoodsteves.com)"
 OPENAI_MODEL = os.environ.get("PULSE_MODEL", "gpt-4.1-mini")
 MAX_FEATURED_STORIES = int(os.environ.get("PULSE_MAX_FEATURED", "10"))
 REQUEST_TIMEOUT = 20
+RUN_BUDGET_SECONDS = float(os.environ.get("PULSE_RUN_BUDGET", "900"))
+COLLECT_BUDGET_SHARE = float(os.environ.get("PULSE_COLLECT_SHARE", "0.6"))
+WRITE_RESERVE_SECONDS = 10.0
+MIN_FETCH_SECONDS = 1.0
+COLLECT_WORKERS = int(os.environ.get("PULSE_COLLECT_WORKERS", "4"))
+EXTRACT_WORKERS = int(os.environ.get("PULSE_EXTRACT_WORKERS", "8"))
+PER_HOST_LIMIT = int(os.environ.get("PULSE_PER_HOST_LIMIT", "2"))
+MAX_CONNECTIONS = int(os.environ.get("PULSE_MAX_CONNECTIONS", "16"))
+FETCH_BACKENDS = ("threads", "async")
+COLLECT_MODES = ("lazy", "eager")
+COLLECT_MODE = os.environ.get("PULSE_COLLECT_MODE", "lazy")
+# --watch: minutes between polls of a source, unless sources.yml sets poll_minutes.
+POLL_MINUTES = float(os.environ.get("PULSE_POLL_MINUTES", "30"))
+MIN_POLL_MINUTES = 1.0
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "_hs")
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "yclid", "_ga", "_gl"}
+HTTP_CACHE_MAX_BYTES = int(os.environ.get("PULSE_HTTP_CACHE_MB", "64")) * 1024 * 1024
+EXTRACT_CACHE_MAX_BYTES = int(os.environ.get("PULSE_EXTRACT_CACHE_MB", "32")) * 1024 * 1024
+EXTRACT_CACHE_ENABLED = True
+SPILL_BODIES = os.environ.get("PULSE_SPILL_BODIES", "1") != "0"
+# Sitemap files (the index plus the child sitemaps it points to) read per sitemap source.
+SITEMAP_MAX_FILES = int(os.environ.get("PULSE_SITEMAP_FILES", "10"))
+LISTING_PARSERS = ("lxml", "stdlib", "bs4")
+LISTING_PARSER = os.environ.get("PULSE_LISTING_PARSER", "lxml")
+PARSE_CHUNK_CHARS = 64 * 1024
+# Bump when parse_article's post-processing changes so stored extractions are re-derived.
+EXTRACTOR_VERSION = "2"
+TRAFILATURA_OPTIONS: Dict[str, Any] = {
+  "include_formatting": False,
+  "include_comments": False,
+  "favor_precision": True,
+  # trafilatura 2.x only fills in title and date when asked, and dates are day-only unless
+  # the output format carries the time.
+  "with_metadata": True,
+  "date_extraction_params": {"extensive_search": True, "original_date": True, "outputformat": "%Y-%m-%dT%H:%M:%S%z"},
+}
+SUMMARY_CACHE_MAX_ENTRIES = int(os.environ.get("PULSE_SUMMARY_CACHE_ENTRIES", "2000"))
+SUMMARY_CACHE_MAX_AGE_DAYS = int(os.environ.get("PULSE_SUMMARY_CACHE_DAYS", "45"))
+# Bump whenever the prompt wording or post-processing in summarize_story changes meaning.
+SUMMARY_PROMPT_VERSION = "2"
+ARTICLE_TOKEN_BUDGET = int(os.environ.get("PULSE_ARTICLE_TOKENS", "700"))
+TOKENIZER_ENCODING = "o200k_base"
+BOILERPLATE_PATTERN = re.compile(
+  r"\b(cookies?|subscribe|newsletter|sign (up|in)|log ?in|advertisement|all rights reserved|share (this|on)|"
+  r"click here|read more|related (stories|articles)|leave a (comment|reply)|privacy policy|terms of (use|service))\b",
+  re.IGNORECASE,
+)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])[\"'”’)]?\s+(?=[\"“(]?[A-Z0-9])")
+STOPWORDS = frozenset(
+  "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+SUMMARY_WORKERS = int(os.environ.get("PULSE_SUMMARY_WORKERS", "4"))
+OPENAI_RPM = int(os.environ.get("PULSE_OPENAI_RPM", "60"))
+OPENAI_TPM = int(os.environ.get("PULSE_OPENAI_TPM", "200000"))
+# Reserved per request on top of the prompt; the schema keeps replies well under this.
+SUMMARY_OUTPUT_TOKENS = 300
+BATCH_POLL_SECONDS = int(os.environ.get("PULSE_BATCH_POLL_SECONDS", "30"))
+BATCH_MAX_SUBMISSIONS = 3
+BATCH_STEPS = ("prepare", "submit", "materialize", "all")
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
 DEBUG = False
 
 SUMMARY_SCHEMA = {
@@ -81,6 +189,12 @@ SUMMARY_SCHEMA = {
 }
 
 
+# (text, title, published, MinHash signature) as returned by parse_article.
+Extraction = Tuple[str, Optional[str], Optional[datetime], Optional[str]]
+# (text, extracted title, <title> tag, published) before parse_article applies title fallbacks.
+ExtractedFields = Tuple[str, Optional[str], Optional[str], Optional[datetime]]
+
+
 @dataclass
 class SourceConfig:
   name: str
@@ -88,9 +202,19 @@ class SourceConfig:
   url: str
   slug: str
   max_items: int
+  poll_minutes: float = POLL_MINUTES
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SpilledText:
+  """Where an article body sits in the BodyStore spill file."""
+
+  offset: int
+  size: int
+  length: int
+
+
+@dataclass(slots=True)
 class Story:
   id: str
   source_slug: str
@@ -99,8 +223,33 @@ class Story:
   url: str
   published: datetime
   excerpt: str
-  content: str
+  # The article text, or where store_body spilled it; read it through `content`.
+  body: Union[str, SpilledText]
   tags: List[str]
+  # Near-duplicate copies from other sources, folded into this story (see cluster_near_duplicates).
+  alternates: List[Dict[str, Any]] = field(default_factory=list)
+  # MinHash of the text, taken while it was in memory anyway.
+  signature: Optional[str] = None
+
+  @property
+  def content(self) -> str:
+    return self.body if isinstance(self.body, str) else load_body(self.body)
+
+  @property
+  def content_length(self) -> int:
+    return len(self.body) if isinstance(self.body, str) else self.body.length
+
+
+@dataclass
+class FetchedPage:
+  url: str
+  content: bytes
+  encoding: Optional[str]
+  content_type: str
+
+  @property
+  def text(self) -> str:
+    return self.content.decode(self.encoding or "utf-8", errors="replace")
 
 
 @dataclass
@@ -113,13 +262,37 @@ class StorySummary:
   suggested_action: Optional[str]
 
 
-SESSION = requests.Session()
-SESSION.headers.update(
-  {
-    "User-Agent": USER_AGENT,
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-  }
-)
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+_EXTRACTION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXTRACTION_EXECUTOR_LOCK = threading.Lock()
+
+STATS: Counter[str] = Counter()
+STAGE_SECONDS: Dict[str, float] = {}
+OPERATION_METRICS: Dict[str, Dict[str, Any]] = {}
+SOURCE_METRICS: Dict[str, Counter[str]] = {}
+STORY_OUTCOMES: Dict[str, str] = {}
+STORY_TOKENS: Dict[str, Dict[str, int]] = {}
+_STATS_LOCK = threading.Lock()
+
+REQUEST_HEADERS = {
+  "User-Agent": USER_AGENT,
+  "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+SESSION: Any = None
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session() -> Any:
+  """The shared requests session, created (and requests imported) on the first threaded fetch."""
+  global SESSION
+  with _SESSION_LOCK:
+    if SESSION is None:
+      import requests
+
+      SESSION = requests.Session()
+      SESSION.headers.update(REQUEST_HEADERS)
+    return SESSION
 
 
 def debug_log(message: str) -> None:
@@ -128,18 +301,98 @@ def debug_log(message: str) -> None:
     print(f"[debug {timestamp}] {message}")
 
 
+def record_stat(name: str, amount: int = 1) -> None:
+  with _STATS_LOCK:
+    STATS[name] += amount
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+  started = time.perf_counter()
+  try:
+    yield
+  finally:
+    elapsed = time.perf_counter() - started
+    with _STATS_LOCK:
+      STAGE_SECONDS[stage] = STAGE_SECONDS.get(stage, 0.0) + elapsed
+    debug_log(f"Stage {stage} took {elapsed:.2f}s.")
+
+
+def record_timing(
+  operation: str,
+  seconds: float,
+  *,
+  source: Optional[str] = None,
+  nbytes: int = 0,
+  ok: bool = True,
+) -> None:
+  """Add one timed call to the run report, globally and (if given) against its source."""
+  bucket = next((index for index, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+  with _STATS_LOCK:
+    metrics = OPERATION_METRICS.setdefault(
+      operation,
+      {"count": 0, "failures": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0, "histogram": [0] * (len(LATENCY_BUCKETS) + 1)},
+    )
+    metrics["count"] += 1
+    metrics["failures"] += 0 if ok else 1
+    metrics["seconds"] += seconds
+    metrics["max_seconds"] = max(metrics["max_seconds"], seconds)
+    metrics["bytes"] += nbytes
+    metrics["histogram"][bucket] += 1
+    if source:
+      counters = SOURCE_METRICS.setdefault(source, Counter())
+      counters[f"{operation}_count"] += 1
+      counters[f"{operation}_seconds"] += seconds
+      if nbytes:
+        counters[f"{operation}_bytes"] += nbytes
+      if not ok:
+        counters[f"{operation}_failures"] += 1
+
+
+@contextmanager
+def timed(operation: str, source: Optional[str] = None) -> Iterator[None]:
+  started = time.perf_counter()
+  try:
+    yield
+  finally:
+    record_timing(operation, time.perf_counter() - started, source=source)
+
+
+def record_source_stat(source: str, name: str, amount: int = 1) -> None:
+  with _STATS_LOCK:
+    SOURCE_METRICS.setdefault(source, Counter())[name] += amount
+
+
+def record_outcome(story: Story, outcome: str) -> None:
+  with _STATS_LOCK:
+    STORY_OUTCOMES[story.id] = outcome
+
+
+def reset_stats() -> None:
+  with _STATS_LOCK:
+    STATS.clear()
+    STAGE_SECONDS.clear()
+    OPERATION_METRICS.clear()
+    SOURCE_METRICS.clear()
+    STORY_OUTCOMES.clear()
+    STORY_TOKENS.clear()
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+  with tmp_path.open("w", encoding="utf-8") as handle:
+    handle.write(text)
+    handle.flush()
+    os.fsync(handle.fileno())
+  os.replace(tmp_path, path)
+
+
 def slugify(value: str) -> str:
   slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
   return slug or "source"
 
 
-def trimmed_words(text: str, limit: int) -> str:
-  words = text.split()
-  if len(words) <= limit:
-    return text
-  return " ".join(words[:limit])
-
-
 def load_sources_config() -> tuple[int, int, List[SourceConfig]]:
   if not SOURCES_FILE.exists():
     raise FileNotFoundError(f"Missing sources configuration: {SOURCES_FILE}")
@@ -149,6 +402,7 @@ def load_sources_config() -> tuple[int, int, List[SourceConfig]]:
 
   window_hours = int(raw.get("window_hours", 36))
   default_max_items = int(raw.get("max_items_per_source", 8))
+  default_poll_minutes = float(raw.get("poll_minutes", POLL_MINUTES))
 
   sources_data = raw.get("sources")
   if not isinstance(sources_data, list):
@@ -165,7 +419,10 @@ def load_sources_config() -> tuple[int, int, List[SourceConfig]]:
       continue
     slug = slugify(name)
     max_items = int(entry.get("max_items", default_max_items))
-    sources.append(SourceConfig(name=name, type=source_type, url=url, slug=slug, max_items=max_items))
+    poll_minutes = max(MIN_POLL_MINUTES, float(entry.get("poll_minutes", default_poll_minutes)))
+    sources.append(
+      SourceConfig(name=name, type=source_type, url=url, slug=slug, max_items=max_items, poll_minutes=poll_minutes),
+    )
 
   if not sources:
     raise ValueError("No valid sources found in sources.yml.")
@@ -183,18 +440,19 @@ def load_sources_config() -> tuple[int, int, List[SourceConfig]]:
   return window_hours, default_max_items, sources
 
 
-def load_state() -> Dict[str, Any]:
-  if STATE_FILE.exists():
+def load_state(path: Optional[Path] = None) -> Dict[str, Any]:
+  path = path or STATE_FILE
+  if path.exists():
     try:
-      with STATE_FILE.open("r", encoding="utf-8") as handle:
+      with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
     except json.JSONDecodeError:
       pass
   return {"seen": {}, "last_run": None}
 
 
-def prune_state(state: Dict[str, Any]) -> Dict[str, Any]:
-  horizon = datetime.now(tz=UTC) - timedelta(days=21)
+def prune_state(state: Dict[str, Any], horizon: Optional[datetime] = None) -> Dict[str, Any]:
+  horizon = horizon or datetime.now(tz=UTC) - timedelta(days=STATE_RETENTION_DAYS)
   cleaned: Dict[str, str] = {}
   for story_id, seen_iso in state.get("seen", {}).items():
     try:
@@ -204,14 +462,266 @@ def prune_state(state: Dict[str, Any]) -> Dict[str, Any]:
     if seen_dt >= horizon:
       cleaned[story_id] = seen_iso
   state["seen"] = cleaned
+  if "signatures" in state:
+    state["signatures"] = {story_id: signature for story_id, signature in state["signatures"].items() if story_id in cleaned}
   return state
 
 
-def save_state(state: Dict[str, Any]) -> None:
-  STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-  with STATE_FILE.open("w", encoding="utf-8") as handle:
-    json.dump(state, handle, indent=2, sort_keys=True)
-    handle.write("\n")
+def save_state(state: Dict[str, Any], path: Optional[Path] = None) -> None:
+  atomic_write_text(path or STATE_FILE, json.dumps(state, indent=2, sort_keys=True) + "\n")
+
+
+def pack_signature(signature: str) -> str:
+  """A hex MinHash signature as unpadded base64 of its packed 32-bit slots, as pulse_state.json keeps it."""
+  return base64.b64encode(bytes.fromhex(signature)).decode("ascii").rstrip("=")
+
+
+def unpack_signature(value: str) -> str:
+  """The hex signature behind pack_signature's output; hex written before packing passes through."""
+  if len(value) == MINHASH_PERMUTATIONS * 8:
+    return value
+  return base64.b64decode(value + "=" * (-len(value) % 4)).hex()
+
+
+class StateStore(ABC):
+  """Ids of stories already featured, keyed to the run that featured them, plus the last run time."""
+
+  @abstractmethod
+  def seen(self) -> Mapping[str, str]: ...
+
+  @abstractmethod
+  def last_run(self) -> Optional[str]: ...
+
+  @abstractmethod
+  def prune(self, horizon: datetime) -> int: ...
+
+  @abstractmethod
+  def signatures(self) -> Dict[str, str]:
+    """MinHash signatures of recently featured stories, for near-duplicate checks across days."""
+
+  @abstractmethod
+  def mark_seen(
+    self,
+    story_ids: Iterable[str],
+    run_time: datetime,
+    signatures: Optional[Mapping[str, str]] = None,
+  ) -> None: ...
+
+  def save(self) -> None:
+    pass
+
+  def close(self) -> None:
+    pass
+
+  def export(self) -> Dict[str, Any]:
+    """The store in the pulse_state.json layout."""
+    signatures = {story_id: pack_signature(signature) for story_id, signature in self.signatures().items()}
+    return {"seen": dict(self.seen()), "last_run": self.last_run(), "signatures": signatures}
+
+
+class JsonStateStore(StateStore):
+  """The original whole-file format: read, pruned and rewritten in full every run."""
+
+  def __init__(self, path: Path) -> None:
+    self.path = path
+    self.state = load_state(path)
+
+  def seen(self) -> Mapping[str, str]:
+    return self.state.setdefault("seen", {})
+
+  def last_run(self) -> Optional[str]:
+    return self.state.get("last_run")
+
+  def prune(self, horizon: datetime) -> int:
+    before = len(self.seen())
+    prune_state(self.state, horizon)
+    return before - len(self.seen())
+
+  def signatures(self) -> Dict[str, str]:
+    return {story_id: unpack_signature(value) for story_id, value in self.state.get("signatures", {}).items()}
+
+  def mark_seen(
+    self,
+    story_ids: Iterable[str],
+    run_time: datetime,
+    signatures: Optional[Mapping[str, str]] = None,
+  ) -> None:
+    update_state_with_stories(self.state, list(story_ids), run_time)
+    if signatures:
+      # Packed: this file is committed daily, and hex would make each diff half as large again.
+      packed = {story_id: pack_signature(signature) for story_id, signature in signatures.items()}
+      self.state.setdefault("signatures", {}).update(packed)
+
+  def save(self) -> None:
+    save_state(self.state, self.path)
+
+
+class SeenIndex(Mapping[str, str]):
+  """Read-only Mapping view of the sqlite seen table; membership is one primary-key lookup."""
+
+  def __init__(self, store: "SqliteStateStore") -> None:
+    self.store = store
+
+  def __contains__(self, story_id: object) -> bool:
+    return self.store.query_one("SELECT 1 FROM seen WHERE id = ?", (story_id,)) is not None
+
+  def __getitem__(self, story_id: str) -> str:
+    row = self.store.query_one("SELECT seen_at FROM seen WHERE id = ?", (story_id,))
+    if row is None:
+      raise KeyError(story_id)
+    return row[0]
+
+  def __iter__(self) -> Iterator[str]:
+    return iter([row[0] for row in self.store.query_all("SELECT id FROM seen ORDER BY id")])
+
+  def __len__(self) -> int:
+    return self.store.query_one("SELECT COUNT(*) FROM seen")[0]
+
+
+class SeenExcept(Mapping[str, str]):
+  """A seen index with some ids hidden from it."""
+
+  def __init__(self, seen: Mapping[str, str], hidden: set[str]) -> None:
+    self.seen = seen
+    self.hidden = hidden
+
+  def __contains__(self, story_id: object) -> bool:
+    return story_id not in self.hidden and story_id in self.seen
+
+  def __getitem__(self, story_id: str) -> str:
+    if story_id in self.hidden:
+      raise KeyError(story_id)
+    return self.seen[story_id]
+
+  def __iter__(self) -> Iterator[str]:
+    return (story_id for story_id in self.seen if story_id not in self.hidden)
+
+  def __len__(self) -> int:
+    return sum(1 for _ in self)
+
+
+class SqliteStateStore(StateStore):
+  """State in a sqlite file with the story id as primary key and an index on the time it was seen.
+
+  Seen-checks are B-tree lookups and pruning is a range delete, so neither reads the whole
+  history, and a run only writes the rows it adds.
+  """
+
+  def __init__(self, path: Path, *, read_only: bool = False) -> None:
+    self.path = path
+    # Collection workers check membership from several threads; the lock serializes them.
+    self.lock = threading.Lock()
+    if read_only:
+      # Dry runs prune and mark an in-memory copy so the file on disk is never touched.
+      self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+      source = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+      source.backup(self.connection)
+      source.close()
+    else:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      self.connection = sqlite3.connect(path, check_same_thread=False)
+    with self.connection:
+      self.connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS seen (
+          id TEXT PRIMARY KEY,
+          seen_at TEXT NOT NULL,
+          seen_ts REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS seen_by_time ON seen (seen_ts);
+        CREATE TABLE IF NOT EXISTS signatures (
+          id TEXT PRIMARY KEY,
+          signature TEXT NOT NULL,
+          seen_ts REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS signatures_by_time ON signatures (seen_ts);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        """
+      )
+
+  def query_one(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[Tuple[Any, ...]]:
+    with self.lock:
+      return self.connection.execute(sql, params).fetchone()
+
+  def query_all(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+    with self.lock:
+      return self.connection.execute(sql, params).fetchall()
+
+  def seen(self) -> Mapping[str, str]:
+    return SeenIndex(self)
+
+  def last_run(self) -> Optional[str]:
+    row = self.query_one("SELECT value FROM meta WHERE key = 'last_run'")
+    return row[0] if row else None
+
+  def signatures(self) -> Dict[str, str]:
+    return dict(self.query_all("SELECT id, signature FROM signatures"))
+
+  def prune(self, horizon: datetime) -> int:
+    with self.lock, self.connection:
+      self.connection.execute("DELETE FROM signatures WHERE seen_ts < ?", (horizon.timestamp(),))
+      return self.connection.execute("DELETE FROM seen WHERE seen_ts < ?", (horizon.timestamp(),)).rowcount
+
+  def mark_seen(
+    self,
+    story_ids: Iterable[str],
+    run_time: datetime,
+    signatures: Optional[Mapping[str, str]] = None,
+  ) -> None:
+    iso = run_time.isoformat()
+    with self.lock, self.connection:
+      self.connection.executemany(
+        "INSERT OR REPLACE INTO seen (id, seen_at, seen_ts) VALUES (?, ?, ?)",
+        [(story_id, iso, run_time.timestamp()) for story_id in story_ids],
+      )
+      self.connection.executemany(
+        "INSERT OR REPLACE INTO signatures (id, signature, seen_ts) VALUES (?, ?, ?)",
+        [(story_id, signature, run_time.timestamp()) for story_id, signature in (signatures or {}).items()],
+      )
+      self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_run', ?)", (iso,))
+
+  def import_state(self, state: Dict[str, Any]) -> int:
+    rows = []
+    for story_id, seen_iso in state.get("seen", {}).items():
+      seen_dt = parse_datetime(seen_iso)
+      if seen_dt:
+        rows.append((story_id, seen_iso, seen_dt.timestamp()))
+    seen_ts = {story_id: ts for story_id, _, ts in rows}
+    signature_rows = [
+      (story_id, unpack_signature(signature), seen_ts[story_id])
+      for story_id, signature in state.get("signatures", {}).items()
+      if story_id in seen_ts
+    ]
+    with self.lock, self.connection:
+      self.connection.executemany("INSERT OR REPLACE INTO seen (id, seen_at, seen_ts) VALUES (?, ?, ?)", rows)
+      self.connection.executemany("INSERT OR REPLACE INTO signatures (id, signature, seen_ts) VALUES (?, ?, ?)", signature_rows)
+      if state.get("last_run"):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_run', ?)", (state["last_run"],))
+    return len(rows)
+
+  def close(self) -> None:
+    with self.lock:
+      self.connection.close()
+
+
+def open_state_store(backend: Optional[str] = None, *, read_only: bool = False) -> StateStore:
+  """Open the configured backend, migrating pulse_state.json into a new sqlite file once.
+
+  A read-only open (dry runs, exports) never creates or migrates anything; before the
+  migration has happened it simply reads the JSON file.
+  """
+  if (backend or STATE_BACKEND) == "json" or (read_only and not STATE_DB_FILE.exists()):
+    return JsonStateStore(STATE_FILE)
+  if read_only:
+    return SqliteStateStore(STATE_DB_FILE, read_only=True)
+  migrate = not STATE_DB_FILE.exists() and STATE_FILE.exists()
+  store = SqliteStateStore(STATE_DB_FILE)
+  if migrate:
+    imported = store.import_state(load_state(STATE_FILE))
+    # The JSON file is left in place: it is tracked in git and is what the json backend (and
+    # so the daily workflow) still reads and commits.
+    print(f"Imported {imported} seen stories from {STATE_FILE.name} into {STATE_DB_FILE.name}; {STATE_FILE.name} is unchanged.")
+  return store
 
 
 def parse_datetime(value: Any) -> Optional[datetime]:
@@ -229,22 +739,547 @@ def parse_datetime(value: Any) -> Optional[datetime]:
       second=value.tm_sec,
       tzinfo=UTC,
     )
+  from dateutil import parser as date_parser
+
   try:
     parsed = date_parser.parse(str(value))
-  except (ValueError, TypeError):
+  except (ValueError, TypeError, OverflowError):
     return None
   if parsed.tzinfo is None:
     parsed = parsed.replace(tzinfo=UTC)
   return parsed.astimezone(UTC)
 
 
-def fetch_url(url: str) -> Optional[str]:
+class DiskCache:
+  """Directory of blob files described by an index.json, evicted LRU once over max_bytes.
+
+  The index carries a signature; opening the cache with a different one discards every
+  entry, which is how stores tied to a parser version invalidate themselves.
+  """
+
+  suffix = ".bin"
+  stat_prefix = "cache"
+
+  def __init__(self, directory: Path, max_bytes: int, signature: str = "") -> None:
+    self.directory = directory
+    self.index_file = directory / "index.json"
+    self.max_bytes = max_bytes
+    self.signature = signature
+    self.lock = threading.Lock()
+    self.entries: Dict[str, Dict[str, Any]] = {}
+    if self.index_file.exists():
+      try:
+        with self.index_file.open("r", encoding="utf-8") as handle:
+          index = json.load(handle)
+        self.entries = index.get("entries", {})
+        if index.get("signature", "") != signature:
+          debug_log(f"{directory.name} cache signature changed; discarding {len(self.entries)} entries.")
+          for key in list(self.entries):
+            self.blob_path(key).unlink(missing_ok=True)
+          self.entries = {}
+      except (json.JSONDecodeError, AttributeError):
+        self.entries = {}
+
+  def blob_path(self, key: str) -> Path:
+    return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}{self.suffix}"
+
+  def read_blob(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+    with self.lock:
+      entry = self.entries.get(key)
+      if not entry:
+        return None
+      try:
+        data = self.blob_path(key).read_bytes()
+      except OSError:
+        self.entries.pop(key, None)
+        return None
+      entry["used_at"] = datetime.now(tz=UTC).isoformat()
+      return data, entry
+
+  def write_blob(self, key: str, data: bytes, **meta: Any) -> None:
+    now_iso = datetime.now(tz=UTC).isoformat()
+    with self.lock:
+      self.directory.mkdir(parents=True, exist_ok=True)
+      self.blob_path(key).write_bytes(data)
+      self.entries[key] = {**meta, "size": len(data), "stored_at": now_iso, "used_at": now_iso}
+    record_stat(f"{self.stat_prefix}_stored")
+
+  def total_bytes(self) -> int:
+    return sum(int(entry.get("size", 0)) for entry in self.entries.values())
+
+  def save(self) -> None:
+    with self.lock:
+      total = self.total_bytes()
+      if total > self.max_bytes:
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1].get("used_at", "")):
+          if total <= self.max_bytes:
+            break
+          total -= int(entry.get("size", 0))
+          self.entries.pop(key, None)
+          self.blob_path(key).unlink(missing_ok=True)
+          record_stat(f"{self.stat_prefix}_evicted")
+      if not self.entries and not self.directory.exists():
+        return
+      index = {"signature": self.signature, "entries": self.entries}
+      atomic_write_text(self.index_file, json.dumps(index, indent=2, sort_keys=True) + "\n")
+
+
+class HttpCache(DiskCache):
+  """Validated responses keyed by URL so unchanged pages come back as 304s."""
+
+  suffix = ".body"
+  stat_prefix = "http_cache"
+
+  def __init__(self, directory: Path, max_bytes: int = HTTP_CACHE_MAX_BYTES) -> None:
+    super().__init__(directory, max_bytes)
+
+  def conditional_headers(self, url: str) -> Dict[str, str]:
+    with self.lock:
+      entry = self.entries.get(url)
+    if not entry:
+      return {}
+    headers: Dict[str, str] = {}
+    if entry.get("etag"):
+      headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+      headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+  def reuse(self, url: str) -> Optional[FetchedPage]:
+    cached = self.read_blob(url)
+    if cached is None:
+      return None
+    content, entry = cached
+    record_stat("http_cache_hits")
+    return FetchedPage(url=url, content=content, encoding=entry.get("encoding"), content_type=entry.get("content_type", ""))
+
+  def store(self, page: FetchedPage, headers: Any) -> None:
+    record_stat("http_cache_misses")
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+      return
+    self.write_blob(
+      page.url,
+      page.content,
+      etag=etag,
+      last_modified=last_modified,
+      encoding=page.encoding,
+      content_type=page.content_type,
+    )
+
+
+class ExtractionStore(DiskCache):
+  """parse_article results keyed by URL plus a hash of the HTML they came from, zlib-compressed."""
+
+  suffix = ".json.z"
+  stat_prefix = "extract_cache"
+
+  def __init__(self, directory: Path, max_bytes: int = EXTRACT_CACHE_MAX_BYTES) -> None:
+    super().__init__(directory, max_bytes, signature=extractor_signature())
+
+  @staticmethod
+  def key(url: str, html: str) -> str:
+    return f"{url}\0{hashlib.sha1(html.encode('utf-8', errors='replace')).hexdigest()}"
+
+  def get(self, url: str, html: str) -> Optional[ExtractedFields]:
+    cached = self.read_blob(self.key(url, html))
+    if cached is None:
+      record_stat("extract_cache_misses")
+      return None
+    try:
+      record = json.loads(zlib.decompress(cached[0]))
+    except (zlib.error, ValueError):
+      record_stat("extract_cache_misses")
+      return None
+    record_stat("extract_cache_hits")
+    published = datetime.fromisoformat(record["published"]) if record.get("published") else None
+    return record["text"], record.get("title"), record.get("page_title"), published
+
+  def put(self, url: str, html: str, fields: ExtractedFields) -> None:
+    text, title, page_title, published = fields
+    record = {
+      "text": text,
+      "title": title,
+      "page_title": page_title,
+      "published": published.isoformat() if published else None,
+    }
+    self.write_blob(self.key(url, html), zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"), 6))
+
+
+HTTP_CACHE: Optional[HttpCache] = None
+
+
+_EXTRACTION_STORE: Optional[ExtractionStore] = None
+_EXTRACTION_STORE_LOCK = threading.Lock()
+
+
+class ResponseArchive:
+  """Append-only log of fetched pages for offline replay.
+
+  Each page body is zlib-compressed and appended to the archive file; a JSON-lines index
+  next to it (<archive>.idx) records the URL, offset and length so replay can seek straight
+  to any response. Later records for the same URL win. Every record also carries the time its
+  recording session started, which is the clock a replay runs at.
+  """
+
+  def __init__(self, path: Path, *, replaying: bool) -> None:
+    self.path = path
+    self.index_path = path.with_name(path.name + ".idx")
+    self.replaying = replaying
+    self.lock = threading.Lock()
+    self.index: Dict[str, Dict[str, Any]] = {}
+    for record in read_jsonl(self.index_path):
+      self.index[record["url"]] = record
+    if replaying:
+      if not path.exists():
+        raise FileNotFoundError(f"Missing response archive: {path}")
+      self.handle = path.open("rb")
+    else:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      self.handle = path.open("ab")
+    self.session = datetime.now(tz=UTC).isoformat()
+
+  @property
+  def recorded_at(self) -> Optional[datetime]:
+    """When the newest recording session in the archive started.
+
+    An archive can hold several sessions; the newest one's responses win, so its start is the
+    run time to replay. Archives written before sessions were recorded fall back to the
+    earliest fetch.
+    """
+    sessions = [record["session"] for record in self.index.values() if record.get("session")]
+    if sessions:
+      return datetime.fromisoformat(max(sessions))
+    stamps = [record["fetched_at"] for record in self.index.values() if record.get("fetched_at")]
+    return datetime.fromisoformat(min(stamps)) if stamps else None
+
+  def add(self, page: FetchedPage) -> None:
+    data = zlib.compress(page.content, 6)
+    with self.lock:
+      offset = self.handle.seek(0, os.SEEK_END)
+      self.handle.write(data)
+      self.handle.flush()
+      record = {
+        "url": page.url,
+        "offset": offset,
+        "length": len(data),
+        "encoding": page.encoding,
+        "content_type": page.content_type,
+        "fetched_at": datetime.now(tz=UTC).isoformat(),
+        "session": self.session,
+      }
+      self.index[page.url] = record
+      append_jsonl(self.index_path, [record])
+    record_stat("archive_recorded")
+
+  def get(self, url: str) -> Optional[FetchedPage]:
+    record = self.index.get(url)
+    if record is None:
+      record_stat("replay_misses")
+      return None
+    with self.lock:
+      self.handle.seek(record["offset"])
+      data = self.handle.read(record["length"])
+    record_stat("replay_hits")
+    return FetchedPage(
+      url=url,
+      content=zlib.decompress(data),
+      encoding=record.get("encoding"),
+      content_type=record.get("content_type", ""),
+    )
+
+  def close(self) -> None:
+    self.handle.close()
+
+
+RESPONSE_ARCHIVE: Optional[ResponseArchive] = None
+
+
+def open_response_archive(path: Path, *, replaying: bool) -> ResponseArchive:
+  global RESPONSE_ARCHIVE
+  if RESPONSE_ARCHIVE:
+    RESPONSE_ARCHIVE.close()
+  RESPONSE_ARCHIVE = ResponseArchive(path, replaying=replaying)
+  return RESPONSE_ARCHIVE
+
+
+def open_http_cache(enabled: bool = True) -> Optional[HttpCache]:
+  global HTTP_CACHE
+  if not enabled:
+    HTTP_CACHE = None
+  elif HTTP_CACHE is None:
+    HTTP_CACHE = HttpCache(HTTP_CACHE_DIR)
+  return HTTP_CACHE
+
+
+def extraction_store() -> Optional[ExtractionStore]:
+  global _EXTRACTION_STORE
+  if not EXTRACT_CACHE_ENABLED:
+    return None
+  with _EXTRACTION_STORE_LOCK:
+    if _EXTRACTION_STORE is None:
+      _EXTRACTION_STORE = ExtractionStore(EXTRACT_CACHE_DIR)
+    return _EXTRACTION_STORE
+
+
+def save_fetch_caches() -> None:
+  if HTTP_CACHE:
+    HTTP_CACHE.save()
+  if _EXTRACTION_STORE:
+    _EXTRACTION_STORE.save()
+
+
+class BodyStore:
+  """Spill file for article bodies, so Story records stay a few hundred bytes.
+
+  Each body is compressed and appended once, when its story is built, and read back only
+  when something needs the full text: summarizing, journaling, batch files. The file is an
+  anonymous temporary file that lives for one run or one --watch poll (close_body_store).
+  """
+
+  def __init__(self) -> None:
+    self.handle = tempfile.TemporaryFile(prefix="pulse-bodies-")
+    self.lock = threading.Lock()
+    self.end = 0
+
+  def put(self, text: str) -> SpilledText:
+    data = zlib.compress(text.encode("utf-8"), 1)
+    with self.lock:
+      offset = self.end
+      self.handle.seek(offset)
+      self.handle.write(data)
+      self.end += len(data)
+    record_stat("bodies_spilled")
+    record_stat("body_bytes_spilled", len(data))
+    return SpilledText(offset, len(data), len(text))
+
+  def get(self, ref: SpilledText) -> str:
+    with self.lock:
+      self.handle.seek(ref.offset)
+      data = self.handle.read(ref.size)
+    return zlib.decompress(data).decode("utf-8")
+
+  def close(self) -> None:
+    with self.lock:
+      self.handle.close()
+
+
+BODY_STORE: Optional[BodyStore] = None
+_BODY_STORE_LOCK = threading.Lock()
+
+
+def store_body(text: str) -> Union[str, SpilledText]:
+  global BODY_STORE
+  if not SPILL_BODIES:
+    return text
+  with _BODY_STORE_LOCK:
+    if BODY_STORE is None:
+      BODY_STORE = BodyStore()
+  return BODY_STORE.put(text)
+
+
+def load_body(ref: SpilledText) -> str:
+  if BODY_STORE is None:
+    raise RuntimeError("Story body was spilled, but no body store is open.")
+  return BODY_STORE.get(ref)
+
+
+def close_body_store() -> None:
+  """Drop every spilled body once a run or poll is done with its stories; the next one starts a fresh file."""
+  global BODY_STORE
+  with _BODY_STORE_LOCK:
+    if BODY_STORE is not None:
+      BODY_STORE.close()
+      BODY_STORE = None
+  # Its entries are keyed on spill refs, which a new file would hand out again.
+  clear_article_prompts()
+
+
+class RunDeadline:
+  """Wall-clock budget for one daily run, shared by the collect and summarize stages.
+
+  Collection may use `collect_share` of the budget. Each source gets its own slice of
+  what is left when it starts: a fair share of the remaining collect time given how many
+  sources still wait for a worker. A source that starts after the collect share is spent
+  is skipped; one that outlives its slice stops fetching articles. Summaries that would
+  start after the summary deadline (the budget less a reserve for writing) use the
+  excerpt instead. Everything given up is recorded for the run report.
+  """
+
+  def __init__(self, total_seconds: float, *, collect_share: float = COLLECT_BUDGET_SHARE) -> None:
+    self.total = total_seconds
+    self.started = time.monotonic()
+    self.collect_deadline = self.started + total_seconds * collect_share
+    self.summary_deadline = max(self.collect_deadline, self.started + total_seconds - WRITE_RESERVE_SECONDS)
+    self.lock = threading.Lock()
+    self.concurrency = 1
+    self.unstarted = 0
+    self.source_deadlines: Dict[str, float] = {}
+    self.sources_skipped: List[str] = []
+    self.links_skipped: Dict[str, List[str]] = {}
+    self.summaries_skipped: List[str] = []
+
+  def plan_sources(self, count: int, concurrency: int) -> None:
+    with self.lock:
+      self.unstarted = count
+      self.concurrency = max(1, concurrency)
+
+  def start_source(self, slug: str) -> bool:
+    """Open the source's slice, or return False (and record the skip) if collection time is spent."""
+    with self.lock:
+      now = time.monotonic()
+      left = self.collect_deadline - now
+      waiting = max(1, self.unstarted)
+      self.unstarted = max(0, self.unstarted - 1)
+      if left < MIN_FETCH_SECONDS:
+        self.sources_skipped.append(slug)
+        return False
+      self.source_deadlines[slug] = now + left * min(1.0, self.concurrency / waiting)
+      return True
+
+  def open_merge(self) -> None:
+    """Let every started source fetch until the collect deadline.
+
+    In a lazy run the per-source slices cover reading the feeds and listing pages; the
+    articles come afterwards, in merge batches sized to the stories still needed.
+    """
+    with self.lock:
+      for slug in self.source_deadlines:
+        self.source_deadlines[slug] = max(self.source_deadlines[slug], self.collect_deadline)
+
+  def fetch_timeout(self, source: Optional[str]) -> Optional[float]:
+    """Timeout for the next request of `source`, or None once its slice has run out."""
+    deadline = self.source_deadlines.get(source) if source else None
+    if deadline is None:
+      return REQUEST_TIMEOUT
+    left = deadline - time.monotonic()
+    return min(REQUEST_TIMEOUT, left) if left >= MIN_FETCH_SECONDS else None
+
+  def skip_link(self, source: str, url: str) -> None:
+    with self.lock:
+      self.links_skipped.setdefault(source, []).append(url)
+
+  def cut_short(self, slug: str) -> bool:
+    return slug in self.sources_skipped or slug in self.links_skipped
+
+  def summary_timeout(self) -> Optional[float]:
+    """Time left for summaries, or None once the summary deadline has passed."""
+    left = self.summary_deadline - time.monotonic()
+    return left if left >= MIN_FETCH_SECONDS else None
+
+  def skip_summary(self, story: Story) -> None:
+    with self.lock:
+      self.summaries_skipped.append(story.id)
+
+  @property
+  def degraded(self) -> bool:
+    return bool(self.sources_skipped or self.links_skipped or self.summaries_skipped)
+
+  def report(self) -> Dict[str, Any]:
+    with self.lock:
+      return {
+        "budget_seconds": self.total,
+        "collect_seconds": round(self.collect_deadline - self.started, 3),
+        "summary_seconds": round(self.summary_deadline - self.started, 3),
+        "degraded": self.degraded,
+        "sources_skipped": list(self.sources_skipped),
+        "links_skipped": {slug: list(urls) for slug, urls in sorted(self.links_skipped.items())},
+        "summaries_skipped": list(self.summaries_skipped),
+      }
+
+
+DEADLINE: Optional[RunDeadline] = None
+
+
+def host_slot(url: str) -> threading.BoundedSemaphore:
+  host = urlparse(url).netloc.lower()
+  with _HOST_SLOTS_LOCK:
+    slot = _HOST_SLOTS.get(host)
+    if slot is None:
+      slot = threading.BoundedSemaphore(max(1, PER_HOST_LIMIT))
+      _HOST_SLOTS[host] = slot
+  return slot
+
+
+def fetch_budget(url: str, source: Optional[str]) -> Optional[float]:
+  """Timeout for a request under the run deadline, or None (recorded as skipped) once the source is out of time."""
+  if DEADLINE is None:
+    return REQUEST_TIMEOUT
+  timeout = DEADLINE.fetch_timeout(source)
+  if timeout is None and source:
+    DEADLINE.skip_link(source, url)
+    record_source_stat(source, "deadline_skipped")
+  return timeout
+
+
+def fetch_page(url: str, *, operation: str = "fetch", source: Optional[str] = None) -> Optional[FetchedPage]:
+  started = time.perf_counter()
+  archive = RESPONSE_ARCHIVE
+  if archive and archive.replaying:
+    page = archive.get(url)
+  else:
+    page = download_page(url, source)
+    if archive and page:
+      archive.add(page)
+  record_timing(
+    operation,
+    time.perf_counter() - started,
+    source=source,
+    nbytes=len(page.content) if page else 0,
+    ok=page is not None,
+  )
+  return page
+
+
+def download_page(url: str, source: Optional[str] = None) -> Optional[FetchedPage]:
+  import requests
+
+  session = http_session()
+  cache = HTTP_CACHE
+  headers = cache.conditional_headers(url) if cache else {}
   try:
-    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    with host_slot(url):
+      # Budgeted only once the host slot is ours, so time spent queued counts against the source.
+      timeout = fetch_budget(url, source)
+      if timeout is None:
+        return None
+      response = session.get(url, timeout=timeout, headers=headers)
+      if response.status_code == 304 and cache:
+        cached = cache.reuse(url)
+        if cached:
+          return cached
+        # The index promised a body we no longer have; ask again without validators.
+        response = session.get(url, timeout=timeout)
     response.raise_for_status()
-    return response.text
   except requests.RequestException:
     return None
+  page = FetchedPage(
+    url=url,
+    content=response.content,
+    encoding=response.encoding or response.apparent_encoding,
+    content_type=response.headers.get("Content-Type", ""),
+  )
+  if cache:
+    cache.store(page, response.headers)
+  return page
+
+
+def fetch_url(url: str, *, operation: str = "fetch", source: Optional[str] = None) -> Optional[str]:
+  page = fetch_page(url, operation=operation, source=source)
+  return page.text if page else None
+
+
+def parse_feed(page: Optional[FetchedPage], source: Optional[str] = None) -> Any:
+  import feedparser
+
+  if page is None:
+    return feedparser.FeedParserDict(entries=[])
+  with timed("feed_parse", source):
+    return feedparser.parse(
+      page.content,
+      response_headers={"content-type": page.content_type, "content-location": page.url},
+    )
 
 
 def domains_related(base: str, candidate_url: str) -> bool:
@@ -257,72 +1292,265 @@ def domains_related(base: str, candidate_url: str) -> bool:
   return candidate_host == base_host or candidate_host.endswith("." + base_host)
 
 
-def extract_article(url: str, default_title: str = "") -> Optional[Tuple[str, Optional[str], Optional[datetime]]]:
-  html = fetch_url(url)
+def extract_article(url: str, default_title: str = "", source: Optional[str] = None) -> Optional[Extraction]:
+  html = fetch_url(url, operation="article_fetch", source=source)
   if not html:
     return None
+  return parse_article(html, url, default_title, source)
+
+
+def extractor_signature() -> str:
+  from importlib import metadata
+
+  # Read from the package metadata: a run whose extractions all come from the store never imports trafilatura.
+  try:
+    version = metadata.version("trafilatura")
+  except metadata.PackageNotFoundError:
+    version = "unknown"
+  return f"{EXTRACTOR_VERSION}|trafilatura={version}|{json.dumps(TRAFILATURA_OPTIONS, sort_keys=True)}"
+
+
+def tree_text(tree: Any) -> Tuple[str, Optional[str]]:
+  """Visible text and <title> of an already parsed page, skipping script, style and noscript."""
+  pieces = tree.xpath("//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]")
+  title = tree.find(".//title")
+  page_title = title.text.strip() if title is not None and title.text and title.text.strip() else None
+  return " ".join(" ".join(pieces).split()), page_title
 
+
+def extract_fields(html: str, url: str) -> ExtractedFields:
+  import trafilatura
+  from trafilatura.utils import load_html
+
+  # Parse once: trafilatura works on its own copy of the tree, and the fallback reads the original.
+  try:
+    tree = load_html(html)
+  except Exception:
+    tree = None
   extraction = None
   try:
-    extraction = trafilatura.bare_extraction(
-      html,
-      url=url,
-      include_formatting=False,
-      include_comments=False,
-      favor_precision=True,
-    )
+    extraction = trafilatura.bare_extraction(tree if tree is not None else html, url=url, **TRAFILATURA_OPTIONS)
   except Exception:
     extraction = None
 
   text = ""
-  title = default_title
+  title = None
+  page_title = None
   published = None
 
   if extraction:
     if isinstance(extraction, dict):
       text = (extraction.get("text") or "").strip()
-      title = extraction.get("title") or title
+      title = extraction.get("title") or None
       published = parse_datetime(extraction.get("date"))
     else:
       text = (getattr(extraction, "text", "") or "").strip()
-      title = getattr(extraction, "title", None) or title
+      title = getattr(extraction, "title", None) or None
       published = parse_datetime(getattr(extraction, "date", None))
 
   if not text:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-      tag.decompose()
-    text = " ".join(soup.get_text(separator=" ").split())
-    if not title:
-      title = soup.title.string.strip() if soup.title and soup.title.string else default_title
+    if tree is not None:
+      text, page_title = tree_text(tree)
+    else:
+      from bs4 import BeautifulSoup
+
+      soup = BeautifulSoup(html, "html.parser")
+      for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+      text = " ".join(soup.get_text(separator=" ").split())
+      page_title = soup.title.string.strip() if soup.title and soup.title.string else None
 
+  return text, title, page_title, published
+
+
+def parse_article(html: str, url: str, default_title: str = "", source: Optional[str] = None) -> Optional[Extraction]:
+  store = extraction_store()
+  fields = store.get(url, html) if store else None
+  if fields is None:
+    with timed("extraction", source):
+      fields = extract_fields(html, url)
+    # Empty results are stored too, so pages trafilatura cannot read are not re-parsed every run.
+    if store:
+      store.put(url, html, fields)
+
+  text, title, page_title, published = fields
   if not text:
     return None
-
-  return text, title or default_title or url, published
+  # Signed here, in the extraction worker, so the shingling never runs on the event loop.
+  return text, title or default_title or page_title or url, published, minhash_signature(text)
+
+
+def extraction_executor() -> ThreadPoolExecutor:
+  global _EXTRACTION_EXECUTOR
+  with _EXTRACTION_EXECUTOR_LOCK:
+    if _EXTRACTION_EXECUTOR is None:
+      _EXTRACTION_EXECUTOR = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="pulse-extract")
+    return _EXTRACTION_EXECUTOR
+
+
+def extract_articles(jobs: List[Tuple[str, str]], source: Optional[str] = None) -> List[Optional[Extraction]]:
+  """Run extract_article over (url, default_title) pairs, returning results in input order."""
+  if EXTRACT_WORKERS <= 1 or len(jobs) <= 1:
+    return [extract_article(url, title, source) for url, title in jobs]
+  return list(extraction_executor().map(lambda job: extract_article(*job, source), jobs))
+
+
+def canonicalize_url(url: str) -> str:
+  """Normalize a link so tracking parameters, fragments and host casing don't change its identity."""
+  parsed = urlparse(url.strip())
+  scheme = parsed.scheme.lower()
+  host = parsed.netloc.lower()
+  if (scheme == "http" and host.endswith(":80")) or (scheme == "https" and host.endswith(":443")):
+    host = host.rsplit(":", 1)[0]
+  pairs = parse_qsl(parsed.query, keep_blank_values=True)
+  kept = [
+    (key, value)
+    for key, value in pairs
+    if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+  ]
+  # Only re-encode when something was dropped so untouched links keep their exact query string.
+  query = parsed.query if len(kept) == len(pairs) else urlencode(kept)
+  return urlunparse((scheme, host, parsed.path, parsed.params, query, ""))
 
 
 def create_story_id(source_slug: str, url: str) -> str:
-  digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+  digest = hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()[:12]
   return f"{source_slug}:{digest}"
 
 
-def html_source_items(source: SourceConfig, cutoff: datetime) -> List[Story]:
-  page_html = fetch_url(source.url)
-  if not page_html:
-    return []
+def leading_words(text: str, count: int) -> str:
+  """The first `count` words of `text`, without splitting the whole article."""
+  return " ".join(match.group() for match in islice(re.finditer(r"\S+", text), count))
+
+
+def story_seen(source_slug: str, url: str, seen: Mapping[str, Any]) -> bool:
+  """Whether a link was featured before, under its canonical id or the raw-link id older state holds.
+
+  Before links were canonicalized the id hashed the raw link, so a link with tracking parameters,
+  an upper-case host or a default port was stored under a different id. Those entries age out
+  after STATE_RETENTION_DAYS, after which the second lookup never matches.
+  """
+  if create_story_id(source_slug, url) in seen:
+    return True
+  return f"{source_slug}:{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}" in seen
+
+
+def already_seen(source: SourceConfig, link: str, seen: Optional[Mapping[str, Any]]) -> bool:
+  if seen is None or not story_seen(source.slug, link, seen):
+    return False
+  record_stat("seen_skipped")
+  record_source_stat(source.slug, "seen_skipped")
+  return True
+
+
+def anchor_text(pieces: Iterable[str]) -> str:
+  """Join text fragments the way BeautifulSoup's get_text(" ", strip=True) does."""
+  return " ".join(piece.strip() for piece in pieces if piece.strip())
+
+
+@lru_cache(maxsize=1)
+def lxml_etree() -> Any:
+  """lxml.etree, imported on first use; None without lxml, and callers fall back to the stdlib parsers."""
+  try:
+    from lxml import etree
+  except ImportError:  # Installed with trafilatura, but optional.
+    return None
+  return etree
+
+
+def iter_anchors_lxml(page_html: str) -> Iterator[Tuple[str, str]]:
+  """Stream (href, text) for each <a href> with lxml's pull parser, which only reports </a> events."""
+  parser = lxml_etree().HTMLPullParser(events=("end",), tag="a")
+  for start in range(0, len(page_html), PARSE_CHUNK_CHARS):
+    parser.feed(page_html[start : start + PARSE_CHUNK_CHARS])
+    for _, element in parser.read_events():
+      href = element.get("href")
+      if href is not None:
+        yield href, anchor_text(element.itertext())
+  parser.close()
+  for _, element in parser.read_events():
+    href = element.get("href")
+    if href is not None:
+      yield href, anchor_text(element.itertext())
+
+
+class AnchorCollector(HTMLParser):
+  """Pure-Python fallback: records only anchor hrefs and the text inside them."""
+
+  def __init__(self) -> None:
+    super().__init__(convert_charrefs=True)
+    self.open: List[Tuple[Optional[str], List[str]]] = []
+    self.anchors: List[Tuple[str, str]] = []
+
+  def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+    if tag == "a":
+      self.open.append((dict(attrs).get("href"), []))
+
+  def handle_endtag(self, tag: str) -> None:
+    if tag == "a" and self.open:
+      href, pieces = self.open.pop()
+      if href is not None:
+        self.anchors.append((href, anchor_text(pieces)))
+
+  def handle_data(self, data: str) -> None:
+    for _, pieces in self.open:
+      pieces.append(data)
+
+  def close(self) -> None:
+    super().close()
+    # Anchors never closed before the end of the document still count, as they do for bs4.
+    while self.open:
+      self.handle_endtag("a")
+
+
+def iter_anchors_stdlib(page_html: str) -> Iterator[Tuple[str, str]]:
+  collector = AnchorCollector()
+  for start in range(0, len(page_html), PARSE_CHUNK_CHARS):
+    collector.feed(page_html[start : start + PARSE_CHUNK_CHARS])
+    yield from collector.anchors
+    collector.anchors.clear()
+  collector.close()
+  yield from collector.anchors
+
+
+def iter_anchors_bs4(page_html: str) -> Iterator[Tuple[str, str]]:
+  """The original full-tree parse, kept for comparison and as a last resort."""
+  from bs4 import BeautifulSoup
 
   soup = BeautifulSoup(page_html, "html.parser")
-  anchors = soup.find_all("a", href=True)
+  for anchor in soup.find_all("a", href=True):
+    yield anchor["href"], anchor.get_text(" ", strip=True)
+
+
+ANCHOR_PARSERS: Dict[str, Callable[[str], Iterator[Tuple[str, str]]]] = {
+  "lxml": iter_anchors_lxml,
+  "stdlib": iter_anchors_stdlib,
+  "bs4": iter_anchors_bs4,
+}
+
+
+def iter_anchors(page_html: str, parser: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+  name = parser or LISTING_PARSER
+  if name == "lxml" and lxml_etree() is None:
+    name = "stdlib"
+  return ANCHOR_PARSERS[name](page_html)
 
+
+def listing_candidates(
+  source: SourceConfig,
+  page_html: str,
+  seen: Optional[Mapping[str, Any]] = None,
+  parser: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+  """Story links on a listing page. Parsing is lazy and stops once max_items candidates are found."""
+  started = time.perf_counter()
   candidates: List[Tuple[str, str]] = []
   seen_links: set[str] = set()
 
-  for anchor in anchors:
-    text = anchor.get_text(" ", strip=True)
+  for raw_href, text in iter_anchors(page_html, parser):
     if not text or len(text) < 25:
       continue
-    href = urljoin(source.url, anchor["href"])
+    href = urljoin(source.url, raw_href)
     href = href.split("#")[0]
     if href in seen_links:
       continue
@@ -333,50 +1561,89 @@ def html_source_items(source: SourceConfig, cutoff: datetime) -> List[Story]:
     if href.lower().endswith(".pdf"):
       continue
     seen_links.add(href)
+    if already_seen(source, href, seen):
+      continue
     candidates.append((href, text))
     if len(candidates) >= source.max_items:
       break
+  record_timing("listing_parse", time.perf_counter() - started, source=source.slug)
+  record_source_stat(source.slug, "candidates", len(candidates))
+  return candidates
+
+
+def html_story(
+  source: SourceConfig,
+  link: str,
+  extraction: Optional[Extraction],
+  cutoff: datetime,
+  hint: Optional[datetime] = None,
+) -> Optional[Story]:
+  """Story for a listing or sitemap link; `hint` (a sitemap date) stands in when the page has no date."""
+  if not extraction:
+    record_source_stat(source.slug, "extraction_failed")
+    return None
+  text, resolved_title, published, signature = extraction
+  published = published or hint
+  if published is None and source.type == "sitemap":
+    # Undated sitemap entries are mostly static pages; stamping them with the run time would
+    # feature /about or a tag page as today's news.
+    record_source_stat(source.slug, "undated")
+    return None
+  if published and published < cutoff:
+    record_source_stat(source.slug, "outside_window")
+    return None
+  story_id = create_story_id(source.slug, link)
+  excerpt = leading_words(text, 60)
+  return Story(
+    id=story_id,
+    source_slug=source.slug,
+    source_name=source.name,
+    title=resolved_title.strip(),
+    url=link,
+    published=published or datetime.now(tz=UTC),
+    excerpt=excerpt,
+    body=store_body(text),
+    tags=[],
+    signature=signature,
+  )
+
+
+def html_source_items(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  page_html = fetch_url(source.url, operation="listing_fetch", source=source.slug)
+  if not page_html:
+    return []
+
+  candidates = listing_candidates(source, page_html, seen)
+  extractions = extract_articles(candidates, source.slug)
 
   stories: List[Story] = []
-  for link, fallback_title in candidates:
-    extraction = extract_article(link, fallback_title)
-    if not extraction:
-      continue
-    text, resolved_title, published = extraction
-    if published and published < cutoff:
-      continue
-    story_id = create_story_id(source.slug, link)
-    excerpt = " ".join(text.split()[:60])
-    stories.append(
-      Story(
-        id=story_id,
-        source_slug=source.slug,
-        source_name=source.name,
-        title=resolved_title.strip(),
-        url=link,
-        published=published or datetime.now(tz=UTC),
-        excerpt=excerpt,
-        content=text,
-        tags=[],
-      )
-    )
+  for (link, _), extraction in zip(candidates, extractions):
+    story = html_story(source, link, extraction, cutoff)
+    if story:
+      stories.append(story)
 
   if not DEBUG:
     print(f"Processed {len(stories)} entries from {source.name} (HTML).")
   return stories
 
 
-def rss_source_items(source: SourceConfig, cutoff: datetime) -> List[Story]:
-  feed = feedparser.parse(source.url, agent=USER_AGENT)
-
-  items: List[Story] = []
-  count = 0
+def feed_candidates(
+  source: SourceConfig,
+  feed: Any,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Tuple[Any, str, Optional[datetime]]]:
+  candidates: List[Tuple[Any, str, Optional[datetime]]] = []
   for entry in feed.entries:
-    if count >= source.max_items:
-      break
     link = entry.get("link")
     if not link:
       continue
+    if already_seen(source, link, seen):
+      continue
 
     published = (
       parse_datetime(getattr(entry, "published_parsed", None))
@@ -385,43 +1652,82 @@ def rss_source_items(source: SourceConfig, cutoff: datetime) -> List[Story]:
       or parse_datetime(entry.get("updated"))
     )
     if published and published < cutoff:
+      record_source_stat(source.slug, "outside_window")
       continue
+    candidates.append((entry, link, published))
+  record_source_stat(source.slug, "candidates", len(candidates))
+  return candidates
+
+
+def rss_story(
+  source: SourceConfig,
+  entry: Any,
+  link: str,
+  published: Optional[datetime],
+  extraction: Optional[Extraction],
+  cutoff: datetime,
+) -> Optional[Story]:
+  if not extraction:
+    record_source_stat(source.slug, "extraction_failed")
+    return None
+  text, resolved_title, resolved_published, signature = extraction
+  final_published = resolved_published or published or datetime.now(tz=UTC)
+  if final_published < cutoff:
+    record_source_stat(source.slug, "outside_window")
+    return None
 
-    extraction = extract_article(link, entry.get("title") or source.name)
-    if not extraction:
-      continue
-    text, resolved_title, resolved_published = extraction
-    final_published = resolved_published or published or datetime.now(tz=UTC)
-    if final_published < cutoff:
-      continue
+  tags: List[str] = []
+  for tag in entry.get("tags") or []:
+    if isinstance(tag, dict):
+      term = tag.get("term")
+      if term:
+        tags.append(str(term))
+    else:
+      tags.append(str(tag))
+
+  story_id = create_story_id(source.slug, link)
+  excerpt = entry.get("summary") or entry.get("description") or leading_words(text, 60)
+  excerpt = " ".join(excerpt.split())
+
+  return Story(
+    id=story_id,
+    source_slug=source.slug,
+    source_name=source.name,
+    title=resolved_title.strip(),
+    url=link,
+    published=final_published,
+    excerpt=excerpt,
+    body=store_body(text),
+    tags=tags,
+    signature=signature,
+  )
 
-    tags: List[str] = []
-    for tag in entry.get("tags") or []:
-      if isinstance(tag, dict):
-        term = tag.get("term")
-        if term:
-          tags.append(str(term))
-      else:
-        tags.append(str(tag))
 
-    story_id = create_story_id(source.slug, link)
-    excerpt = entry.get("summary") or entry.get("description") or " ".join(text.split()[:60])
-    excerpt = " ".join(excerpt.split())
+def rss_source_items(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  feed = parse_feed(fetch_page(source.url, operation="feed_fetch", source=source.slug), source.slug)
+  candidates = feed_candidates(source, feed, cutoff, seen)
 
-    items.append(
-      Story(
-        id=story_id,
-        source_slug=source.slug,
-        source_name=source.name,
-        title=resolved_title.strip(),
-        url=link,
-        published=final_published,
-        excerpt=excerpt,
-        content=text,
-        tags=tags,
-      )
+  items: List[Story] = []
+  count = 0
+  index = 0
+  # Extract in rounds sized to the remaining budget: a round can never push count past
+  # max_items, so the stories kept are exactly the ones a one-by-one walk would keep.
+  while count < source.max_items and index < len(candidates):
+    batch = candidates[index : index + source.max_items - count]
+    index += len(batch)
+    extractions = extract_articles(
+      [(link, entry.get("title") or source.name) for entry, link, _ in batch],
+      source.slug,
     )
-    count += 1
+    for (entry, link, published), extraction in zip(batch, extractions):
+      story = rss_story(source, entry, link, published, extraction, cutoff)
+      if story:
+        items.append(story)
+        count += 1
 
   items.sort(key=lambda story: story.published, reverse=True)
   if not DEBUG:
@@ -429,73 +1735,1431 @@ def rss_source_items(source: SourceConfig, cutoff: datetime) -> List[Story]:
   return items
 
 
-def collect_stories(sources: Iterable[SourceConfig], cutoff: datetime) -> Tuple[List[Story], int]:
-  collected: List[Story] = []
-  considered = 0
-  for source in sources:
-    if source.type == "html":
-      stories = html_source_items(source, cutoff)
-    else:
-      stories = rss_source_items(source, cutoff)
-    collected.extend(stories)
-    considered += len(stories)
-    debug_log(f"{source.name}: gathered {len(stories)} candidate stories.")
-  collected.sort(key=lambda story: story.published, reverse=True)
-  debug_log(f"Total candidates gathered: {len(collected)} (considered={considered}).")
-  return collected, considered
+@dataclass(slots=True)
+class SitemapEntry:
+  """One <url> or <sitemap> entry: its location plus the cheap date and title hints beside it."""
 
+  loc: str
+  lastmod: Optional[datetime] = None
+  title: Optional[str] = None
 
-def select_new_stories(stories: List[Story], seen: Dict[str, str]) -> List[Story]:
-  fresh: List[Story] = []
-  for story in stories:
-    if story.id in seen:
-      continue
-    fresh.append(story)
-    if len(fresh) >= MAX_FEATURED_STORIES:
-      break
-  return fresh
 
+SITEMAP_FIELDS = ("loc", "lastmod", "publication_date", "title")
+# zlib.error: a gzipped sitemap corrupted mid-stream (a truncated one raises EOFError).
+SITEMAP_ERRORS: Tuple[type, ...] = (ElementTree.ParseError, OSError, EOFError, zlib.error)
 
-def clamp_summary(text: str, *, max_words: int = 55, max_chars: int = 360) -> str:
-  cleaned = " ".join(text.split())
-  if not cleaned:
-    return ""
-  words = cleaned.split()
-  if len(words) > max_words:
-    cleaned = " ".join(words[:max_words]).rstrip(" ,;:") + "…"
-  if len(cleaned) > max_chars:
-    cleaned = cleaned[: max_chars - 1].rstrip(" ,;:") + "…"
-  return cleaned
 
+def sitemap_errors() -> Tuple[type, ...]:
+  etree = lxml_etree()
+  return SITEMAP_ERRORS + ((etree.XMLSyntaxError,) if etree is not None else ())
 
-@retry(wait=wait_exponential(multiplier=2, min=2, max=10), stop=stop_after_attempt(3))
-def summarize_story(client: OpenAI, story: Story) -> StorySummary:
-  prompt = textwrap.dedent(
-    f"""
-    Provide a JSON summary for the following local news item.
-    Summary must be 1-2 sentences, <= 55 words, no bullet points, no line breaks.
-    Focus on the concrete update (what happened + why it matters locally).
-    Avoid repeating the title or source name.
 
-    Source: {story.source_name}
-    Title: {story.title}
-    Published: {story.published.isoformat()}
-    URL: {story.url}
+def sitemap_date(value: Optional[str]) -> Optional[datetime]:
+  """A sitemap W3C datetime. A bare date counts as the end of that day (but never later than
+  now), so the window check cannot drop a page changed late on the cutoff's day."""
+  parsed = parse_datetime(value) if value else None
+  if parsed and re.fullmatch(r"\d{4}-\d{2}-\d{2}", value.strip()):
+    parsed = min(parsed + timedelta(days=1), datetime.now(tz=UTC))
+  return parsed
 
-    Article text:
-    {trimmed_words(story.content, 900)}
-    """
-  ).strip()
 
-  response = client.responses.create(
-    model=OPENAI_MODEL,
-    input=[
-      {"role": "system", "content": "You are a civic analyst helping residents stay informed. Always respond with a single JSON object matching the required schema."},
-      {"role": "user", "content": prompt},
-    ],
-    temperature=0.2,
+def iter_sitemap(content: bytes) -> Iterator[Tuple[str, SitemapEntry]]:
+  """Stream ("url" | "sitemap", entry) pairs from sitemap or sitemap-index XML, gzipped or not.
+
+  Parsing is incremental and each entry is cleared from the root as soon as it closes, so
+  a sitemap listing tens of thousands of pages never becomes a tree in memory. News
+  sitemaps' <news:publication_date> and <news:title> are preferred over <lastmod> when present.
+  """
+  stream: Any = io.BytesIO(content)
+  if content[:2] == b"\x1f\x8b":
+    stream = gzip.GzipFile(fileobj=stream)
+  etree = lxml_etree()
+  if etree is not None:
+    events = etree.iterparse(stream, events=("start", "end"), resolve_entities=False, no_network=True, huge_tree=True)
+  else:
+    events = ElementTree.iterparse(stream, events=("start", "end"))
+  root = None
+  fields: Dict[str, str] = {}
+  for event, element in events:
+    if event == "start":
+      if root is None:
+        root = element
+      continue
+    name = element.tag.rsplit("}", 1)[-1] if isinstance(element.tag, str) else ""
+    if name in ("url", "sitemap"):
+      if fields.get("loc"):
+        published = sitemap_date(fields.get("publication_date")) or sitemap_date(fields.get("lastmod"))
+        yield name, SitemapEntry(fields["loc"], published, fields.get("title") or None)
+      fields = {}
+      root.clear()
+    elif name in SITEMAP_FIELDS:
+      # First one wins: <image:loc> and friends come after the page's own <loc>.
+      fields.setdefault(name, (element.text or "").strip())
+
+
+def undated_last(entry: SitemapEntry) -> Tuple[bool, float]:
+  return entry.lastmod is None, -entry.lastmod.timestamp() if entry.lastmod else 0.0
+
+
+class SitemapScan:
+  """Reads one sitemap source: urlsets yield candidate links, sitemap indexes queue more files.
+
+  Entries whose date falls before the cutoff are dropped here, so old pages cost no article
+  download; child sitemaps are skipped the same way. The fetching is left to the caller,
+  which keeps one scan usable from both fetch backends.
+  """
+
+  def __init__(self, source: SourceConfig, cutoff: datetime, seen: Optional[Mapping[str, Any]] = None) -> None:
+    self.source = source
+    self.cutoff = cutoff
+    self.seen = seen
+    self.pending: List[str] = [source.url]
+    self.files = 0
+    self.links: set[str] = set()
+    self.entries: List[SitemapEntry] = []
+
+  def next_file(self) -> Optional[str]:
+    if not self.pending:
+      return None
+    if self.files >= SITEMAP_MAX_FILES:
+      debug_log(f"{self.source.name}: left {len(self.pending)} sitemaps unread (PULSE_SITEMAP_FILES={SITEMAP_MAX_FILES}).")
+      self.pending = []
+      return None
+    self.files += 1
+    return self.pending.pop(0)
+
+  def read(self, page: Optional[FetchedPage]) -> None:
+    if page is None or not page.content:
+      return
+    slug = self.source.slug
+    children: List[SitemapEntry] = []
+    stale = 0
+    with timed("sitemap_parse", slug):
+      try:
+        for kind, entry in iter_sitemap(page.content):
+          if entry.lastmod and entry.lastmod < self.cutoff:
+            stale += 1
+          elif kind == "sitemap":
+            children.append(entry)
+          else:
+            self.add(entry)
+      except sitemap_errors() as error:
+        print(f"[warn] Could not read sitemap {page.url} ({error.__class__.__name__}); keeping entries read so far.", file=sys.stderr)
+    record_source_stat(slug, "outside_window", stale)
+    # Newest child sitemaps first; undated ones (often static or archive maps) go last.
+    children.sort(key=undated_last)
+    self.pending.extend(urljoin(page.url, entry.loc) for entry in children)
+
+  def add(self, entry: SitemapEntry) -> None:
+    link = urljoin(self.source.url, entry.loc).split("#")[0]
+    if link in self.links or not link.lower().startswith("http") or link.lower().endswith(".pdf"):
+      return
+    if domains_related(self.source.url, link) is False:
+      return
+    self.links.add(link)
+    if not already_seen(self.source, link, self.seen):
+      entry.loc = link
+      self.entries.append(entry)
+
+  def candidates(self) -> List[Candidate]:
+    # Newest first; undated entries (static pages, mostly) trail so they never crowd out articles.
+    candidates = [
+      Candidate(self.source, entry.loc, entry.title or self.source.name, entry.lastmod)
+      for entry in sorted(self.entries, key=undated_last)
+    ]
+    record_source_stat(self.source.slug, "candidates", len(candidates))
+    return candidates
+
+
+def sitemap_candidates(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Candidate]:
+  scan = SitemapScan(source, cutoff, seen)
+  while (url := scan.next_file()) is not None:
+    scan.read(fetch_page(url, operation="sitemap_fetch", source=source.slug))
+  return scan.candidates()
+
+
+def sitemap_source_items(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  candidates = sitemap_candidates(source, cutoff, seen)
+
+  items: List[Story] = []
+  index = 0
+  # Same rounds as rss_source_items: never extract more than the budget still open.
+  while len(items) < source.max_items and index < len(candidates):
+    batch = candidates[index : index + source.max_items - len(items)]
+    index += len(batch)
+    extractions = extract_articles([(candidate.link, candidate.title) for candidate in batch], source.slug)
+    for candidate, extraction in zip(batch, extractions):
+      story = candidate_story(candidate, extraction, cutoff)
+      if story:
+        items.append(story)
+
+  items.sort(key=lambda story: story.published, reverse=True)
+  if not DEBUG:
+    print(f"Processed {len(items)} entries from {source.name} (SITEMAP).")
+  return items
+
+
+def source_items(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  with timed("source", source.slug):
+    if source.type == "html":
+      return html_source_items(source, cutoff, seen)
+    if source.type == "sitemap":
+      return sitemap_source_items(source, cutoff, seen)
+    return rss_source_items(source, cutoff, seen)
+
+
+class AsyncFetcher:
+  """One httpx client for a whole event-loop run, with global and per-host connection caps."""
+
+  def __init__(self, max_connections: int = MAX_CONNECTIONS) -> None:
+    import httpx
+
+    self.max_connections = max(1, max_connections)
+    self.client = httpx.AsyncClient(
+      headers=dict(REQUEST_HEADERS),
+      follow_redirects=True,
+      timeout=REQUEST_TIMEOUT,
+      limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+    )
+    self.connections = asyncio.Semaphore(self.max_connections)
+    self.host_slots: Dict[str, asyncio.Semaphore] = {}
+
+  def host_slot(self, url: str) -> asyncio.Semaphore:
+    host = urlparse(url).netloc.lower()
+    slot = self.host_slots.get(host)
+    if slot is None:
+      slot = asyncio.Semaphore(max(1, PER_HOST_LIMIT))
+      self.host_slots[host] = slot
+    return slot
+
+  async def get(self, url: str, *, operation: str = "fetch", source: Optional[str] = None) -> Optional[FetchedPage]:
+    started = time.perf_counter()
+    archive = RESPONSE_ARCHIVE
+    if archive and archive.replaying:
+      page = archive.get(url)
+    else:
+      page = await self.download(url, source)
+      if archive and page:
+        archive.add(page)
+    record_timing(
+      operation,
+      time.perf_counter() - started,
+      source=source,
+      nbytes=len(page.content) if page else 0,
+      ok=page is not None,
+    )
+    return page
+
+  async def download(self, url: str, source: Optional[str] = None) -> Optional[FetchedPage]:
+    import httpx
+
+    cache = HTTP_CACHE
+    headers = cache.conditional_headers(url) if cache else {}
+    try:
+      async with self.host_slot(url), self.connections:
+        timeout = fetch_budget(url, source)
+        if timeout is None:
+          return None
+        # wait_for bounds the whole exchange (connect, redirects, body), not just each socket read.
+        response = await asyncio.wait_for(self.client.get(url, headers=headers), timeout=timeout)
+        if response.status_code == 304 and cache:
+          cached = cache.reuse(url)
+          if cached:
+            return cached
+          response = await asyncio.wait_for(self.client.get(url), timeout=timeout)
+      response.raise_for_status()
+    except (httpx.HTTPError, asyncio.TimeoutError) as error:
+      debug_log(f"Async fetch failed for {url}: {error!r}")
+      return None
+    page = FetchedPage(
+      url=url,
+      content=response.content,
+      encoding=response.encoding,
+      content_type=response.headers.get("Content-Type", ""),
+    )
+    if cache:
+      cache.store(page, response.headers)
+    return page
+
+  async def aclose(self) -> None:
+    await self.client.aclose()
+
+
+class AsyncSession:
+  """An event loop and AsyncFetcher kept open across collections, so --watch polls reuse warm connections.
+
+  The client and its semaphores belong to the loop they were first used on, so the loop
+  (an asyncio.Runner) lives exactly as long as the fetcher.
+  """
+
+  def __init__(self) -> None:
+    self.runner = asyncio.Runner()
+    self.fetcher: Optional[AsyncFetcher] = None
+
+  def run(self, make: Callable[[AsyncFetcher], Awaitable[Any]]) -> Any:
+    async def call() -> Any:
+      if self.fetcher is None:
+        self.fetcher = AsyncFetcher(MAX_CONNECTIONS)
+      return await make(self.fetcher)
+
+    return self.runner.run(call())
+
+  def close(self) -> None:
+    if self.fetcher is not None:
+      self.runner.run(self.fetcher.aclose())
+      self.fetcher = None
+    self.runner.close()
+
+
+ASYNC_SESSION: Optional[AsyncSession] = None
+
+
+def run_async(make: Callable[[AsyncFetcher], Awaitable[Any]]) -> Any:
+  """Run `make(fetcher)` on the open ASYNC_SESSION, or on a fresh loop and client that close afterwards."""
+  if ASYNC_SESSION is not None:
+    return ASYNC_SESSION.run(make)
+
+  async def once() -> Any:
+    fetcher = AsyncFetcher(MAX_CONNECTIONS)
+    try:
+      return await make(fetcher)
+    finally:
+      await fetcher.aclose()
+
+  return asyncio.run(once())
+
+
+async def run_blocking(func: Any, *args: Any) -> Any:
+  """Hand CPU-bound parsing to the extraction pool so the event loop keeps serving sockets."""
+  return await asyncio.get_running_loop().run_in_executor(extraction_executor(), func, *args)
+
+
+async def async_extract_article(
+  fetcher: AsyncFetcher,
+  url: str,
+  default_title: str,
+  source: Optional[str] = None,
+) -> Optional[Extraction]:
+  page = await fetcher.get(url, operation="article_fetch", source=source)
+  if page is None or not page.content:
+    return None
+  return await run_blocking(parse_article, page.text, url, default_title, source)
+
+
+async def async_extract_articles(
+  fetcher: AsyncFetcher,
+  jobs: List[Tuple[str, str]],
+  source: Optional[str] = None,
+) -> List[Optional[Extraction]]:
+  return list(await asyncio.gather(*(async_extract_article(fetcher, url, title, source) for url, title in jobs)))
+
+
+async def async_html_source_items(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  page = await fetcher.get(source.url, operation="listing_fetch", source=source.slug)
+  if page is None or not page.content:
+    return []
+
+  candidates = await run_blocking(listing_candidates, source, page.text, seen)
+  extractions = await async_extract_articles(fetcher, candidates, source.slug)
+
+  stories: List[Story] = []
+  for (link, _), extraction in zip(candidates, extractions):
+    story = html_story(source, link, extraction, cutoff)
+    if story:
+      stories.append(story)
+
+  if not DEBUG:
+    print(f"Processed {len(stories)} entries from {source.name} (HTML).")
+  return stories
+
+
+async def async_rss_source_items(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  page = await fetcher.get(source.url, operation="feed_fetch", source=source.slug)
+  feed = await run_blocking(parse_feed, page, source.slug)
+  candidates = feed_candidates(source, feed, cutoff, seen)
+
+  items: List[Story] = []
+  count = 0
+  index = 0
+  while count < source.max_items and index < len(candidates):
+    batch = candidates[index : index + source.max_items - count]
+    index += len(batch)
+    extractions = await async_extract_articles(
+      fetcher,
+      [(link, entry.get("title") or source.name) for entry, link, _ in batch],
+      source.slug,
+    )
+    for (entry, link, published), extraction in zip(batch, extractions):
+      story = rss_story(source, entry, link, published, extraction, cutoff)
+      if story:
+        items.append(story)
+        count += 1
+
+  items.sort(key=lambda story: story.published, reverse=True)
+  if not DEBUG:
+    print(f"Processed {count} entries from {source.name} (RSS).")
+  return items
+
+
+async def async_sitemap_candidates(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Candidate]:
+  scan = SitemapScan(source, cutoff, seen)
+  while (url := scan.next_file()) is not None:
+    page = await fetcher.get(url, operation="sitemap_fetch", source=source.slug)
+    await run_blocking(scan.read, page)
+  return scan.candidates()
+
+
+async def async_sitemap_source_items(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  candidates = await async_sitemap_candidates(fetcher, source, cutoff, seen)
+
+  items: List[Story] = []
+  index = 0
+  while len(items) < source.max_items and index < len(candidates):
+    batch = candidates[index : index + source.max_items - len(items)]
+    index += len(batch)
+    extractions = await async_extract_articles(fetcher, [(candidate.link, candidate.title) for candidate in batch], source.slug)
+    for candidate, extraction in zip(batch, extractions):
+      story = candidate_story(candidate, extraction, cutoff)
+      if story:
+        items.append(story)
+
+  items.sort(key=lambda story: story.published, reverse=True)
+  if not DEBUG:
+    print(f"Processed {len(items)} entries from {source.name} (SITEMAP).")
+  return items
+
+
+async def async_source_items(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Story]:
+  with timed("source", source.slug):
+    if source.type == "html":
+      return await async_html_source_items(fetcher, source, cutoff, seen)
+    if source.type == "sitemap":
+      return await async_sitemap_source_items(fetcher, source, cutoff, seen)
+    return await async_rss_source_items(fetcher, source, cutoff, seen)
+
+
+async def async_collect_sources(
+  fetcher: AsyncFetcher,
+  source_list: List[SourceConfig],
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+  on_source: Optional[Callable[[SourceConfig, List[Story]], None]] = None,
+) -> List[List[Story]]:
+  debug_log(f"Collecting {len(source_list)} sources on the async backend (max_connections={fetcher.max_connections}).")
+
+  async def collect(source: SourceConfig) -> List[Story]:
+    if DEADLINE and not DEADLINE.start_source(source.slug):
+      print(f"[warn] Run budget spent; skipped {source.name}.", file=sys.stderr)
+      return []
+    stories = await async_source_items(fetcher, source, cutoff, seen)
+    if on_source and not (DEADLINE and DEADLINE.cut_short(source.slug)):
+      on_source(source, stories)
+    return stories
+
+  return list(await asyncio.gather(*(collect(source) for source in source_list)))
+
+
+def merge_source_stories(
+  source_list: List[SourceConfig],
+  per_source: List[List[Story]],
+) -> Tuple[List[Story], int]:
+  collected: List[Story] = []
+  considered = 0
+  for source, stories in zip(source_list, per_source):
+    collected.extend(stories)
+    considered += len(stories)
+    record_source_stat(source.slug, "stories", len(stories))
+    debug_log(f"{source.name}: gathered {len(stories)} candidate stories.")
+  collected.sort(key=lambda story: story.published, reverse=True)
+  debug_log(f"Total candidates gathered: {len(collected)} (considered={considered}).")
+  return collected, considered
+
+
+def collect_stories(
+  sources: Iterable[SourceConfig],
+  cutoff: datetime,
+  *,
+  workers: int = COLLECT_WORKERS,
+  backend: str = "threads",
+  seen: Optional[Mapping[str, Any]] = None,
+  collected: Optional[Mapping[str, List[Story]]] = None,
+  on_source: Optional[Callable[[SourceConfig, List[Story]], None]] = None,
+) -> Tuple[List[Story], int]:
+  """Gather candidate stories from every source, newest first.
+
+  Links whose story id is already in `seen` are dropped before any article download, so
+  each source's max_items budget is spent on stories we have not featured yet. Sources
+  whose slug is in `collected` (a resumed run) are not fetched again, and `on_source` is
+  called as each remaining source finishes. Under a run DEADLINE, sources that run out
+  of time come back partial or empty and are not passed to `on_source`, so a resumed
+  run fetches them again.
+  """
+  source_list = list(sources)
+  collected = collected or {}
+  pending = [source for source in source_list if source.slug not in collected]
+  if DEADLINE:
+    concurrency = len(pending) if backend == "async" else min(workers, len(pending))
+    DEADLINE.plan_sources(len(pending), concurrency)
+
+  def collect(source: SourceConfig) -> List[Story]:
+    if DEADLINE and not DEADLINE.start_source(source.slug):
+      print(f"[warn] Run budget spent; skipped {source.name}.", file=sys.stderr)
+      return []
+    stories = source_items(source, cutoff, seen)
+    if on_source and not (DEADLINE and DEADLINE.cut_short(source.slug)):
+      on_source(source, stories)
+    return stories
+
+  if not pending:
+    fetched: List[List[Story]] = []
+  elif backend == "async":
+    fetched = run_async(lambda fetcher: async_collect_sources(fetcher, pending, cutoff, seen, on_source))
+  elif workers <= 1 or len(pending) <= 1:
+    fetched = [collect(source) for source in pending]
+  else:
+    # executor.map yields results in submission order, so the merge below sees the
+    # same sequence as the serial path and the stable sort keeps ties identical.
+    pool_size = min(workers, len(pending))
+    debug_log(f"Collecting {len(pending)} sources with {pool_size} workers.")
+    with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="pulse-source") as executor:
+      fetched = list(executor.map(collect, pending))
+  by_slug = {**collected, **{source.slug: stories for source, stories in zip(pending, fetched)}}
+  return merge_source_stories(source_list, [by_slug[source.slug] for source in source_list])
+
+
+@dataclass
+class Candidate:
+  """A story link found on a feed or listing page, not yet extracted."""
+
+  source: SourceConfig
+  link: str
+  title: str
+  # Feed date or sitemap date, when there was one; listing links have none until extracted.
+  published: Optional[datetime] = None
+  # The feed entry behind an RSS candidate (None for listing and sitemap links).
+  entry: Any = None
+
+
+def html_candidates(source: SourceConfig, page_html: Optional[str], seen: Optional[Mapping[str, Any]]) -> List[Candidate]:
+  if not page_html:
+    return []
+  return [Candidate(source, link, text) for link, text in listing_candidates(source, page_html, seen)]
+
+
+def rss_candidates(source: SourceConfig, feed: Any, cutoff: datetime, seen: Optional[Mapping[str, Any]]) -> List[Candidate]:
+  candidates = [
+    Candidate(source, link, entry.get("title") or source.name, published, entry)
+    for entry, link, published in feed_candidates(source, feed, cutoff, seen)
+  ]
+  # Newest first by feed date; undated entries lead, since they may turn out to be the newest.
+  candidates.sort(key=lambda candidate: -candidate.published.timestamp() if candidate.published else float("-inf"))
+  return candidates
+
+
+def source_candidates(
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Candidate]:
+  with timed("source", source.slug):
+    if source.type == "html":
+      candidates = html_candidates(source, fetch_url(source.url, operation="listing_fetch", source=source.slug), seen)
+    elif source.type == "sitemap":
+      candidates = sitemap_candidates(source, cutoff, seen)
+    else:
+      feed = parse_feed(fetch_page(source.url, operation="feed_fetch", source=source.slug), source.slug)
+      candidates = rss_candidates(source, feed, cutoff, seen)
+  if not DEBUG:
+    print(f"Found {len(candidates)} candidates on {source.name} ({source.type.upper()}).")
+  return candidates
+
+
+async def async_source_candidates(
+  fetcher: AsyncFetcher,
+  source: SourceConfig,
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> List[Candidate]:
+  with timed("source", source.slug):
+    if source.type == "html":
+      page = await fetcher.get(source.url, operation="listing_fetch", source=source.slug)
+      page_html = page.text if page and page.content else None
+      candidates = await run_blocking(html_candidates, source, page_html, seen)
+    elif source.type == "sitemap":
+      candidates = await async_sitemap_candidates(fetcher, source, cutoff, seen)
+    else:
+      page = await fetcher.get(source.url, operation="feed_fetch", source=source.slug)
+      feed = await run_blocking(parse_feed, page, source.slug)
+      candidates = rss_candidates(source, feed, cutoff, seen)
+  if not DEBUG:
+    print(f"Found {len(candidates)} candidates on {source.name} ({source.type.upper()}).")
+  return candidates
+
+
+def candidate_story(candidate: Candidate, extraction: Optional[Extraction], cutoff: datetime) -> Optional[Story]:
+  if candidate.entry is None:
+    return html_story(candidate.source, candidate.link, extraction, cutoff, candidate.published)
+  return rss_story(candidate.source, candidate.entry, candidate.link, candidate.published, extraction, cutoff)
+
+
+@dataclass
+class SourceStream:
+  """One source's side of a StoryMerge: its candidates in order and how far it has been read."""
+
+  index: int
+  source: SourceConfig
+  candidates: List[Candidate]
+  position: int = 0
+  pending: int = 0
+  queued: bool = False
+  stories: List[Story] = field(default_factory=list)
+  # Page date of each extracted listing link that had one, by position.
+  dated: Dict[int, float] = field(default_factory=dict)
+
+  def bound(self, position: int) -> float:
+    """Newest the candidate at `position` can be, as far as is known before extracting it.
+
+    A feed entry or sitemap link is bounded by its feed or sitemap date (undated ones by
+    nothing). A listing link is bounded by the page date of the nearest extracted link
+    above it, since listings run newest first.
+    """
+    candidate = self.candidates[position]
+    if candidate.published:
+      return candidate.published.timestamp()
+    earlier = [index for index in self.dated if index < position] if self.source.type == "html" else []
+    return self.dated[max(earlier)] if earlier else float("inf")
+
+  def wants_more(self) -> bool:
+    return self.position < len(self.candidates) and len(self.stories) + self.pending < self.source.max_items
+
+
+# A story sorts ahead of a candidate whose bound only ties its date: the candidate cannot be newer.
+_MERGE_STORY = 0
+_MERGE_CANDIDATE = 1
+
+
+class StoryMerge:
+  """Lazy k-way merge of per-source candidate streams into newest-first stories.
+
+  The heap holds every extracted story not yet emitted plus each source's next candidate,
+  keyed by the newest date it can have (SourceStream.bound for candidates). A story on top is newer than anything still unread, so it is
+  emitted; a candidate on top is extracted along with the next ones in heap order, at most
+  as many as fresh stories are still missing. Emitted stories are clustered as they come,
+  and the merge stops once `limit` distinct fresh stories are in hand, so candidates
+  further down are never fetched.
+  """
+
+  def __init__(
+    self,
+    cutoff: datetime,
+    limit: int,
+    recent: Optional[Mapping[str, str]] = None,
+  ) -> None:
+    self.cutoff = cutoff
+    self.limit = limit
+    self.clusters = StoryClusters(recent)
+    self.heap: List[Tuple[float, int, int, int, int, Any]] = []
+    self.sequence = 0
+    self.streams: List[SourceStream] = []
+    self.in_flight: List[Tuple[SourceStream, int]] = []
+    self.collected: List[Story] = []
+    self.distinct = 0
+    self.waiting = 0
+    # What the eager path would have read: each source's stories up to its max_items.
+    self.considered = 0
+
+  def push(self, bound: float, kind: int, first: int, second: int, payload: Any) -> None:
+    self.sequence += 1
+    heapq.heappush(self.heap, (-bound, kind, first, second, self.sequence, payload))
+
+  def push_story(self, stream: SourceStream, position: int, story: Story) -> None:
+    # Ties between stories break by source order, then position, as the eager sort does.
+    self.push(story.published.timestamp(), _MERGE_STORY, stream.index, position, story)
+    self.waiting += 1
+
+  def queue(self, stream: SourceStream) -> None:
+    if stream.queued or not stream.wants_more():
+      return
+    # Ties between candidates (typically undated listing links) go round-robin across sources.
+    self.push(stream.bound(stream.position), _MERGE_CANDIDATE, stream.position, stream.index, stream)
+    stream.queued = True
+
+  def add_source(self, index: int, source: SourceConfig, candidates: List[Candidate]) -> None:
+    stream = SourceStream(index, source, candidates)
+    self.streams.append(stream)
+    self.considered += min(len(candidates), source.max_items)
+    self.queue(stream)
+
+  def add_stories(self, index: int, source: SourceConfig, stories: List[Story]) -> None:
+    """Feed in a source already collected (a resumed run); its stories go straight onto the heap."""
+    stream = SourceStream(index, source, [])
+    self.considered += len(stories)
+    for position, story in enumerate(stories):
+      self.push_story(stream, position, story)
+
+  def emit(self, story: Story) -> None:
+    self.collected.append(story)
+    if self.clusters.add(story):
+      self.distinct += 1
+
+  def next_batch(self) -> List[Candidate]:
+    """Emit whatever is ready, then return the candidates to extract next ([] when done)."""
+    batch: List[Candidate] = []
+    while self.heap and self.distinct < self.limit:
+      key, kind, _, _, _, payload = self.heap[0]
+      if kind == _MERGE_STORY:
+        if batch:
+          break
+        heapq.heappop(self.heap)
+        self.waiting -= 1
+        self.emit(payload)
+        continue
+      if len(batch) >= max(1, self.limit - self.distinct - self.waiting):
+        break
+      heapq.heappop(self.heap)
+      stream = payload
+      stream.queued = False
+      if stream.bound(stream.position) < -key:
+        # Extractions since it was queued narrowed this candidate's bound; re-queue it.
+        self.queue(stream)
+        continue
+      batch.append(stream.candidates[stream.position])
+      self.in_flight.append((stream, stream.position))
+      stream.position += 1
+      stream.pending += 1
+      self.queue(stream)
+    return batch
+
+  def settle(self, extractions: List[Optional[Extraction]]) -> None:
+    """Take the results for the last batch, in batch order."""
+    for (stream, position), extraction in zip(self.in_flight, extractions):
+      stream.pending -= 1
+      story = candidate_story(stream.candidates[position], extraction, self.cutoff)
+      if story:
+        stream.stories.append(story)
+        if extraction and extraction[2]:
+          # Undated pages are stamped with the run time, which says nothing about the links below.
+          stream.dated[position] = story.published.timestamp()
+        self.push_story(stream, position, story)
+    for stream, _ in self.in_flight:
+      self.queue(stream)
+    self.in_flight = []
+
+  def finish(self) -> Tuple[List[Story], List[Story], Dict[str, str]]:
+    """(collected newest first, clustered stories, signatures) once the merge has stopped.
+
+    Stories already extracted but not reached are still clustered, so they can show up as
+    alternates of a featured story; candidates never extracted are counted and dropped.
+    """
+    while self.heap:
+      _, kind, _, _, _, payload = heapq.heappop(self.heap)
+      if kind == _MERGE_STORY:
+        self.emit(payload)
+    for stream in self.streams:
+      record_source_stat(stream.source.slug, "stories", len(stream.stories))
+      skipped = len(stream.candidates) - stream.position
+      if skipped:
+        record_source_stat(stream.source.slug, "not_extracted", skipped)
+        record_stat("merge_skipped", skipped)
+    collected = sorted(self.collected, key=lambda story: story.published, reverse=True)
+    self.clusters.newest_first()
+    clustered = self.clusters.clustered()
+    return collected, clustered, self.clusters.signatures
+
+
+def extract_candidates(batch: List[Candidate]) -> List[Optional[Extraction]]:
+  if EXTRACT_WORKERS <= 1 or len(batch) <= 1:
+    return [extract_article(candidate.link, candidate.title, candidate.source.slug) for candidate in batch]
+  return list(
+    extraction_executor().map(
+      lambda candidate: extract_article(candidate.link, candidate.title, candidate.source.slug),
+      batch,
+    )
   )
 
+
+async def async_merge_sources(
+  fetcher: AsyncFetcher,
+  merge: StoryMerge,
+  pending: List[Tuple[int, SourceConfig]],
+  cutoff: datetime,
+  seen: Optional[Mapping[str, Any]] = None,
+) -> None:
+  debug_log(f"Merging {len(pending)} sources on the async backend (max_connections={fetcher.max_connections}).")
+
+  async def discover(source: SourceConfig) -> List[Candidate]:
+    if DEADLINE and not DEADLINE.start_source(source.slug):
+      print(f"[warn] Run budget spent; skipped {source.name}.", file=sys.stderr)
+      return []
+    return await async_source_candidates(fetcher, source, cutoff, seen)
+
+  found = await asyncio.gather(*(discover(source) for _, source in pending))
+  for (index, source), candidates in zip(pending, found):
+    merge.add_source(index, source, candidates)
+  if DEADLINE:
+    DEADLINE.open_merge()
+  while batch := merge.next_batch():
+    extractions = await asyncio.gather(
+      *(async_extract_article(fetcher, candidate.link, candidate.title, candidate.source.slug) for candidate in batch)
+    )
+    merge.settle(list(extractions))
+
+
+def stream_stories(
+  sources: Iterable[SourceConfig],
+  cutoff: datetime,
+  *,
+  limit: int = MAX_FEATURED_STORIES,
+  workers: int = COLLECT_WORKERS,
+  backend: str = "threads",
+  seen: Optional[Mapping[str, Any]] = None,
+  recent: Optional[Mapping[str, str]] = None,
+  collected: Optional[Mapping[str, List[Story]]] = None,
+  on_source: Optional[Callable[[SourceConfig, List[Story]], None]] = None,
+) -> Tuple[List[Story], List[Story], Dict[str, str], int]:
+  """Lazy counterpart of collect_stories plus cluster_near_duplicates for a daily run.
+
+  Every feed and listing page is read up front (in parallel, as collect_stories does),
+  but articles are only extracted as a StoryMerge asks for them, which stops once `limit`
+  distinct fresh stories are secured. Returns (collected, clustered, signatures, considered),
+  where "considered" counts each source's in-window candidates up to its max_items, as the
+  eager path would have read them, not just the ones the merge got round to extracting.
+  `collected` and `on_source` behave as in collect_stories; `on_source` is called for
+  every fetched source once the merge is done, with the stories it actually yielded.
+  """
+  source_list = list(sources)
+  collected = collected or {}
+  merge = StoryMerge(cutoff, limit, recent)
+  pending: List[Tuple[int, SourceConfig]] = []
+  for index, source in enumerate(source_list):
+    if source.slug in collected:
+      merge.add_stories(index, source, list(collected[source.slug]))
+    else:
+      pending.append((index, source))
+  if DEADLINE:
+    concurrency = len(pending) if backend == "async" else min(workers, len(pending))
+    DEADLINE.plan_sources(len(pending), concurrency)
+
+  def discover(source: SourceConfig) -> List[Candidate]:
+    if DEADLINE and not DEADLINE.start_source(source.slug):
+      print(f"[warn] Run budget spent; skipped {source.name}.", file=sys.stderr)
+      return []
+    return source_candidates(source, cutoff, seen)
+
+  if backend == "async" and pending:
+    run_async(lambda fetcher: async_merge_sources(fetcher, merge, pending, cutoff, seen))
+  else:
+    if workers <= 1 or len(pending) <= 1:
+      found = [discover(source) for _, source in pending]
+    else:
+      with ThreadPoolExecutor(max_workers=min(workers, len(pending)), thread_name_prefix="pulse-source") as executor:
+        found = list(executor.map(discover, [source for _, source in pending]))
+    for (index, source), candidates in zip(pending, found):
+      merge.add_source(index, source, candidates)
+    if DEADLINE:
+      DEADLINE.open_merge()
+    while batch := merge.next_batch():
+      merge.settle(extract_candidates(batch))
+
+  collected_stories, clustered, signatures = merge.finish()
+  if on_source:
+    for stream in merge.streams:
+      if not (DEADLINE and DEADLINE.cut_short(stream.source.slug)):
+        on_source(stream.source, stream.stories)
+  debug_log(
+    f"Merged {len(collected_stories)} stories into {len(clustered)} clusters; "
+    f"{STATS['merge_skipped']} candidates left unextracted.",
+  )
+  return collected_stories, clustered, signatures, merge.considered
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+# Fixed seeds: signatures are persisted, so the permutations must be identical on every run.
+_MINHASH_SEEDS = [
+  (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+  for rng in [random.Random(1729)]
+  for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def minhash_signature(text: str) -> Optional[str]:
+  """64 x 32-bit MinHash over word 3-shingles as a hex string, or None for text too short to shingle."""
+  words = re.findall(r"[a-z0-9]+", text.lower())
+  if len(words) < SHINGLE_WORDS:
+    return None
+  shingles = {
+    zlib.crc32(" ".join(words[index : index + SHINGLE_WORDS]).encode("utf-8"))
+    for index in range(len(words) - SHINGLE_WORDS + 1)
+  }
+  return "".join(
+    f"{min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles) & 0xFFFFFFFF:08x}" for a, b in _MINHASH_SEEDS
+  )
+
+
+def signature_similarity(left: str, right: str) -> float:
+  """Estimated Jaccard similarity: the share of MinHash slots the two signatures agree on."""
+  slots = len(left) // 8
+  return sum(left[index * 8 : index * 8 + 8] == right[index * 8 : index * 8 + 8] for index in range(slots)) / max(1, slots)
+
+
+class NearDuplicateIndex:
+  """MinHash LSH: signatures sharing any whole band are candidates, then verified against the threshold."""
+
+  def __init__(self, threshold: float = DUPLICATE_THRESHOLD) -> None:
+    self.threshold = threshold
+    self.band_width = len(_MINHASH_SEEDS) // MINHASH_BANDS * 8
+    self.buckets: Dict[Tuple[int, str], List[str]] = {}
+    self.signatures: Dict[str, str] = {}
+
+  def bands(self, signature: str) -> Iterator[Tuple[int, str]]:
+    for band in range(MINHASH_BANDS):
+      yield band, signature[band * self.band_width : (band + 1) * self.band_width]
+
+  def add(self, key: str, signature: str) -> None:
+    self.signatures[key] = signature
+    for bucket in self.bands(signature):
+      self.buckets.setdefault(bucket, []).append(key)
+
+  def match(self, signature: str) -> Optional[str]:
+    candidates = {key for bucket in self.bands(signature) for key in self.buckets.get(bucket, [])}
+    best, best_score = None, self.threshold
+    for key in sorted(candidates):
+      score = signature_similarity(signature, self.signatures[key])
+      if score >= best_score:
+        best, best_score = key, score
+    return best
+
+
+def alternate_link(story: Story) -> Dict[str, Any]:
+  return {
+    "id": story.id,
+    "source": {"id": story.source_slug, "name": story.source_name},
+    "title": story.title,
+    "link": story.url,
+  }
+
+
+class StoryClusters:
+  """Near-duplicate clusters built one story at a time (see cluster_near_duplicates)."""
+
+  def __init__(self, recent: Optional[Mapping[str, str]] = None) -> None:
+    self.index = NearDuplicateIndex()
+    self.recent_ids = set()
+    for story_id, signature in (recent or {}).items():
+      self.index.add(story_id, signature)
+      self.recent_ids.add(story_id)
+    self.signatures: Dict[str, str] = {}
+    self.clusters: Dict[str, List[Story]] = {}
+
+  def add(self, story: Story) -> bool:
+    """File `story` under its cluster; True if it opened a new one."""
+    signature = story.signature or minhash_signature(story.content)
+    if signature is None:
+      self.clusters[story.id] = [story]
+      return True
+    self.signatures[story.id] = signature
+    match = self.index.match(signature)
+    if match in self.recent_ids:
+      record_stat("duplicates_of_recent")
+      record_outcome(story, "duplicate_of_recent")
+      debug_log(f"'{story.title}' repeats recently featured story {match}; skipping.")
+      return False
+    if match is not None:
+      record_stat("duplicates_folded")
+      self.clusters[match].append(story)
+      return False
+    self.index.add(story.id, signature)
+    self.clusters[story.id] = [story]
+    return True
+
+  def newest_first(self) -> None:
+    """Order clusters by their newest copy, which is where cluster_near_duplicates places them."""
+    self.clusters = dict(
+      sorted(self.clusters.items(), key=lambda item: max(story.published for story in item[1]), reverse=True)
+    )
+
+  def clustered(self) -> List[Story]:
+    clustered: List[Story] = []
+    for members in self.clusters.values():
+      representative = max(members, key=lambda story: story.content_length)
+      alternates = []
+      for story in members:
+        if story is not representative:
+          record_outcome(story, "duplicate")
+          alternates.append(alternate_link(story))
+      if alternates:
+        debug_log(f"'{representative.title}' also covered by {', '.join(alt['source']['name'] for alt in alternates)}.")
+      clustered.append(replace(representative, alternates=alternates))
+    return clustered
+
+
+def cluster_near_duplicates(
+  stories: List[Story],
+  recent: Optional[Mapping[str, str]] = None,
+) -> Tuple[List[Story], Dict[str, str]]:
+  """Fold copies of the same story from different sources into one representative.
+
+  Each cluster is represented by its longest text, placed where its newest copy was, with
+  the other copies listed in `alternates`. Stories matching one featured on a recent day
+  (`recent` maps story id to signature) are dropped. Returns the clustered list plus the
+  signature of every story that had one, so the caller can persist them.
+  """
+  clusters = StoryClusters(recent)
+  for story in stories:
+    clusters.add(story)
+  return clusters.clustered(), clusters.signatures
+
+
+def select_new_stories(stories: List[Story], seen: Mapping[str, str]) -> List[Story]:
+  fresh: List[Story] = []
+  for story in stories:
+    if story_seen(story.source_slug, story.url, seen):
+      continue
+    fresh.append(story)
+    if len(fresh) >= MAX_FEATURED_STORIES:
+      break
+  return fresh
+
+
+def summary_cache_key(story: Story) -> str:
+  """Content address for a summary: article text as sent, model, and prompt/schema version."""
+  digest = hashlib.sha256()
+  for part in (
+    OPENAI_MODEL,
+    SUMMARY_PROMPT_VERSION,
+    json.dumps(SUMMARY_SCHEMA, sort_keys=True),
+    prompt_article_text(story),
+  ):
+    digest.update(part.encode("utf-8"))
+    digest.update(b"\0")
+  return digest.hexdigest()
+
+
+class SummaryCache:
+  """Persistent map of summary_cache_key -> StorySummary with age and LRU eviction."""
+
+  def __init__(
+    self,
+    path: Path,
+    max_entries: int = SUMMARY_CACHE_MAX_ENTRIES,
+    max_age_days: int = SUMMARY_CACHE_MAX_AGE_DAYS,
+  ) -> None:
+    self.path = path
+    self.max_entries = max_entries
+    self.max_age_days = max_age_days
+    self.lock = threading.Lock()
+    self.entries: Dict[str, Dict[str, Any]] = {}
+    if path.exists():
+      try:
+        with path.open("r", encoding="utf-8") as handle:
+          self.entries = json.load(handle).get("entries", {})
+      except (json.JSONDecodeError, AttributeError):
+        self.entries = {}
+
+  def get(self, story: Story) -> Optional[StorySummary]:
+    key = summary_cache_key(story)
+    summary: Optional[StorySummary] = None
+    with self.lock:
+      entry = self.entries.get(key)
+      if entry:
+        try:
+          summary = StorySummary(**entry["summary"])
+          entry["used_at"] = datetime.now(tz=UTC).isoformat()
+        except (KeyError, TypeError):
+          self.entries.pop(key, None)
+    record_stat("summary_cache_hits" if summary else "summary_cache_misses")
+    return summary
+
+  def put(self, story: Story, summary: StorySummary) -> None:
+    now_iso = datetime.now(tz=UTC).isoformat()
+    with self.lock:
+      self.entries[summary_cache_key(story)] = {
+        "summary": asdict(summary),
+        "stored_at": now_iso,
+        "used_at": now_iso,
+      }
+
+  def save(self) -> None:
+    horizon = (datetime.now(tz=UTC) - timedelta(days=self.max_age_days)).isoformat()
+    with self.lock:
+      fresh = {key: entry for key, entry in self.entries.items() if entry.get("used_at", "") >= horizon}
+      if len(fresh) > self.max_entries:
+        newest = sorted(fresh.items(), key=lambda item: item[1].get("used_at", ""), reverse=True)
+        fresh = dict(newest[: self.max_entries])
+      self.entries = fresh
+      atomic_write_text(self.path, json.dumps({"entries": fresh}, indent=2, sort_keys=True) + "\n")
+
+
+SUMMARY_CACHE: Optional[SummaryCache] = None
+
+
+def open_summary_cache(enabled: bool = True, *, clear: bool = False) -> Optional[SummaryCache]:
+  global SUMMARY_CACHE
+  if clear:
+    SUMMARY_CACHE_FILE.unlink(missing_ok=True)
+    SUMMARY_CACHE = None
+  if not enabled:
+    SUMMARY_CACHE = None
+  elif SUMMARY_CACHE is None:
+    SUMMARY_CACHE = SummaryCache(SUMMARY_CACHE_FILE)
+  return SUMMARY_CACHE
+
+
+def clamp_summary(text: str, *, max_words: int = 55, max_chars: int = 360) -> str:
+  cleaned = " ".join(text.split())
+  if not cleaned:
+    return ""
+  words = cleaned.split()
+  if len(words) > max_words:
+    cleaned = " ".join(words[:max_words]).rstrip(" ,;:") + "…"
+  if len(cleaned) > max_chars:
+    cleaned = cleaned[: max_chars - 1].rstrip(" ,;:") + "…"
+  return cleaned
+
+
+_TOKEN_ENCODER: Any = None
+_TOKEN_ENCODER_LOADED = False
+_TOKEN_ENCODER_LOCK = threading.Lock()
+
+
+def token_encoder() -> Any:
+  """The tiktoken encoding, loaded once; None when tiktoken or its vocabulary file is unavailable."""
+  global _TOKEN_ENCODER, _TOKEN_ENCODER_LOADED
+  if _TOKEN_ENCODER_LOADED:
+    return _TOKEN_ENCODER
+  # The first load may download the vocabulary; only callers that need the encoder wait for it.
+  with _TOKEN_ENCODER_LOCK:
+    if not _TOKEN_ENCODER_LOADED:
+      try:
+        import tiktoken
+      except ImportError:  # Optional: token counts fall back to an estimate without it.
+        tiktoken = None
+      if tiktoken is not None:
+        # Keep the downloaded vocabulary with the other caches so CI restores it.
+        os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(CACHE_DIR / "tiktoken"))
+        try:
+          _TOKEN_ENCODER = tiktoken.get_encoding(TOKENIZER_ENCODING)
+        except Exception as error:
+          print(f"[warn] tiktoken unavailable ({error.__class__.__name__}); estimating token counts.", file=sys.stderr)
+      # Set last, so the unlocked check above never sees "loaded" before the encoder is in place.
+      _TOKEN_ENCODER_LOADED = True
+  return _TOKEN_ENCODER
+
+
+def count_tokens(text: str) -> int:
+  encoder = token_encoder()
+  if encoder is not None:
+    return len(encoder.encode(text, disallowed_special=()))
+  # BPE splits words into roughly this many pieces; close enough for budgeting.
+  return len(re.findall(r"[A-Za-z]{1,6}|\d{1,3}|[^\sA-Za-z\d]", text))
+
+
+def content_words(text: str) -> set[str]:
+  return {word for word in re.findall(r"[a-z0-9]+", text.lower()) if word not in STOPWORDS and len(word) > 2}
+
+
+def score_passage(passage: str, title_words: set[str], paragraph: int, paragraphs: int) -> float:
+  """Relevance of one sentence: title overlap, entity/number density, a mild lead bonus, chrome penalty."""
+  words = passage.split()
+  overlap = len(content_words(passage) & title_words) / max(1, len(title_words))
+  # Capitalized words after the first, plus figures: names, places, dates, dollar amounts, votes.
+  entities = sum(1 for word in words[1:] if word[:1].isupper()) + len(re.findall(r"\$?\d[\d,.:%]*", passage))
+  density = min(1.0, entities / max(1, len(words)) * 3)
+  # Position matters a little; meeting minutes bury the substance, so the decay is shallow.
+  position = 1.0 - paragraph / max(1, paragraphs) * 0.5
+  score = 2.0 * overlap + 1.5 * density + 0.5 * position
+  if BOILERPLATE_PATTERN.search(passage):
+    score -= 2.0
+  if len(words) < 6:
+    score -= 1.0
+  return score
+
+
+def distill_article(title: str, text: str, budget: int = ARTICLE_TOKEN_BUDGET) -> str:
+  """Best-scoring sentences of `text` that fit in `budget` tokens, kept in their original order."""
+  text = text.strip()
+  if count_tokens(text) <= budget:
+    return text
+  title_words = content_words(title)
+  paragraphs = [paragraph for paragraph in re.split(r"\n\s*", text) if paragraph.strip()]
+  passages: List[Tuple[int, int, str]] = []
+  for paragraph_index, paragraph in enumerate(paragraphs):
+    for sentence in SENTENCE_BOUNDARY.split(" ".join(paragraph.split())):
+      if sentence:
+        passages.append((paragraph_index, len(passages), sentence))
+
+  scored = [(score_passage(passage[2], title_words, passage[0], len(paragraphs)), passage) for passage in passages]
+  scored.sort(key=lambda item: item[0], reverse=True)
+  # Chrome scores below zero; it only gets in when there is nothing else to send.
+  ranked = [passage for score, passage in scored if score > 0] or [passage for _, passage in scored]
+  chosen: List[Tuple[int, int, str]] = []
+  used = 0
+  for passage in ranked:
+    cost = count_tokens(passage[2]) + 1
+    if used + cost > budget:
+      continue
+    chosen.append(passage)
+    used += cost
+  chosen.sort(key=lambda passage: passage[1])
+
+  lines: List[str] = []
+  last_paragraph = None
+  for paragraph_index, _, sentence in chosen:
+    if paragraph_index == last_paragraph:
+      lines[-1] += " " + sentence
+    else:
+      lines.append(sentence)
+      last_paragraph = paragraph_index
+  return "\n".join(lines)
+
+
+_ARTICLE_PROMPTS: Dict[Tuple[str, Union[str, SpilledText]], Tuple[str, int]] = {}
+_ARTICLE_PROMPTS_LOCK = threading.Lock()
+
+
+def article_prompt(title: str, body: Union[str, SpilledText]) -> Tuple[str, int]:
+  """Distilled prompt text and full token count for one article body, loading the body once.
+
+  Keyed by the spill reference rather than the text, so the cache holds only what gets sent.
+  Entries live while their story is being summarized (see release_article_prompt).
+  """
+  key = (title, body)
+  with _ARTICLE_PROMPTS_LOCK:
+    cached = _ARTICLE_PROMPTS.get(key)
+  if cached is None:
+    text = body if isinstance(body, str) else load_body(body)
+    cached = distill_article(title, text, ARTICLE_TOKEN_BUDGET), count_tokens(text)
+    with _ARTICLE_PROMPTS_LOCK:
+      _ARTICLE_PROMPTS[key] = cached
+  return cached
+
+
+def release_article_prompt(story: Story) -> None:
+  """Forget a story's distilled prompt once nothing is left to send or key on it."""
+  with _ARTICLE_PROMPTS_LOCK:
+    _ARTICLE_PROMPTS.pop((story.title, story.body), None)
+
+
+def clear_article_prompts() -> None:
+  with _ARTICLE_PROMPTS_LOCK:
+    _ARTICLE_PROMPTS.clear()
+
+
+def prompt_article_text(story: Story) -> str:
+  return article_prompt(story.title, story.body)[0]
+
+
+def record_prompt_tokens(story: Story) -> None:
+  """Note how many article tokens distillation kept out of the prompt for this story."""
+  prompt, full = article_prompt(story.title, story.body)
+  sent = count_tokens(prompt)
+  record_stat("article_tokens_full", full)
+  record_stat("article_tokens_prompt", sent)
+  record_source_stat(story.source_slug, "article_tokens_full", full)
+  record_source_stat(story.source_slug, "article_tokens_prompt", sent)
+  with _STATS_LOCK:
+    STORY_TOKENS[story.id] = {"article": full, "prompt": sent}
+
+
+def build_summary_prompt(story: Story) -> str:
+  header = textwrap.dedent(
+    f"""
+    Provide a JSON summary for the following local news item.
+    Summary must be 1-2 sentences, <= 55 words, no bullet points, no line breaks.
+    Focus on the concrete update (what happened + why it matters locally).
+    Avoid repeating the title or source name.
+
+    Source: {story.source_name}
+    Title: {story.title}
+    Published: {story.published.isoformat()}
+    URL: {story.url}
+
+    Article text (most relevant passages, in order):
+    """
+  ).strip()
+  # Appended after dedent: the distilled text spans several unindented lines.
+  return f"{header}\n{prompt_article_text(story)}"
+
+
+def summary_request_body(story: Story) -> Dict[str, Any]:
+  return {
+    "model": OPENAI_MODEL,
+    "input": [
+      {"role": "system", "content": "You are a civic analyst helping residents stay informed. Always respond with a single JSON object matching the required schema."},
+      {"role": "user", "content": build_summary_prompt(story)},
+    ],
+    "temperature": 0.2,
+  }
+
+
+def estimate_request_tokens(body: Dict[str, Any]) -> int:
+  return sum(count_tokens(message["content"]) for message in body["input"]) + SUMMARY_OUTPUT_TOKENS
+
+
+def retry_after_seconds(error: RateLimitError, default: float = 10.0) -> float:
+  headers = getattr(getattr(error, "response", None), "headers", None) or {}
+  retry_after_ms = headers.get("retry-after-ms")
+  if retry_after_ms:
+    try:
+      return max(0.0, float(retry_after_ms) / 1000)
+    except ValueError:
+      pass
+  retry_after = headers.get("retry-after")
+  if retry_after:
+    try:
+      return max(0.0, float(retry_after))
+    except ValueError:
+      retry_at = parse_datetime(retry_after)
+      if retry_at:
+        return max(0.0, (retry_at - datetime.now(tz=UTC)).total_seconds())
+  return default
+
+
+class RateLimiter:
+  """Request and token buckets shared by every summarization worker.
+
+  Both buckets refill continuously at their per-minute rate. A 429 seen by any worker
+  pauses all of them until its Retry-After has elapsed.
+  """
+
+  def __init__(self, requests_per_minute: int = OPENAI_RPM, tokens_per_minute: int = OPENAI_TPM) -> None:
+    self.capacity = {"requests": float(max(1, requests_per_minute)), "tokens": float(max(1, tokens_per_minute))}
+    self.level = dict(self.capacity)
+    self.updated = time.monotonic()
+    self.paused_until = 0.0
+    self.condition = threading.Condition()
+
+  def _refill(self, now: float) -> None:
+    elapsed = now - self.updated
+    self.updated = now
+    for bucket, capacity in self.capacity.items():
+      self.level[bucket] = min(capacity, self.level[bucket] + capacity * elapsed / 60)
+
+  def acquire(self, tokens: int, timeout: Optional[float] = None) -> bool:
+    """Take one request and `tokens` tokens; False if that would mean waiting past `timeout` seconds."""
+    tokens = min(tokens, int(self.capacity["tokens"]))
+    give_up = time.monotonic() + timeout if timeout is not None else None
+    with self.condition:
+      while True:
+        now = time.monotonic()
+        self._refill(now)
+        wait = self.paused_until - now
+        if wait <= 0:
+          missing_requests = 1 - self.level["requests"]
+          missing_tokens = tokens - self.level["tokens"]
+          if missing_requests <= 0 and missing_tokens <= 0:
+            self.level["requests"] -= 1
+            self.level["tokens"] -= tokens
+            return True
+          wait = max(
+            missing_requests * 60 / self.capacity["requests"],
+            missing_tokens * 60 / self.capacity["tokens"],
+          )
+        if give_up is not None and now + wait > give_up:
+          return False
+        self.condition.wait(timeout=wait)
+
+  def pause(self, seconds: float) -> None:
+    with self.condition:
+      self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+      self.condition.notify_all()
+    record_stat("openai_rate_limited")
+
+
+RATE_LIMITER: Optional[RateLimiter] = None
+
+
+def count_summary_retry(retry_state: Any) -> None:
+  record_stat("openai_retries")
+
+
+class RunBudgetSpent(Exception):
+  """The run deadline leaves no time to send this story to OpenAI."""
+
+
+def summary_budget_spent(retry_state: Any = None) -> bool:
+  return DEADLINE is not None and DEADLINE.summary_timeout() is None
+
+
+@lru_cache(maxsize=1)
+def summary_retrier() -> Callable[[OpenAI, Story], StorySummary]:
+  """request_summary under the retry policy, built on first use so tenacity loads only when summarizing."""
+  from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+
+  return retry(
+    wait=wait_exponential(multiplier=2, min=2, max=10),
+    stop=stop_after_attempt(3) | summary_budget_spent,
+    retry=retry_if_not_exception_type(RunBudgetSpent),
+    before_sleep=count_summary_retry,
+  )(request_summary)
+
+
+def summarize_story(client: OpenAI, story: Story) -> StorySummary:
+  return summary_retrier()(client, story)
+
+
+def request_summary(client: OpenAI, story: Story) -> StorySummary:
+  body = summary_request_body(story)
+  options: Dict[str, Any] = {}
+  if DEADLINE:
+    timeout = DEADLINE.summary_timeout()
+    if timeout is None:
+      raise RunBudgetSpent()
+    if RATE_LIMITER and not RATE_LIMITER.acquire(estimate_request_tokens(body), timeout):
+      raise RunBudgetSpent()
+    # The request may not outlive the summary deadline either.
+    options["timeout"] = DEADLINE.summary_timeout() or MIN_FETCH_SECONDS
+  elif RATE_LIMITER:
+    RATE_LIMITER.acquire(estimate_request_tokens(body))
+  started = time.perf_counter()
+  try:
+    response = client.responses.create(**body, **options)
+  except Exception as error:
+    from openai import RateLimitError
+
+    record_timing("openai_request", time.perf_counter() - started, source=story.source_slug, ok=False)
+    if isinstance(error, RateLimitError) and RATE_LIMITER:
+      RATE_LIMITER.pause(retry_after_seconds(error))
+    raise
+  record_timing("openai_request", time.perf_counter() - started, source=story.source_slug)
+
   json_payload = getattr(response, "output_text", None)
 
   if not json_payload and getattr(response, "output", None):
@@ -518,6 +3182,10 @@ def summarize_story(client: OpenAI, story: Story) -> StorySummary:
   if not json_payload:
     raise RuntimeError("OpenAI response did not return JSON payload.")
 
+  return parse_summary_payload(json_payload, story)
+
+
+def parse_summary_payload(json_payload: str, story: Story) -> StorySummary:
   cleaned_payload = json_payload.strip()
   if cleaned_payload.startswith("```"):
     lines = cleaned_payload.splitlines()
@@ -574,22 +3242,43 @@ def summarize_story(client: OpenAI, story: Story) -> StorySummary:
 
 
 def safe_summarize(client: OpenAI, story: Story) -> StorySummary:
+  cache = SUMMARY_CACHE
+  cached = cache.get(story) if cache else None
+  if cached:
+    debug_log(f"Summary cache hit for '{story.title}'.")
+    record_outcome(story, "summary_cached")
+    return cached
+  record_prompt_tokens(story)
   try:
-    return summarize_story(client, story)
+    summary = summarize_story(client, story)
+    # Only successful API summaries are stored; the fallback below never reaches the cache.
+    if cache:
+      cache.put(story, summary)
+    record_outcome(story, "summarized")
+    return summary
+  except RunBudgetSpent:
+    return deadline_summary(story)
   except Exception as error:
     if DEBUG:
       print(f"[debug] Exception while summarizing '{story.title}': {error}", file=sys.stderr)
       traceback.print_exc()
-    fallback_summary = StorySummary(
-      summary=clamp_summary(story.excerpt or story.title),
-      sentiment_label="neutral",
-      sentiment_score=0,
-      community_impact="Impact unclear based on automatically extracted text.",
-      priority="medium",
-      suggested_action=None,
-    )
+    if summary_budget_spent():
+      # The request was cut off by the deadline rather than failing on its own.
+      return deadline_summary(story)
     print(f"[warn] Failed to summarize {story.title}: {error}", file=sys.stderr)
-  return fallback_summary
+  record_outcome(story, "summary_fallback")
+  return fallback_summary(story)
+
+
+def fallback_summary(story: Story) -> StorySummary:
+  return StorySummary(
+    summary=clamp_summary(story.excerpt or story.title),
+    sentiment_label="neutral",
+    sentiment_score=0,
+    community_impact="Impact unclear based on automatically extracted text.",
+    priority="medium",
+    suggested_action=None,
+  )
 
 
 def summarize_without_openai(story: Story) -> StorySummary:
@@ -604,6 +3293,57 @@ def summarize_without_openai(story: Story) -> StorySummary:
   )
 
 
+def deadline_summary(story: Story) -> StorySummary:
+  """Excerpt summary for a story the run budget left no time to send to OpenAI."""
+  if DEADLINE:
+    DEADLINE.skip_summary(story)
+  record_outcome(story, "summary_deadline")
+  return summarize_without_openai(story)
+
+
+def summarize_stories(
+  client: Optional[OpenAI],
+  stories: List[Story],
+  *,
+  workers: int = SUMMARY_WORKERS,
+  completed: Optional[Mapping[str, StorySummary]] = None,
+  on_summary: Optional[Callable[[Story, StorySummary], None]] = None,
+) -> List[StorySummary]:
+  """Summarize stories concurrently; the returned list lines up with `stories`.
+
+  Stories whose id is in `completed` reuse that summary; `on_summary` sees every new one.
+  """
+  completed = completed or {}
+
+  def summarize(story: Story) -> StorySummary:
+    if story.id in completed:
+      record_outcome(story, "resumed")
+      return completed[story.id]
+    debug_log(f"Summarizing story: {story.title} ({story.source_name})")
+    if client is None:
+      record_outcome(story, "excerpt_only")
+      summary = summarize_without_openai(story)
+    elif summary_budget_spent():
+      summary = deadline_summary(story)
+    else:
+      summary = safe_summarize(client, story)
+      # The prompt is only needed while this story is in flight; a large run would otherwise
+      # hold every distilled article until the end.
+      release_article_prompt(story)
+    if on_summary:
+      on_summary(story, summary)
+    return summary
+
+  if client is None or workers <= 1 or len(stories) <= 1:
+    summaries = [summarize(story) for story in stories]
+  else:
+    with ThreadPoolExecutor(max_workers=min(workers, len(stories)), thread_name_prefix="pulse-summary") as executor:
+      summaries = list(executor.map(summarize, stories))
+  # Excerpt-only and resumed stories never reach safe_summarize; nothing they cached is needed now.
+  clear_article_prompts()
+  return summaries
+
+
 def compute_sentiment(items: List[Dict[str, Any]]) -> Tuple[int, str, str]:
   if not items:
     return 0, "Even Keel", "No new stories were summarized today."
@@ -658,10 +3398,7 @@ def pick_call_to_action(items: List[Dict[str, Any]]) -> str:
 
 
 def write_latest_json(payload: Dict[str, Any]) -> None:
-  LATEST_JSON_FILE.parent.mkdir(parents=True, exist_ok=True)
-  with LATEST_JSON_FILE.open("w", encoding="utf-8") as handle:
-    json.dump(payload, handle, indent=2, ensure_ascii=False)
-    handle.write("\n")
+  atomic_write_text(LATEST_JSON_FILE, json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
 
 
 def write_markdown(payload: Dict[str, Any], run_time: datetime) -> None:
@@ -712,7 +3449,9 @@ def write_markdown(payload: Dict[str, Any], run_time: datetime) -> None:
     ]
     detail = " ".join(part for part in detail_parts if part)
     link_text = f" [Read more]({item['link']})" if item.get("link") else ""
-    lines.append(f"- **{item['title']}** ({item['source']['name']}) — {detail}{link_text}")
+    also = ", ".join(f"[{alternate['source']['name']}]({alternate['link']})" for alternate in item.get("alternates", []))
+    also_text = f" Also covered by {also}." if also else ""
+    lines.append(f"- **{item['title']}** ({item['source']['name']}) — {detail}{link_text}{also_text}")
 
   lines.extend(
     [
@@ -722,15 +3461,307 @@ def write_markdown(payload: Dict[str, Any], run_time: datetime) -> None:
     ]
   )
 
-  with file_path.open("w", encoding="utf-8") as handle:
-    handle.write("\n".join(lines).strip() + "\n")
+  atomic_write_text(file_path, "\n".join(lines).strip() + "\n")
+
+
+DIGEST_DATE = re.compile(r'^date: "([^"]+)"$', re.M)
+DIGEST_WINDOW = re.compile(r"^_Autogenerated on .* from the last (\d+) hours\._$", re.M)
+DIGEST_VIBE = re.compile(r"^- Score \(0-100\): (-?\d+)\n- Sentiment \(-100\.\.100\): (-?\d+)\n- Mood: (.*)$", re.M)
+DIGEST_STORY = re.compile(r"^- \*\*(.*?)\*\* \((.*?)\) — ", re.M)
+DIGEST_TAIL = re.compile(
+  r"Sentiment: (\w+) \((-?\d+)\) Priority: (\w+)(?: \[Read more\]\((\S+)\))?(?: Also covered by (.*)\.)?$",
+  re.S,
+)
+MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\((\S+?)\)")
+
+
+def rollup_item(item: Dict[str, Any]) -> Dict[str, Any]:
+  return {
+    "id": item.get("id"),
+    "source": item["source"]["id"],
+    "title": item["title"],
+    "link": item.get("link"),
+    "published": item.get("published"),
+    "sentiment": item.get("sentiment"),
+    "sentiment_score": item.get("sentiment_score"),
+    "priority": item.get("priority"),
+    "tags": item.get("tags") or [],
+    "alternates": [alternate["link"] for alternate in item.get("alternates", []) if alternate.get("link")],
+  }
+
+
+def rollup_shard(payload: Dict[str, Any]) -> Dict[str, Any]:
+  """One day of the rollup index: scores, counts by source and priority, and item metadata without summaries."""
+  items = payload["items"]
+  return {
+    "date": payload["generated_at"][:10],
+    "generated_at": payload["generated_at"],
+    "window_hours": payload.get("window_hours"),
+    "stories_considered": payload.get("stories_considered"),
+    "stories_featured": len(items),
+    "vibe": {"score": payload["vibe"]["score"], "label": payload["vibe"]["label"]},
+    "sentiment": payload["sentiment"]["score"],
+    "by_source": dict(Counter(item["source"]["id"] for item in items)),
+    "by_priority": dict(Counter(item["priority"] for item in items if item.get("priority"))),
+    "sources": {item["source"]["id"]: item["source"]["name"] for item in items},
+    "items": [rollup_item(item) for item in items],
+  }
+
+
+def parse_digest_markdown(text: str) -> Optional[Dict[str, Any]]:
+  """Rebuild the parts of a digest payload that write_markdown put into an MDX file.
+
+  Publish dates, tags and the considered count never reach the MDX, so they come back empty.
+  """
+  generated = DIGEST_DATE.search(text)
+  vibe = DIGEST_VIBE.search(text)
+  if generated is None or vibe is None:
+    return None
+  window = DIGEST_WINDOW.search(text)
+  _, _, stories = text.partition("### Stories worth a look\n")
+  # The call to action is the paragraph after the list.
+  stories = stories.strip().rpartition("\n\n")[0] or stories.strip()
+  matches = list(DIGEST_STORY.finditer(stories))
+  items: List[Dict[str, Any]] = []
+  for index, match in enumerate(matches):
+    title, source_name = match.group(1), match.group(2)
+    end = matches[index + 1].start() if index + 1 < len(matches) else len(stories)
+    detail = stories[match.end() : end].strip()
+    tail = DIGEST_TAIL.search(detail)
+    link = tail.group(4) if tail else None
+    source_id = slugify(source_name)
+    alternates = []
+    if tail and tail.group(5):
+      alternates = [
+        {"source": {"id": slugify(name), "name": name}, "link": href} for name, href in MARKDOWN_LINK.findall(tail.group(5))
+      ]
+    items.append(
+      {
+        "id": create_story_id(source_id, link) if link else None,
+        "source": {"id": source_id, "name": source_name},
+        "title": title,
+        "link": link,
+        "published": None,
+        "sentiment": tail.group(1) if tail else None,
+        "sentiment_score": int(tail.group(2)) if tail else None,
+        "priority": tail.group(3) if tail else None,
+        "alternates": alternates,
+      }
+    )
+  return {
+    "generated_at": generated.group(1),
+    "window_hours": int(window.group(1)) if window else None,
+    "stories_considered": None,
+    "items": items,
+    "vibe": {"score": int(vibe.group(1)), "label": vibe.group(3)},
+    "sentiment": {"score": int(vibe.group(2))},
+  }
+
+
+def read_digest_shard(path: Path) -> Optional[Dict[str, Any]]:
+  """Parse one pulse-YYYY-MM-DD.mdx into its rollup shard (run in worker processes by rebuild_rollup)."""
+  try:
+    payload = parse_digest_markdown(path.read_text(encoding="utf-8"))
+  except (OSError, UnicodeDecodeError, ValueError):
+    payload = None
+  if payload is None:
+    return None
+  shard = rollup_shard(payload)
+  # The file name, not the timestamp, is the day write_markdown filed the digest under.
+  shard["date"] = path.stem.removeprefix("pulse-")
+  return shard
+
+
+def rollup_entry(shard: Dict[str, Any]) -> Dict[str, Any]:
+  entry = {key: value for key, value in shard.items() if key not in ("items", "sources")}
+  entry["file"] = f"pulse-{shard['date']}.mdx"
+  entry["shard"] = f"days/{shard['date']}.json"
+  return entry
+
+
+def rollup_totals(days: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+  by_source: Counter[str] = Counter()
+  by_priority: Counter[str] = Counter()
+  for entry in days.values():
+    by_source.update(entry["by_source"])
+    by_priority.update(entry["by_priority"])
+  ordered = sorted(days)
+  return rollup_totals_from(
+    len(days),
+    ordered[0] if ordered else None,
+    ordered[-1] if ordered else None,
+    sum(entry["stories_featured"] for entry in days.values()),
+    sum(entry["sentiment"] for entry in days.values()),
+    by_source,
+    by_priority,
+  )
+
+
+def rollup_totals_from(
+  count: int,
+  first_day: Optional[str],
+  last_day: Optional[str],
+  stories: int,
+  sentiment_total: int,
+  by_source: Counter[str],
+  by_priority: Counter[str],
+) -> Dict[str, Any]:
+  return {
+    "days": count,
+    "first_day": first_day,
+    "last_day": last_day,
+    "stories": stories,
+    # The sum behind mean_sentiment, kept so a run can adjust the mean without the other days.
+    "sentiment_total": sentiment_total,
+    "mean_sentiment": round(sentiment_total / count, 1) if count else None,
+    "by_source": dict((+by_source).most_common()),
+    "by_priority": dict((+by_priority).most_common()),
+  }
+
+
+def adjust_rollup_totals(
+  totals: Dict[str, Any],
+  days: Dict[str, Dict[str, Any]],
+  day: str,
+  old: Optional[Dict[str, Any]],
+  new: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+  """rollup_totals after one day's entry went from `old` to `new` (None: absent), from the previous
+  totals alone. `days` already holds the change; it is only scanned when the first or last day leaves."""
+  by_source, by_priority = Counter(totals["by_source"]), Counter(totals["by_priority"])
+  stories, sentiment_total = totals["stories"], totals["sentiment_total"]
+  if old is not None:
+    by_source.subtract(old["by_source"])
+    by_priority.subtract(old["by_priority"])
+    stories -= old["stories_featured"]
+    sentiment_total -= old["sentiment"]
+  if new is not None:
+    by_source.update(new["by_source"])
+    by_priority.update(new["by_priority"])
+    stories += new["stories_featured"]
+    sentiment_total += new["sentiment"]
+  first_day, last_day = totals["first_day"], totals["last_day"]
+  if new is not None:
+    first_day, last_day = min(first_day or day, day), max(last_day or day, day)
+  elif day in (first_day, last_day):
+    first_day, last_day = min(days, default=None), max(days, default=None)
+  return rollup_totals_from(len(days), first_day, last_day, stories, sentiment_total, by_source, by_priority)
+
+
+def rollup_archive() -> str:
+  """Where the MDX archive sits relative to the rollup index, as recorded in its summary."""
+  return Path(os.path.relpath(MARKDOWN_DIR, ROLLUP_DIR)).as_posix()
+
+
+def write_rollup_summary(days: Dict[str, Dict[str, Any]], sources: Dict[str, str], totals: Dict[str, Any]) -> None:
+  summary = {
+    "updated_at": datetime.now(tz=UTC).isoformat(),
+    "archive": rollup_archive(),
+    "totals": totals,
+    "sources": dict(sorted(sources.items())),
+    "days": {day: days[day] for day in sorted(days)},
+  }
+  atomic_write_text(ROLLUP_SUMMARY_FILE, json.dumps(summary, indent=2, ensure_ascii=False) + "\n")
+
 
+def write_rollup_shard(shard: Dict[str, Any]) -> None:
+  atomic_write_text(ROLLUP_DIR / "days" / f"{shard['date']}.json", json.dumps(shard, indent=2, ensure_ascii=False) + "\n")
 
-def update_state_with_stories(state: Dict[str, Any], stories: List[Story], run_time: datetime) -> Dict[str, Any]:
+
+def rebuild_rollup(
+  workers: int = INDEX_WORKERS, *, dry_run: bool = False
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+  """Re-derive the whole rollup index from the MDX archive, parsing files in worker processes.
+
+  Shards whose MDX no longer exists are deleted. Returns the summary entries by day and the
+  source names by id.
+  """
+  paths = sorted(MARKDOWN_DIR.glob("pulse-????-??-??.mdx"))
+  if workers > 1 and len(paths) > 1:
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, len(paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+      parsed = list(executor.map(read_digest_shard, paths, chunksize=max(1, len(paths) // (workers * 4))))
+  else:
+    parsed = [read_digest_shard(path) for path in paths]
+
+  shards = [shard for shard in parsed if shard is not None]
+  for path, shard in zip(paths, parsed):
+    if shard is None:
+      print(f"[warn] Could not read a digest from {path.name}; leaving it out of the rollup index.", file=sys.stderr)
+  days = {shard["date"]: rollup_entry(shard) for shard in shards}
+  sources: Dict[str, str] = {}
+  for shard in shards:
+    sources.update(shard["sources"])
+  if dry_run:
+    return days, sources
+  for shard in shards:
+    write_rollup_shard(shard)
+  for stale in (ROLLUP_DIR / "days").glob("*.json"):
+    if stale.stem not in days:
+      stale.unlink(missing_ok=True)
+  write_rollup_summary(days, sources, rollup_totals(days))
+  return days, sources
+
+
+def update_rollup(payloads: List[Dict[str, Any]]) -> None:
+  """Fold freshly written digests into the rollup index: one shard per day plus the summary.
+
+  Only the days being written change: their entries are replaced and the totals adjusted by
+  the difference, so a run costs the same however long the archive is. No MDX is read unless
+  the summary is missing or unreadable, in which case the index is
+  rebuilt from the archive first (that is how an existing archive gets its first index). That
+  rebuild stays in this process: forking worker processes from a run with live thread pools
+  is not safe.
+
+  A summary built from a different archive (say, a run whose MARKDOWN_DIR was redirected but
+  whose ROLLUP_DIR was not) is left alone; mixing the two would corrupt the index.
+  """
+  archive = rollup_archive()
+  try:
+    summary = json.loads(ROLLUP_SUMMARY_FILE.read_text(encoding="utf-8"))
+    days, sources = dict(summary["days"]), dict(summary["sources"])
+    totals = summary["totals"]
+    if "sentiment_total" not in totals:
+      # Written before totals were kept incrementally; total the days once.
+      totals = rollup_totals(days)
+    built_from = summary.get("archive", archive)
+  except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+    if ROLLUP_SUMMARY_FILE.exists():
+      print(f"[warn] Rollup summary {ROLLUP_SUMMARY_FILE} is unreadable ({error}); rebuilding it.", file=sys.stderr)
+    days, sources = rebuild_rollup(workers=1)
+    totals = rollup_totals(days)
+    built_from = archive
+  if built_from != archive:
+    print(
+      f"[warn] Rollup index {ROLLUP_DIR} was built from {built_from}, not {archive}; leaving it untouched. "
+      "Run with --rebuild-index to re-derive it from this archive.",
+      file=sys.stderr,
+    )
+    return
+
+  for payload in payloads:
+    shard = rollup_shard(payload)
+    day = shard["date"]
+    old = days.pop(day, None)
+    if not shard["items"]:
+      # write_markdown dropped this day's MDX, so the day leaves the index too.
+      (ROLLUP_DIR / "days" / f"{day}.json").unlink(missing_ok=True)
+      totals = adjust_rollup_totals(totals, days, day, old, None)
+      continue
+    sources.update(shard["sources"])
+    write_rollup_shard(shard)
+    days[day] = rollup_entry(shard)
+    totals = adjust_rollup_totals(totals, days, day, old, days[day])
+  write_rollup_summary(days, sources, totals)
+
+
+def update_state_with_stories(state: Dict[str, Any], story_ids: List[str], run_time: datetime) -> Dict[str, Any]:
   seen = state.setdefault("seen", {})
   iso = run_time.isoformat()
-  for story in stories:
-    seen[story.id] = iso
+  for story_id in story_ids:
+    seen[story_id] = iso
   state["last_run"] = iso
   return state
 
@@ -750,6 +3781,7 @@ def build_item_payload(story: Story, summary: StorySummary) -> Dict[str, Any]:
     "community_impact": summary.community_impact,
     "priority": summary.priority,
     "suggested_action": summary.suggested_action,
+    "alternates": story.alternates,
   }
 
 
@@ -761,6 +3793,358 @@ def aggregate_overview(items: List[Dict[str, Any]]) -> str:
   return " ".join(sentences)
 
 
+def open_summarizer(skip_openai: bool, use_summary_cache: bool) -> Optional[OpenAI]:
+  """Create the OpenAI client plus the shared summary cache and rate limiter, or None for --no-openai."""
+  global RATE_LIMITER
+  if skip_openai:
+    return None
+  from openai import OpenAI
+
+  open_summary_cache(use_summary_cache)
+  if RATE_LIMITER is None:
+    RATE_LIMITER = RateLimiter(OPENAI_RPM, OPENAI_TPM)
+  # The SDK's own retries would sleep per call; leave 429s to the shared limiter and tenacity.
+  return OpenAI(max_retries=0)
+
+
+def build_digest_payload(
+  enriched_items: List[Dict[str, Any]],
+  generated_at: datetime,
+  window_hours: int,
+  considered: int,
+) -> Dict[str, Any]:
+  sentiment_score, sentiment_label, sentiment_rationale = compute_sentiment(enriched_items)
+  vibe = convert_sentiment_to_vibe(sentiment_score, sentiment_label, sentiment_rationale)
+  return {
+    "generated_at": generated_at.isoformat(),
+    "window_hours": window_hours,
+    "stories_considered": considered,
+    "stories_featured": len(enriched_items),
+    "headline": f"Kirkwood Pulse • {generated_at.strftime('%B %d, %Y')}",
+    "overview": aggregate_overview(enriched_items),
+    "items": enriched_items,
+    "vibe": vibe,
+    "sentiment": {
+      "score": sentiment_score,
+      "label": sentiment_label,
+      "rationale": sentiment_rationale,
+    },
+    "call_to_action": pick_call_to_action(enriched_items),
+  }
+
+
+def print_run_stats() -> None:
+  if RESPONSE_ARCHIVE and RESPONSE_ARCHIVE.replaying:
+    print(f"Replay: {STATS['replay_hits']} responses served from {RESPONSE_ARCHIVE.path}, {STATS['replay_misses']} missing.")
+  elif RESPONSE_ARCHIVE:
+    print(f"Recorded {STATS['archive_recorded']} responses to {RESPONSE_ARCHIVE.path}.")
+  if STATS["seen_skipped"]:
+    print(f"Skipped {STATS['seen_skipped']} already-featured links before extraction.")
+  if STATS["merge_skipped"]:
+    print(f"Left {STATS['merge_skipped']} candidate articles unfetched once enough fresh stories were found.")
+  if HTTP_CACHE:
+    print(
+      f"HTTP cache: {STATS['http_cache_hits']} hits (304), {STATS['http_cache_misses']} misses, "
+      f"{STATS['http_cache_stored']} stored, {STATS['http_cache_evicted']} evicted.",
+    )
+  if STATS["article_tokens_full"]:
+    print(
+      f"Prompt distillation: {STATS['article_tokens_full']} article tokens in, "
+      f"{STATS['article_tokens_prompt']} sent (budget {ARTICLE_TOKEN_BUDGET} per story).",
+    )
+  if DEADLINE and DEADLINE.degraded:
+    print(
+      f"Run budget of {DEADLINE.total:g}s ran short: {len(DEADLINE.sources_skipped)} sources skipped, "
+      f"{sum(len(urls) for urls in DEADLINE.links_skipped.values())} links not fetched, "
+      f"{len(DEADLINE.summaries_skipped)} summaries left as excerpts.",
+    )
+  if STATS["openai_rate_limited"]:
+    print(f"OpenAI rate limits hit {STATS['openai_rate_limited']} times; workers paused for Retry-After.")
+  if _EXTRACTION_STORE and (STATS["extract_cache_hits"] or STATS["extract_cache_misses"]):
+    print(
+      f"Extraction store: {STATS['extract_cache_hits']} hits, {STATS['extract_cache_misses']} misses, "
+      f"{STATS['extract_cache_evicted']} evicted.",
+    )
+  if SUMMARY_CACHE and (STATS["summary_cache_hits"] or STATS["summary_cache_misses"]):
+    print(
+      f"Summary cache: {STATS['summary_cache_hits']} hits, {STATS['summary_cache_misses']} misses "
+      f"({len(SUMMARY_CACHE.entries)} entries).",
+    )
+
+
+def peak_rss_mb() -> Optional[float]:
+  """This process's peak resident set size so far, in MB; None where `resource` is unavailable."""
+  if resource is None:
+    return None
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Linux reports kilobytes, macOS bytes.
+  return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def histogram_labels() -> List[str]:
+  labels = [f"<={int(bound * 1000)}ms" for bound in LATENCY_BUCKETS]
+  return labels + [f">{int(LATENCY_BUCKETS[-1] * 1000)}ms"]
+
+
+def build_run_report(
+  mode: str,
+  started_at: datetime,
+  wall_seconds: float,
+  *,
+  considered: int,
+  candidates: List[Story],
+  featured: List[Story],
+  options: Dict[str, Any],
+  deadline: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+  """Snapshot this run's stage times, per-operation latency, per-source counters and story outcomes.
+
+  `deadline` is the run budget's account of what it skipped (RunDeadline.report).
+  """
+  featured_ids = {story.id for story in featured}
+  with _STATS_LOCK:
+    operations = {
+      operation: {
+        "count": metrics["count"],
+        "failures": metrics["failures"],
+        "seconds": round(metrics["seconds"], 3),
+        "mean_ms": round(metrics["seconds"] * 1000 / metrics["count"], 1) if metrics["count"] else 0.0,
+        "max_ms": round(metrics["max_seconds"] * 1000, 1),
+        "bytes": metrics["bytes"],
+        "histogram": dict(zip(histogram_labels(), metrics["histogram"])),
+      }
+      for operation, metrics in sorted(OPERATION_METRICS.items())
+    }
+    sources = {
+      slug: {name: round(value, 3) if isinstance(value, float) else value for name, value in sorted(counters.items())}
+      for slug, counters in sorted(SOURCE_METRICS.items())
+    }
+    stages = {stage: round(seconds, 3) for stage, seconds in STAGE_SECONDS.items()}
+    counters = dict(sorted(STATS.items()))
+    outcomes = dict(STORY_OUTCOMES)
+    tokens = dict(STORY_TOKENS)
+
+  items = [
+    {
+      "id": story.id,
+      "source": story.source_slug,
+      "title": story.title,
+      "url": story.url,
+      "published": story.published.isoformat(),
+      "outcome": outcomes.get(story.id, "unsummarized" if story.id in featured_ids else "not_selected"),
+      **({"tokens_in": tokens[story.id]} if story.id in tokens else {}),
+    }
+    for story in candidates
+  ]
+  return {
+    "run_id": started_at.strftime("%Y%m%dT%H%M%SZ"),
+    "mode": mode,
+    "started_at": started_at.isoformat(),
+    "finished_at": (started_at + timedelta(seconds=wall_seconds)).isoformat(),
+    "wall_seconds": round(wall_seconds, 3),
+    "peak_rss_mb": peak_rss_mb(),
+    "options": options,
+    "stages": stages,
+    "operations": operations,
+    "sources": sources,
+    "counters": counters,
+    **({"deadline": deadline} if deadline is not None else {}),
+    "stories": {
+      "considered": considered,
+      "featured": len(featured),
+      "outcomes": dict(Counter(item["outcome"] for item in items)),
+      "items": items,
+    },
+  }
+
+
+def report_index_entry(report: Dict[str, Any], filename: str) -> Dict[str, Any]:
+  operations = report["operations"]
+  fetches = [metrics for operation, metrics in operations.items() if operation.endswith("fetch")]
+  return {
+    "run_id": report["run_id"],
+    "file": filename,
+    "mode": report["mode"],
+    "started_at": report["started_at"],
+    "wall_seconds": report["wall_seconds"],
+    "peak_rss_mb": report.get("peak_rss_mb"),
+    "stages": report["stages"],
+    "stories_considered": report["stories"]["considered"],
+    "stories_featured": report["stories"]["featured"],
+    "outcomes": report["stories"]["outcomes"],
+    "requests": sum(metrics["count"] for metrics in fetches),
+    "request_failures": sum(metrics["failures"] for metrics in fetches),
+    "bytes_fetched": sum(metrics["bytes"] for metrics in fetches),
+    "openai_requests": operations.get("openai_request", {}).get("count", 0),
+    "openai_retries": report["counters"].get("openai_retries", 0),
+    "degraded": report.get("deadline", {}).get("degraded", False),
+  }
+
+
+def write_run_report(report: Dict[str, Any]) -> Path:
+  """Write the report, then add it to the rolling index and drop reports that fell out of it."""
+  filename = f"pulse-run-{report['run_id']}.json"
+  runs: List[Dict[str, Any]] = []
+  if REPORT_INDEX_FILE.exists():
+    try:
+      runs = json.loads(REPORT_INDEX_FILE.read_text(encoding="utf-8")).get("runs", [])
+    except (OSError, ValueError, AttributeError):
+      runs = []
+  runs = [entry for entry in runs if entry.get("run_id") != report["run_id"]]
+  runs.append(report_index_entry(report, filename))
+  runs.sort(key=lambda entry: entry.get("started_at", ""))
+  keep = max(1, REPORT_KEEP)
+  for dropped in runs[:-keep]:
+    if dropped.get("file"):
+      (REPORTS_DIR / dropped["file"]).unlink(missing_ok=True)
+  runs = runs[-keep:]
+
+  atomic_write_text(
+    REPORT_INDEX_FILE,
+    json.dumps({"updated_at": report["finished_at"], "runs": runs}, indent=2, ensure_ascii=False) + "\n",
+  )
+  # Written after the index so the newest file in the directory is the report itself.
+  report_path = REPORTS_DIR / filename
+  atomic_write_text(report_path, json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+  return report_path
+
+
+class RunJournal:
+  """Append-only, fsynced JSONL log of a daily run: its settings, each collected source, each summary.
+
+  A run that dies part way leaves the journal behind; `--resume` reads it back and only
+  collects the sources and summarizes the stories it does not already hold. A successful
+  run deletes it.
+  """
+
+  def __init__(self, path: Path, header: Dict[str, Any]) -> None:
+    self.path = path
+    self.header = header
+    self.lock = threading.Lock()
+    self.records: List[Dict[str, Any]] = []
+    self.sources: Dict[str, List[Story]] = {}
+    self.summaries: Dict[str, StorySummary] = {}
+
+  @classmethod
+  def start(cls, path: Path, header: Dict[str, Any]) -> "RunJournal":
+    journal = cls(path, header)
+    atomic_write_text(path, json.dumps({"type": "run", **header}, ensure_ascii=False) + "\n")
+    return journal
+
+  @classmethod
+  def resume(cls, path: Path) -> Optional["RunJournal"]:
+    records = read_jsonl(path)
+    if not records or records[0].get("type") != "run":
+      return None
+    header = {key: value for key, value in records[0].items() if key != "type"}
+    journal = cls(path, header)
+    journal.records = records
+    for record in records[1:]:
+      if record.get("type") == "source":
+        journal.sources[record["slug"]] = [story_from_record(story) for story in record["stories"]]
+      elif record.get("type") == "summary" and record.get("outcome") not in ("summary_fallback", "summary_deadline"):
+        # Fallback summaries are written down but not trusted; a resume asks OpenAI again.
+        journal.summaries[record["id"]] = StorySummary(**record["summary"])
+    return journal
+
+  def repair(self) -> None:
+    """Rewrite the records read on resume, dropping any torn final line so appends start clean."""
+    atomic_write_text(self.path, "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records))
+
+  def append(self, record: Dict[str, Any]) -> None:
+    with self.lock:
+      append_jsonl(self.path, [record])
+
+  def record_source(self, source: SourceConfig, stories: List[Story]) -> None:
+    self.append({"type": "source", "slug": source.slug, "stories": [story_to_record(story) for story in stories]})
+
+  def record_summary(self, story: Story, summary: StorySummary) -> None:
+    with _STATS_LOCK:
+      outcome = STORY_OUTCOMES.get(story.id)
+    self.append({"type": "summary", "id": story.id, "outcome": outcome, "summary": asdict(summary)})
+
+  def marked_seen(self, seen: Mapping[str, str]) -> set[str]:
+    """Journaled stories that the seen state records as featured by this very run."""
+    run_time = self.header["now"]
+    return {
+      story.id
+      for stories in self.sources.values()
+      for story in stories
+      if story.id in seen and seen[story.id] == run_time
+    }
+
+  def finish(self) -> None:
+    self.path.unlink(missing_ok=True)
+
+
+def seen_updates(featured: List[Story], signatures: Mapping[str, str]) -> Tuple[List[str], Dict[str, str]]:
+  """The story ids and signatures a run marks seen for the stories it featured.
+
+  Alternates count as featured too, so their links are skipped like any seen story, but only the
+  featured copy's signature is kept: the alternates already matched it. Stories the deadline
+  left with an excerpt instead of a summary are not marked, so the next run picks them up again
+  and summarizes them properly.
+  """
+  with _STATS_LOCK:
+    degraded = {story.id for story in featured if STORY_OUTCOMES.get(story.id) == "summary_deadline"}
+  if degraded:
+    print(f"Leaving {len(degraded)} deadline-cut stories unseen so the next run summarizes them.")
+  story_ids: List[str] = []
+  kept: Dict[str, str] = {}
+  for story in featured:
+    if story.id not in degraded:
+      story_ids.append(story.id)
+      story_ids += [alternate["id"] for alternate in story.alternates]
+      if story.id in signatures:
+        kept[story.id] = signatures[story.id]
+  return story_ids, kept
+
+
+def gather_stories(
+  sources: List[SourceConfig],
+  cutoff: datetime,
+  *,
+  collect_mode: str = COLLECT_MODE,
+  limit: int = MAX_FEATURED_STORIES,
+  workers: int = COLLECT_WORKERS,
+  backend: str = "threads",
+  seen: Optional[Mapping[str, Any]] = None,
+  recent: Optional[Mapping[str, str]] = None,
+  collected: Optional[Mapping[str, List[Story]]] = None,
+  on_source: Optional[Callable[[SourceConfig, List[Story]], None]] = None,
+) -> Tuple[List[Story], List[Story], Dict[str, str], int]:
+  """Collect and cluster candidates in the given collect mode.
+
+  Returns (every story extracted, clustered stories newest first, their signatures, stories
+  considered). `limit` only matters to the lazy merge, which stops once it has that many.
+  Links already featured are skipped before extraction, so "considered" counts unseen stories
+  only; latest.json files written before that change also counted the seen ones.
+  """
+  if collect_mode == "lazy":
+    return stream_stories(
+      sources,
+      cutoff,
+      limit=limit,
+      workers=workers,
+      backend=backend,
+      seen=seen,
+      recent=recent,
+      collected=collected,
+      on_source=on_source,
+    )
+  candidates, considered = collect_stories(
+    sources,
+    cutoff,
+    workers=workers,
+    backend=backend,
+    seen=seen,
+    collected=collected,
+    on_source=on_source,
+  )
+  stories, signatures = cluster_near_duplicates(candidates, recent)
+  return candidates, stories, signatures, considered
+
+
 def run(
   fetch_limit: Optional[int] = None,
   *,
@@ -769,21 +4153,85 @@ def run(
   dry_run: bool = False,
   now: Optional[datetime] = None,
   update_state: bool = True,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+  use_summary_cache: bool = True,
+  summary_workers: int = SUMMARY_WORKERS,
+  write_report: bool = True,
+  resume: bool = False,
+  budget_seconds: float = RUN_BUDGET_SECONDS,
+  collect_mode: str = COLLECT_MODE,
 ) -> int:
-  global DEBUG
+  global DEBUG, DEADLINE
   # DEBUG value will be set in main when args are parsed.
-  now = now or datetime.now(tz=UTC)
+  started_at = datetime.now(tz=UTC)
+  started = time.perf_counter()
+  reset_stats()
+  DEADLINE = RunDeadline(budget_seconds) if budget_seconds > 0 else None
   openai_api_key = os.environ.get("OPENAI_API_KEY")
   if not skip_openai and not openai_api_key:
     print("OPENAI_API_KEY is not set. Aborting.", file=sys.stderr)
     return 1
 
-  window_hours, _, sources = load_sources_config()
-  state = prune_state(load_state()) if not ignore_state else {"seen": {}, "last_run": None}
+  journal: Optional[RunJournal] = None
+  if resume:
+    journal = RunJournal.resume(JOURNAL_FILE)
+    if journal and not dry_run:
+      journal.repair()
+    if journal:
+      # The resumed run keeps the original clock and selection settings so its digest matches.
+      now = datetime.fromisoformat(journal.header["now"])
+      fetch_limit = journal.header.get("fetch_limit")
+      ignore_state = journal.header.get("ignore_state", ignore_state)
+      print(
+        f"Resuming run from {now.isoformat()}: {len(journal.sources)} sources collected, "
+        f"{len(journal.summaries)} summaries done.",
+      )
+    else:
+      print("No run journal to resume; starting a fresh run.")
+  elif JOURNAL_FILE.exists() and not dry_run:
+    print(f"Discarding the unfinished run journal at {JOURNAL_FILE} (pass --resume to continue it).")
+  now = now or started_at
+  if journal is None and not dry_run:
+    journal = RunJournal.start(
+      JOURNAL_FILE,
+      {"now": now.isoformat(), "fetch_limit": fetch_limit, "ignore_state": ignore_state},
+    )
+
+  with stage_timer("config"):
+    window_hours, _, sources = load_sources_config()
+    store = open_state_store(read_only=dry_run or not update_state)
+    if not ignore_state:
+      store.prune(datetime.now(tz=UTC) - timedelta(days=STATE_RETENTION_DAYS))
   cutoff = now - timedelta(hours=window_hours)
 
-  stories, considered = collect_stories(sources, cutoff)
-  seen = {} if ignore_state else state.get("seen", {})
+  seen: Mapping[str, str] = {} if ignore_state else store.seen()
+
+  open_http_cache(use_http_cache)
+  recent = {} if ignore_state else store.signatures()
+  if journal and journal.sources and not ignore_state:
+    # A run that died after saving state but before finishing its journal has already marked
+    # its own stories seen; the resume must still feature them.
+    own = journal.marked_seen(seen)
+    if own:
+      debug_log(f"Ignoring {len(own)} stories the interrupted run had already marked seen.")
+      seen = SeenExcept(seen, own)
+      recent = {story_id: signature for story_id, signature in recent.items() if story_id not in own}
+  with stage_timer("collect"):
+    collected, stories, signatures, considered = gather_stories(
+      sources,
+      cutoff,
+      collect_mode=collect_mode,
+      limit=min(MAX_FEATURED_STORIES, fetch_limit) if fetch_limit is not None else MAX_FEATURED_STORIES,
+      workers=collect_workers,
+      backend=fetch_backend,
+      seen=seen,
+      recent=recent,
+      collected=journal.sources if journal else None,
+      on_source=journal.record_source if journal and not dry_run else None,
+    )
+    save_fetch_caches()
   new_stories = select_new_stories(stories, seen)
   if fetch_limit is not None:
     new_stories = new_stories[:fetch_limit]
@@ -797,83 +4245,833 @@ def run(
     f"Fresh stories selected: {len(new_stories)} (limit={fetch_limit or MAX_FEATURED_STORIES}).",
   )
 
-  enriched_items: List[Dict[str, Any]] = []
-  client = None if skip_openai else OpenAI()
-  for story in new_stories:
-    debug_log(f"Summarizing story: {story.title} ({story.source_name})")
-    summary = summarize_without_openai(story) if skip_openai else safe_summarize(client, story)  # type: ignore[arg-type]
-    enriched_items.append(build_item_payload(story, summary))
+  with stage_timer("summarize"):
+    client = open_summarizer(skip_openai, use_summary_cache)
+    summaries = summarize_stories(
+      client,
+      new_stories,
+      workers=summary_workers,
+      completed=journal.summaries if journal else None,
+      on_summary=journal.record_summary if journal and not dry_run else None,
+    )
+    enriched_items = [build_item_payload(story, summary) for story, summary in zip(new_stories, summaries)]
+    if SUMMARY_CACHE:
+      SUMMARY_CACHE.save()
 
-  sentiment_score, sentiment_label, sentiment_rationale = compute_sentiment(enriched_items)
-  vibe = convert_sentiment_to_vibe(sentiment_score, sentiment_label, sentiment_rationale)
-  call_to_action = pick_call_to_action(enriched_items)
   generated_at = now
-
-  payload = {
-    "generated_at": generated_at.isoformat(),
-    "window_hours": window_hours,
-    "stories_considered": considered,
-    "stories_featured": len(enriched_items),
-    "headline": f"Kirkwood Pulse • {generated_at.strftime('%B %d, %Y')}",
-    "overview": aggregate_overview(enriched_items),
-    "items": enriched_items,
-    "vibe": vibe,
-    "sentiment": {
-      "score": sentiment_score,
-      "label": sentiment_label,
-      "rationale": sentiment_rationale,
-    },
-    "call_to_action": call_to_action,
-  }
+  payload = build_digest_payload(enriched_items, generated_at, window_hours, considered)
+  sentiment_score = payload["sentiment"]["score"]
 
   if dry_run:
+    store.close()
+    close_body_store()
     print("[dry-run] Skipping writes to latest.json, markdown, and state.")
+    print_run_stats()
     return 0
 
-  write_latest_json(payload)
-  write_markdown(payload, generated_at)
-  if update_state:
-    update_state_with_stories(state, new_stories, generated_at)
-    save_state(state)
+  with stage_timer("write"):
+    write_latest_json(payload)
+    write_markdown(payload, generated_at)
+    update_rollup([payload])
+    if update_state:
+      featured_ids, featured_signatures = seen_updates(new_stories, signatures)
+      store.mark_seen(featured_ids, generated_at, featured_signatures)
+      store.save()
+    store.close()
+    # Only now is everything the journal protected on disk.
+    if journal:
+      journal.finish()
 
   debug_log(f"Wrote latest.json with {len(enriched_items)} items and sentiment {sentiment_score}.")
+  if write_report:
+    report = build_run_report(
+      "daily",
+      started_at,
+      time.perf_counter() - started,
+      considered=considered,
+      candidates=collected,
+      featured=new_stories,
+      options={
+        "fetch_backend": fetch_backend,
+        "collect_mode": collect_mode,
+        "collect_workers": collect_workers,
+        "extract_workers": EXTRACT_WORKERS,
+        "summary_workers": summary_workers,
+        "openai": not skip_openai,
+        "http_cache": use_http_cache,
+        "summary_cache": use_summary_cache,
+        "fetch_limit": fetch_limit,
+        "budget_seconds": budget_seconds,
+      },
+      deadline=DEADLINE.report() if DEADLINE else None,
+    )
+    debug_log(f"Wrote run report {write_run_report(report)}.")
 
   print(
     f"Generated pulse with {len(enriched_items)} stories (considered {considered}) "
     f"and sentiment {sentiment_score}.",
   )
+  close_body_store()
+  print_run_stats()
+
+  return 0
+
+
+def item_published(item: Dict[str, Any]) -> datetime:
+  return parse_datetime(item.get("published")) or datetime.min.replace(tzinfo=UTC)
+
+
+class WatchDigest:
+  """Today's digest as a --watch process holds it: item payloads, newest first, merged as they arrive.
+
+  An item stays once it is published. It is already marked seen, so dropping it for a newer
+  story would take it out of latest.json and the MDX for good. The day's digest therefore
+  grows past MAX_FEATURED_STORIES, which instead caps how many new stories one poll adds.
+  It starts from latest.json when that file was written earlier the same (UTC) day, so a
+  restarted watcher picks up where the last one stopped; a new day starts empty, which
+  also starts that day's MDX file.
+  """
+
+  def __init__(self, day: date, items: Optional[List[Dict[str, Any]]] = None, considered: int = 0) -> None:
+    self.day = day
+    self.items = list(items or [])
+    self.considered = considered
+    self.counted: set[str] = set()
+
+  @classmethod
+  def load(cls, now: datetime) -> "WatchDigest":
+    try:
+      payload = json.loads(LATEST_JSON_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+      return cls(now.date())
+    generated_at = parse_datetime(payload.get("generated_at"))
+    if generated_at is None or generated_at.date() != now.date():
+      return cls(now.date())
+    return cls(now.date(), payload.get("items") or [], int(payload.get("stories_considered") or 0))
+
+  def count(self, stories: Iterable[Story]) -> None:
+    """Add stories to the considered total, once each however often their source is polled."""
+    for story in stories:
+      if story.id not in self.counted:
+        self.counted.add(story.id)
+        self.considered += 1
+
+  def merge(self, items: List[Dict[str, Any]]) -> None:
+    self.items = sorted(self.items + items, key=item_published, reverse=True)
+
+
+def watch_poll(
+  due: List[SourceConfig],
+  digest: WatchDigest,
+  store: StateStore,
+  client: Optional[OpenAI],
+  window_hours: int,
+  *,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  summary_workers: int = SUMMARY_WORKERS,
+  collect_mode: str = COLLECT_MODE,
+  write_report: bool = True,
+  options: Optional[Dict[str, Any]] = None,
+) -> WatchDigest:
+  """Poll the due sources once and add their fresh stories to today's digest.
+
+  Only the new stories are summarized. latest.json, the day's MDX and the seen state are
+  written only when the digest changed.
+  """
+  started_at = datetime.now(tz=UTC)
+  started = time.perf_counter()
+  reset_stats()
+  if started_at.date() != digest.day:
+    print(f"Starting the digest for {started_at.date().isoformat()}.")
+    digest = WatchDigest(started_at.date())
+    store.prune(started_at - timedelta(days=STATE_RETENTION_DAYS))
+  cutoff = started_at - timedelta(hours=window_hours)
+  seen = store.seen()
+
+  with stage_timer("collect"):
+    collected, stories, signatures, _ = gather_stories(
+      due,
+      cutoff,
+      collect_mode=collect_mode,
+      workers=collect_workers,
+      backend=fetch_backend,
+      seen=seen,
+      recent=store.signatures(),
+    )
+    save_fetch_caches()
+  digest.count(collected)
+  fresh = select_new_stories(stories, seen)
+  debug_log(f"Polled {len(due)} sources: {len(collected)} stories extracted, {len(fresh)} new to today's digest.")
+  if not fresh:
+    return digest
+
+  with stage_timer("summarize"):
+    summaries = summarize_stories(client, fresh, workers=summary_workers)
+    digest.merge([build_item_payload(story, summary) for story, summary in zip(fresh, summaries)])
+    if SUMMARY_CACHE:
+      SUMMARY_CACHE.save()
+
+  payload = build_digest_payload(digest.items, started_at, window_hours, digest.considered)
+  with stage_timer("write"):
+    write_latest_json(payload)
+    write_markdown(payload, started_at)
+    update_rollup([payload])
+    featured_ids, featured_signatures = seen_updates(fresh, signatures)
+    store.mark_seen(featured_ids, started_at, featured_signatures)
+    store.save()
+
+  if write_report:
+    report = build_run_report(
+      "watch",
+      started_at,
+      time.perf_counter() - started,
+      considered=len(collected),
+      candidates=collected,
+      featured=fresh,
+      options={**(options or {}), "sources_polled": [source.slug for source in due]},
+    )
+    debug_log(f"Wrote run report {write_run_report(report)}.")
+  print(
+    f"Added {len(fresh)} stories from {len(due)} polled sources; the {digest.day.isoformat()} digest "
+    f"now features {len(digest.items)}.",
+  )
+  print_run_stats()
+  return digest
+
+
+def run_watch(
+  *,
+  skip_openai: bool = False,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+  use_summary_cache: bool = True,
+  summary_workers: int = SUMMARY_WORKERS,
+  write_report: bool = True,
+  collect_mode: str = COLLECT_MODE,
+  polls: int = 0,
+) -> int:
+  """Keep running, polling each source every poll_minutes and merging new stories into today's digest.
+
+  The HTTP session (or, on the async backend, one event loop and client), fetch and summary
+  caches, OpenAI client and state store stay open between polls, so each poll only pays for
+  the requests it makes. Stops on Ctrl-C or SIGTERM, or
+  after `polls` polls when that is non-zero.
+  """
+  global DEADLINE, ASYNC_SESSION
+  if not skip_openai and not os.environ.get("OPENAI_API_KEY"):
+    print("OPENAI_API_KEY is not set. Aborting.", file=sys.stderr)
+    return 1
+  # Polls are small and run back to back; the daily run budget does not apply.
+  DEADLINE = None
+  stop = threading.Event()
+  if threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+  window_hours, _, sources = load_sources_config()
+  store = open_state_store()
+  open_http_cache(use_http_cache)
+  client = open_summarizer(skip_openai, use_summary_cache)
+  if fetch_backend == "async":
+    ASYNC_SESSION = AsyncSession()
+  digest = WatchDigest.load(datetime.now(tz=UTC))
+  options = {
+    "fetch_backend": fetch_backend,
+    "collect_mode": collect_mode,
+    "collect_workers": collect_workers,
+    "extract_workers": EXTRACT_WORKERS,
+    "summary_workers": summary_workers,
+    "openai": not skip_openai,
+    "http_cache": use_http_cache,
+    "summary_cache": use_summary_cache,
+  }
+  next_poll = {source.slug: 0.0 for source in sources}
+  intervals = sorted({source.poll_minutes for source in sources})
+  print(
+    f"Watching {len(sources)} sources (every {', '.join(f'{minutes:g}' for minutes in intervals)} min); "
+    f"today's digest holds {len(digest.items)} stories. Ctrl-C to stop.",
+  )
 
+  done = 0
+  try:
+    while not stop.is_set():
+      clock = time.monotonic()
+      due = [source for source in sources if next_poll[source.slug] <= clock]
+      if due:
+        for source in due:
+          next_poll[source.slug] = clock + source.poll_minutes * 60
+        try:
+          digest = watch_poll(
+            due,
+            digest,
+            store,
+            client,
+            window_hours,
+            collect_workers=collect_workers,
+            fetch_backend=fetch_backend,
+            summary_workers=summary_workers,
+            collect_mode=collect_mode,
+            write_report=write_report,
+            options=options,
+          )
+        except Exception as error:
+          # One bad poll should not take the watcher down; the sources are tried again next interval.
+          print(f"[warn] Poll of {', '.join(source.slug for source in due)} failed: {error}", file=sys.stderr)
+          if DEBUG:
+            traceback.print_exc()
+        finally:
+          close_body_store()
+        done += 1
+        if polls and done >= polls:
+          break
+      stop.wait(max(0.0, min(next_poll.values()) - time.monotonic()))
+  except KeyboardInterrupt:
+    pass
+  finally:
+    save_fetch_caches()
+    store.close()
+    if ASYNC_SESSION is not None:
+      ASYNC_SESSION.close()
+      ASYNC_SESSION = None
+  print(f"Stopped watching after {done} polls; today's digest features {len(digest.items)} stories.")
   return 0
 
 
+def backfill_run_times(days: int, base_date: Optional[date] = None) -> List[datetime]:
+  """Noon UTC for each of the last `days` days, oldest first."""
+  base_date = base_date or datetime.now(tz=UTC).date()
+  run_times: List[datetime] = []
+  for offset in range(days - 1, -1, -1):
+    day = base_date - timedelta(days=offset)
+    run_times.append(datetime(day.year, day.month, day.day, 12, 0, 0, tzinfo=UTC))
+  return run_times
+
+
+def crawl_backfill_pool(
+  sources: List[SourceConfig],
+  run_times: List[datetime],
+  window_hours: int,
+  *,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+) -> List[Story]:
+  """Crawl every source once with a window wide enough to cover all backfill days."""
+  earliest_cutoff = run_times[0] - timedelta(hours=window_hours)
+  # A per-day crawl kept up to max_items per source for each day; the shared pool keeps enough for all of them.
+  pool_sources = [replace(source, max_items=source.max_items * len(run_times)) for source in sources]
+  pool, _ = collect_stories(pool_sources, earliest_cutoff, workers=collect_workers, backend=fetch_backend)
+  return pool
+
+
+def partition_backfill_pool(
+  pool: List[Story],
+  sources: List[SourceConfig],
+  cutoff: datetime,
+  until: Optional[datetime],
+) -> Tuple[List[Story], int]:
+  """Stories published inside [cutoff, until], newest first, capped at max_items per source."""
+  limits = {source.slug: source.max_items for source in sources}
+  kept: Dict[str, int] = {}
+  stories: List[Story] = []
+  for story in pool:
+    if story.published < cutoff or (until is not None and story.published > until):
+      continue
+    if kept.get(story.source_slug, 0) >= limits.get(story.source_slug, 0):
+      continue
+    kept[story.source_slug] = kept.get(story.source_slug, 0) + 1
+    stories.append(story)
+  return stories, len(stories)
+
+
+def plan_backfill(
+  days: int,
+  *,
+  fetch_limit: Optional[int] = None,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+) -> Tuple[int, List[Tuple[datetime, List[Story], int]]]:
+  """Crawl once and return (window_hours, [(run_time, selected stories, considered), ...]) oldest first."""
+  window_hours, _, sources = load_sources_config()
+  run_times = backfill_run_times(days)
+  open_http_cache(use_http_cache)
+  with stage_timer("collect"):
+    pool = crawl_backfill_pool(
+      sources,
+      run_times,
+      window_hours,
+      collect_workers=collect_workers,
+      fetch_backend=fetch_backend,
+    )
+    save_fetch_caches()
+    pool, _ = cluster_near_duplicates(pool)
+
+  plan: List[Tuple[datetime, List[Story], int]] = []
+  for index, run_time in enumerate(run_times):
+    # The newest day is open-ended, like a regular run; earlier days stop at their own run time.
+    until = None if index == len(run_times) - 1 else run_time
+    stories, considered = partition_backfill_pool(pool, sources, run_time - timedelta(hours=window_hours), until)
+    selected = select_new_stories(stories, {})
+    if fetch_limit is not None:
+      selected = selected[:fetch_limit]
+    plan.append((run_time, selected, considered))
+  debug_log(f"Backfill pool holds {len(pool)} stories across {len(run_times)} days.")
+  return window_hours, plan
+
+
 def run_backfill(
   days: int,
   *,
   fetch_limit: Optional[int] = None,
   skip_openai: bool = False,
   dry_run: bool = False,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+  use_summary_cache: bool = True,
+  summary_workers: int = SUMMARY_WORKERS,
+  day_workers: int = 1,
+  write_report: bool = True,
 ) -> int:
   if days < 1:
     print("Backfill days must be at least 1.", file=sys.stderr)
     return 1
+  started_at = datetime.now(tz=UTC)
+  started = time.perf_counter()
+  reset_stats()
+  if not skip_openai and not os.environ.get("OPENAI_API_KEY"):
+    print("OPENAI_API_KEY is not set. Aborting.", file=sys.stderr)
+    return 1
 
-  base_date = datetime.now(tz=UTC).date()
-  for offset in range(days - 1, -1, -1):
-    day = base_date - timedelta(days=offset)
-    run_time = datetime(day.year, day.month, day.day, 12, 0, 0, tzinfo=UTC)
-    status = run(
+  window_hours, plan = plan_backfill(
+    days,
+    fetch_limit=fetch_limit,
+    collect_workers=collect_workers,
+    fetch_backend=fetch_backend,
+    use_http_cache=use_http_cache,
+  )
+
+  # Overlapping windows share stories; summarize each one once.
+  unique: Dict[str, Story] = {}
+  for _, selected, _ in plan:
+    for story in selected:
+      unique.setdefault(story.id, story)
+  with stage_timer("summarize"):
+    client = open_summarizer(skip_openai, use_summary_cache)
+    summaries = dict(zip(unique, summarize_stories(client, list(unique.values()), workers=summary_workers)))
+    if SUMMARY_CACHE:
+      SUMMARY_CACHE.save()
+
+  def build_day(day: Tuple[datetime, List[Story], int]) -> Dict[str, Any]:
+    run_time, selected, considered = day
+    items = [build_item_payload(story, summaries[story.id]) for story in selected]
+    payload = build_digest_payload(items, run_time, window_hours, considered)
+    if not dry_run:
+      write_markdown(payload, run_time)
+    return payload
+
+  with stage_timer("write"):
+    if day_workers > 1 and len(plan) > 1:
+      with ThreadPoolExecutor(max_workers=min(day_workers, len(plan)), thread_name_prefix="pulse-day") as executor:
+        payloads = list(executor.map(build_day, plan))
+    else:
+      payloads = [build_day(day) for day in plan]
+    if not dry_run:
+      write_latest_json(payloads[-1])
+      update_rollup(payloads)
+  for payload in payloads:
+    print(
+      f"Backfilled {payload['generated_at'][:10]} with {payload['stories_featured']} stories "
+      f"(considered {payload['stories_considered']}).",
+    )
+
+  if dry_run:
+    print("[dry-run] Skipping writes to latest.json and markdown.")
+  elif write_report:
+    report = build_run_report(
+      "backfill",
+      started_at,
+      time.perf_counter() - started,
+      considered=sum(considered for _, _, considered in plan),
+      candidates=list(unique.values()),
+      featured=list(unique.values()),
+      options={
+        "days": days,
+        "fetch_backend": fetch_backend,
+        "collect_workers": collect_workers,
+        "extract_workers": EXTRACT_WORKERS,
+        "summary_workers": summary_workers,
+        "day_workers": day_workers,
+        "openai": not skip_openai,
+        "http_cache": use_http_cache,
+        "summary_cache": use_summary_cache,
+        "fetch_limit": fetch_limit,
+      },
+    )
+    debug_log(f"Wrote run report {write_run_report(report)}.")
+  print(f"Backfilled {len(plan)} days from one crawl ({len(unique)} unique stories summarized).")
+  print_run_stats()
+  return 0
+
+
+def story_to_record(story: Story) -> Dict[str, Any]:
+  record = asdict(story)
+  del record["body"]
+  record["content"] = story.content
+  record["published"] = story.published.isoformat()
+  return record
+
+
+def story_from_record(record: Dict[str, Any]) -> Story:
+  record = dict(record)
+  body = store_body(record.pop("content"))
+  return Story(**{**record, "body": body, "published": datetime.fromisoformat(record["published"])})
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+  if not path.exists():
+    return []
+  records: List[Dict[str, Any]] = []
+  with path.open("r", encoding="utf-8") as handle:
+    for line in handle:
+      line = line.strip()
+      if not line:
+        continue
+      try:
+        records.append(json.loads(line))
+      except json.JSONDecodeError:
+        # A torn final line from an interrupted append; everything before it is intact.
+        continue
+  return records
+
+
+def append_jsonl(path: Path, records: Iterable[Dict[str, Any]]) -> None:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with path.open("a", encoding="utf-8") as handle:
+    for record in records:
+      handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+def load_batch_manifest(job_dir: Path) -> Optional[Dict[str, Any]]:
+  manifest_file = job_dir / "manifest.json"
+  if not manifest_file.exists():
+    return None
+  with manifest_file.open("r", encoding="utf-8") as handle:
+    return json.load(handle)
+
+
+def save_batch_manifest(job_dir: Path, manifest: Dict[str, Any]) -> None:
+  atomic_write_text(job_dir / "manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+
+
+def response_body_text(body: Dict[str, Any]) -> Optional[str]:
+  """Pull the model's text out of a Responses API body as it appears in batch output files."""
+  if body.get("output_text"):
+    return body["output_text"]
+  for block in body.get("output") or []:
+    for segment in block.get("content") or []:
+      if segment.get("text"):
+        return segment["text"]
+  return None
+
+
+def batch_prepare(
+  job_dir: Path,
+  days: int,
+  *,
+  fetch_limit: Optional[int] = None,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+  use_summary_cache: bool = True,
+) -> int:
+  if load_batch_manifest(job_dir):
+    print(f"Batch job {job_dir.name} is already prepared; resuming.")
+    return 0
+
+  window_hours, plan = plan_backfill(
+    days,
+    fetch_limit=fetch_limit,
+    collect_workers=collect_workers,
+    fetch_backend=fetch_backend,
+    use_http_cache=use_http_cache,
+  )
+  stories_by_id: Dict[str, Story] = {}
+  day_records: List[Dict[str, Any]] = []
+  for run_time, selected, considered in plan:
+    day_records.append(
+      {
+        "generated_at": run_time.isoformat(),
+        "window_hours": window_hours,
+        "considered": considered,
+        "story_ids": [story.id for story in selected],
+      }
+    )
+    for story in selected:
+      stories_by_id.setdefault(story.id, story)
+
+  # Summaries we already paid for go straight into the results file instead of the job.
+  summary_cache = open_summary_cache(use_summary_cache)
+  requests_out: List[Dict[str, Any]] = []
+  results_out: List[Dict[str, Any]] = []
+  for story in stories_by_id.values():
+    cached = summary_cache.get(story) if summary_cache else None
+    if cached:
+      results_out.append({"custom_id": story.id, "summary": asdict(cached)})
+    else:
+      requests_out.append(
+        {"custom_id": story.id, "method": "POST", "url": "/v1/responses", "body": summary_request_body(story)}
+      )
+    release_article_prompt(story)
+
+  job_dir.mkdir(parents=True, exist_ok=True)
+  for name in ("stories.jsonl", "requests.jsonl", "results.jsonl"):
+    (job_dir / name).unlink(missing_ok=True)
+  append_jsonl(job_dir / "stories.jsonl", (story_to_record(story) for story in stories_by_id.values()))
+  append_jsonl(job_dir / "requests.jsonl", requests_out)
+  append_jsonl(job_dir / "results.jsonl", results_out)
+  save_batch_manifest(
+    job_dir,
+    {
+      "job_id": job_dir.name,
+      "created_at": datetime.now(tz=UTC).isoformat(),
+      "model": OPENAI_MODEL,
+      "days": day_records,
+      "batches": [],
+    },
+  )
+  print(
+    f"Prepared batch job {job_dir.name}: {len(day_records)} days, {len(stories_by_id)} stories, "
+    f"{len(requests_out)} requests ({len(results_out)} already cached).",
+  )
+  return 0
+
+
+def collect_batch_output(client: OpenAI, batch: Any, stories: Dict[str, Story]) -> List[Dict[str, Any]]:
+  if not getattr(batch, "output_file_id", None):
+    return []
+  raw = client.files.content(batch.output_file_id).text
+  results: List[Dict[str, Any]] = []
+  for line in raw.splitlines():
+    if not line.strip():
+      continue
+    record = json.loads(line)
+    story = stories.get(record.get("custom_id", ""))
+    response = record.get("response") or {}
+    if story is None or record.get("error") or response.get("status_code") != 200:
+      continue
+    text = response_body_text(response.get("body") or {})
+    if not text:
+      continue
+    try:
+      summary = parse_summary_payload(text, story)
+    except (ValueError, TypeError) as error:
+      print(f"[warn] Unusable batch result for {story.title}: {error}", file=sys.stderr)
+      continue
+    results.append({"custom_id": story.id, "summary": asdict(summary)})
+  return results
+
+
+def find_batch_for_file(client: OpenAI, input_file_id: str) -> Optional[Any]:
+  """The batch already created from an uploaded request file, if any."""
+  for batch in client.batches.list(limit=100):
+    if batch.input_file_id == input_file_id:
+      return batch
+  return None
+
+
+def batch_submit(job_dir: Path, client: OpenAI, *, poll_seconds: int = BATCH_POLL_SECONDS) -> int:
+  """Submit outstanding requests and poll until every request has a result or we give up.
+
+  Progress lives in manifest.json and results.jsonl, so an interrupted call picks up the
+  in-flight batch instead of submitting it again, and only requests without a result are
+  ever resubmitted. The uploaded request file is recorded before its batch is created, and
+  a run that finds such an entry without a batch id looks the batch up before creating one.
+  """
+  manifest = load_batch_manifest(job_dir)
+  if manifest is None:
+    print(f"No prepared batch job at {job_dir}.", file=sys.stderr)
+    return 1
+  stories = {record["id"]: story_from_record(record) for record in read_jsonl(job_dir / "stories.jsonl")}
+  summary_cache = SUMMARY_CACHE
+
+  while True:
+    done = {record["custom_id"] for record in read_jsonl(job_dir / "results.jsonl")}
+    active = next((entry for entry in manifest["batches"] if not entry.get("collected")), None)
+    if active is None:
+      pending = [record for record in read_jsonl(job_dir / "requests.jsonl") if record["custom_id"] not in done]
+      if not pending:
+        print(f"Batch job {job_dir.name}: all {len(done)} summaries collected.")
+        return 0
+      if len(manifest["batches"]) >= BATCH_MAX_SUBMISSIONS:
+        print(
+          f"[warn] Batch job {job_dir.name}: {len(pending)} requests still failing after "
+          f"{BATCH_MAX_SUBMISSIONS} submissions; materialize will fall back to excerpts.",
+          file=sys.stderr,
+        )
+        return 0
+      body = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in pending).encode("utf-8")
+      upload = client.files.create(file=(f"{job_dir.name}-{len(manifest['batches']) + 1}.jsonl", body), purpose="batch")
+      # Recorded before the batch exists, so a crash after batches.create can still find it.
+      active = {"id": None, "input_file_id": upload.id, "requests": len(pending), "status": "uploaded"}
+      manifest["batches"].append(active)
+      save_batch_manifest(job_dir, manifest)
+
+    if not active.get("id"):
+      batch = find_batch_for_file(client, active["input_file_id"])
+      if batch is None:
+        batch = client.batches.create(input_file_id=active["input_file_id"], endpoint="/v1/responses", completion_window="24h")
+        print(f"Submitted batch {batch.id} with {active['requests']} requests.")
+      else:
+        print(f"Found batch {batch.id} submitted by an interrupted run; polling it.")
+      active.update(id=batch.id, status=batch.status, submitted_at=datetime.now(tz=UTC).isoformat())
+      save_batch_manifest(job_dir, manifest)
+
+    batch = client.batches.retrieve(active["id"])
+    active["status"] = batch.status
+    if batch.status not in BATCH_TERMINAL_STATUSES:
+      save_batch_manifest(job_dir, manifest)
+      debug_log(f"Batch {batch.id} is {batch.status}; polling again in {poll_seconds}s.")
+      time.sleep(poll_seconds)
+      continue
+
+    results = [record for record in collect_batch_output(client, batch, stories) if record["custom_id"] not in done]
+    append_jsonl(job_dir / "results.jsonl", results)
+    if summary_cache:
+      for record in results:
+        summary_cache.put(stories[record["custom_id"]], StorySummary(**record["summary"]))
+      summary_cache.save()
+    active["collected"] = True
+    active["succeeded"] = len(results)
+    active["finished_at"] = datetime.now(tz=UTC).isoformat()
+    save_batch_manifest(job_dir, manifest)
+    print(f"Batch {batch.id} {batch.status}: {len(results)} of {active['requests']} summaries collected.")
+
+
+def batch_materialize(job_dir: Path, *, dry_run: bool = False) -> int:
+  manifest = load_batch_manifest(job_dir)
+  if manifest is None:
+    print(f"No prepared batch job at {job_dir}.", file=sys.stderr)
+    return 1
+  stories = {record["id"]: story_from_record(record) for record in read_jsonl(job_dir / "stories.jsonl")}
+  summaries = {record["custom_id"]: StorySummary(**record["summary"]) for record in read_jsonl(job_dir / "results.jsonl")}
+
+  missing = 0
+  written: List[Dict[str, Any]] = []
+  days = manifest["days"]
+  for index, day in enumerate(days):
+    generated_at = datetime.fromisoformat(day["generated_at"])
+    enriched_items: List[Dict[str, Any]] = []
+    for story_id in day["story_ids"]:
+      story = stories[story_id]
+      summary = summaries.get(story_id)
+      if summary is None:
+        missing += 1
+        summary = fallback_summary(story)
+      enriched_items.append(build_item_payload(story, summary))
+    payload = build_digest_payload(enriched_items, generated_at, day["window_hours"], day["considered"])
+    if dry_run:
+      continue
+    write_markdown(payload, generated_at)
+    written.append(payload)
+    if index == len(days) - 1:
+      write_latest_json(payload)
+    print(f"Materialized {generated_at.date()} with {len(enriched_items)} stories.")
+
+  if missing:
+    print(f"[warn] {missing} story slots had no batch result and use excerpt summaries.", file=sys.stderr)
+  if dry_run:
+    print("[dry-run] Skipping writes to latest.json and markdown.")
+  else:
+    update_rollup(written)
+    manifest["materialized_at"] = datetime.now(tz=UTC).isoformat()
+    save_batch_manifest(job_dir, manifest)
+  return 0
+
+
+def run_batch_backfill(
+  days: int,
+  *,
+  step: str = "all",
+  job_dir: Optional[Path] = None,
+  fetch_limit: Optional[int] = None,
+  dry_run: bool = False,
+  collect_workers: int = COLLECT_WORKERS,
+  fetch_backend: str = "threads",
+  use_http_cache: bool = True,
+  use_summary_cache: bool = True,
+  poll_seconds: int = BATCH_POLL_SECONDS,
+) -> int:
+  """Backfill through the Batch API: prepare a JSONL job, submit/poll it, then write the days."""
+  job_dir = job_dir or BATCH_DIR / f"backfill-{datetime.now(tz=UTC).date().isoformat()}-{days}d"
+  if days < 1 and load_batch_manifest(job_dir) is None:
+    print("Backfill days must be at least 1 to prepare a new batch job.", file=sys.stderr)
+    return 1
+
+  if step in ("prepare", "all"):
+    status = batch_prepare(
+      job_dir,
+      days,
       fetch_limit=fetch_limit,
-      skip_openai=skip_openai,
-      ignore_state=True,
-      dry_run=dry_run,
-      now=run_time,
-      update_state=False,
+      collect_workers=collect_workers,
+      fetch_backend=fetch_backend,
+      use_http_cache=use_http_cache,
+      use_summary_cache=use_summary_cache,
     )
     if status != 0:
       return status
+
+  if step in ("submit", "all"):
+    if not os.environ.get("OPENAI_API_KEY"):
+      print("OPENAI_API_KEY is not set. Aborting.", file=sys.stderr)
+      return 1
+    from openai import OpenAI
+
+    open_summary_cache(use_summary_cache)
+    status = batch_submit(job_dir, OpenAI(), poll_seconds=poll_seconds)
+    if status != 0:
+      return status
+
+  if step in ("materialize", "all"):
+    return batch_materialize(job_dir, dry_run=dry_run)
   return 0
 
 
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+def import_profile(argv: List[str], top: int = 15) -> int:
+  """Run this command again under `python -X importtime` and print what each package cost to import.
+
+  Only imports made by the script itself (or by interpreter startup) are counted, each with
+  everything it pulled in, and summed per top-level package. The rest of the child's stderr
+  passes through.
+  """
+  command = [sys.executable, "-X", "importtime", str(Path(__file__).resolve()), *argv]
+  result = subprocess.run(command, stderr=subprocess.PIPE, text=True)
+  costs: Counter[str] = Counter()
+  for line in result.stderr.splitlines():
+    match = IMPORT_TIME_LINE.match(line)
+    if match is None:
+      if not line.startswith("import time: self"):
+        print(line, file=sys.stderr)
+      continue
+    # One space of indent marks a direct import; nested imports are already in its cumulative time.
+    if len(match.group(3)) == 1:
+      costs[match.group(4).split(".")[0]] += int(match.group(2))
+  total = sum(costs.values())
+  print(f"Import profile: {total / 1000:.1f} ms in {len(costs)} top-level imports (python -X importtime).")
+  for name, micros in costs.most_common(top):
+    print(f"  {micros / 1000:8.1f} ms  {micros / max(1, total):6.1%}  {name}")
+  skipped = [name for name in LAZY_IMPORTS if name not in costs]
+  if skipped:
+    print(f"  not imported: {', '.join(skipped)}")
+  return result.returncode
+
+
 def parse_args(argv: List[str]) -> argparse.Namespace:
   parser = argparse.ArgumentParser(description="Generate the Kirkwood Pulse daily digest.")
   parser.add_argument("--limit", type=int, default=None, help="Limit the number of stories summarized.")
@@ -893,37 +5091,344 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     default=None,
     help="Regenerate and overwrite the last N days of pulse entries (latest.json ends on the most recent day).",
   )
+  parser.add_argument(
+    "--backfill-workers",
+    type=int,
+    default=1,
+    help="Backfill days to build and write in parallel once the shared crawl is done.",
+  )
+  parser.add_argument(
+    "--batch",
+    action="store_true",
+    help="With --backfill-days, summarize through the OpenAI Batch API (resumable job under data/batches).",
+  )
+  parser.add_argument(
+    "--batch-step",
+    choices=BATCH_STEPS,
+    default="all",
+    help="Run one batch stage: prepare the JSONL job, submit and poll it, or materialize the day files.",
+  )
+  parser.add_argument(
+    "--batch-dir",
+    type=Path,
+    default=None,
+    help="Batch job directory to create or resume (default data/batches/backfill-<date>-<N>d).",
+  )
+  parser.add_argument(
+    "--batch-poll-seconds",
+    type=int,
+    default=BATCH_POLL_SECONDS,
+    help=f"Seconds between batch status checks (default {BATCH_POLL_SECONDS}, env PULSE_BATCH_POLL_SECONDS).",
+  )
   parser.add_argument(
     "--dry-run",
     action="store_true",
     help="Fetch and summarize but do not write latest.json/markdown or update state.",
   )
+  parser.add_argument(
+    "--workers",
+    type=int,
+    default=COLLECT_WORKERS,
+    help=f"Number of sources to collect concurrently (default {COLLECT_WORKERS}, env PULSE_COLLECT_WORKERS).",
+  )
+  parser.add_argument(
+    "--extract-workers",
+    type=int,
+    default=EXTRACT_WORKERS,
+    help=f"Article extractions to run concurrently across all sources (default {EXTRACT_WORKERS}, env PULSE_EXTRACT_WORKERS).",
+  )
+  parser.add_argument(
+    "--per-host",
+    type=int,
+    default=PER_HOST_LIMIT,
+    help=f"Maximum simultaneous requests to any one host (default {PER_HOST_LIMIT}, env PULSE_PER_HOST_LIMIT).",
+  )
+  parser.add_argument(
+    "--fetch-backend",
+    choices=FETCH_BACKENDS,
+    default="threads",
+    help="I/O engine for feeds, listing pages and articles: thread pools (default) or a single asyncio event loop.",
+  )
+  parser.add_argument(
+    "--max-connections",
+    type=int,
+    default=MAX_CONNECTIONS,
+    help=f"Global cap on open connections for the async backend (default {MAX_CONNECTIONS}, env PULSE_MAX_CONNECTIONS).",
+  )
+  archive_group = parser.add_mutually_exclusive_group()
+  archive_group.add_argument(
+    "--record",
+    type=Path,
+    default=None,
+    metavar="ARCHIVE",
+    help="Append every fetched feed, listing page and article to a compressed response archive.",
+  )
+  archive_group.add_argument(
+    "--replay",
+    type=Path,
+    default=None,
+    metavar="ARCHIVE",
+    help=(
+      "Serve every fetch from a recorded archive with no network access. Needs --dry-run; implies "
+      "--no-openai, --ignore-state and --no-extract-cache."
+    ),
+  )
+  parser.add_argument(
+    "--no-http-cache",
+    action="store_true",
+    help="Bypass the conditional-request cache in data/cache/http and download every page in full.",
+  )
+  parser.add_argument(
+    "--summary-workers",
+    type=int,
+    default=SUMMARY_WORKERS,
+    help=f"Stories to summarize concurrently (default {SUMMARY_WORKERS}, env PULSE_SUMMARY_WORKERS).",
+  )
+  parser.add_argument(
+    "--openai-rpm",
+    type=int,
+    default=OPENAI_RPM,
+    help=f"Requests per minute allowed across all summary workers (default {OPENAI_RPM}, env PULSE_OPENAI_RPM).",
+  )
+  parser.add_argument(
+    "--openai-tpm",
+    type=int,
+    default=OPENAI_TPM,
+    help=f"Estimated tokens per minute allowed across all summary workers (default {OPENAI_TPM}, env PULSE_OPENAI_TPM).",
+  )
+  parser.add_argument(
+    "--listing-parser",
+    choices=LISTING_PARSERS,
+    default=LISTING_PARSER,
+    help=f"How HTML listing pages are scanned for links (default {LISTING_PARSER}, env PULSE_LISTING_PARSER); bs4 is the old full-tree parse.",
+  )
+  parser.add_argument(
+    "--no-extract-cache",
+    action="store_true",
+    help="Re-run trafilatura on every article instead of reusing extractions from data/cache/extracted.",
+  )
+  parser.add_argument(
+    "--no-summary-cache",
+    action="store_true",
+    help="Call OpenAI for every story instead of reusing summaries from data/cache/summaries.json.",
+  )
+  parser.add_argument(
+    "--clear-summary-cache",
+    action="store_true",
+    help="Delete the summary cache before running.",
+  )
+  parser.add_argument(
+    "--state-backend",
+    choices=STATE_BACKENDS,
+    default=STATE_BACKEND,
+    help=f"Where seen-story state lives: sqlite ({STATE_DB_FILE.name}) or json ({STATE_FILE.name}) (default {STATE_BACKEND}, env PULSE_STATE_BACKEND).",
+  )
+  parser.add_argument(
+    "--export-state",
+    type=Path,
+    default=None,
+    metavar="PATH",
+    help="Write the current state in the pulse_state.json format to PATH and exit.",
+  )
+  parser.add_argument(
+    "--rebuild-index",
+    action="store_true",
+    help=(
+      "Rebuild the rollup index in content/_index/pulse from every pulse MDX file and exit "
+      "(with --dry-run, only parse and report)."
+    ),
+  )
+  parser.add_argument(
+    "--index-workers",
+    type=int,
+    default=INDEX_WORKERS,
+    metavar="N",
+    help=f"Processes that parse MDX files for --rebuild-index (default {INDEX_WORKERS}, env PULSE_INDEX_WORKERS).",
+  )
+  parser.add_argument(
+    "--resume",
+    action="store_true",
+    help=f"Continue an interrupted run from its journal ({JOURNAL_FILE.name}), skipping finished sources and summaries.",
+  )
+  parser.add_argument(
+    "--collect-mode",
+    choices=COLLECT_MODES,
+    default=COLLECT_MODE,
+    help=(
+      f"How a daily run reads articles (default {COLLECT_MODE}, env PULSE_COLLECT_MODE): lazy merges sources "
+      "newest first and stops once enough fresh stories are found; eager extracts every candidate first."
+    ),
+  )
+  parser.add_argument(
+    "--budget",
+    type=float,
+    default=RUN_BUDGET_SECONDS,
+    help=(
+      "Wall-clock budget in seconds for a daily run (0 disables). Sources that run out of their "
+      "share are skipped or cut short, and late summaries fall back to excerpts."
+    ),
+  )
+  parser.add_argument(
+    "--watch",
+    action="store_true",
+    help=(
+      "Keep running and poll each source every poll_minutes (sources.yml, default "
+      f"{POLL_MINUTES:g}, env PULSE_POLL_MINUTES), merging new stories into today's digest as they arrive."
+    ),
+  )
+  parser.add_argument(
+    "--watch-polls",
+    type=int,
+    default=0,
+    metavar="N",
+    help="With --watch, stop after N polls instead of running until interrupted.",
+  )
+  parser.add_argument(
+    "--no-report",
+    action="store_true",
+    help="Skip writing the per-run metrics report to content/_reports.",
+  )
+  parser.add_argument(
+    "--serial",
+    action="store_true",
+    help="Collect, extract and summarize one item at a time (same as --workers 1 --extract-workers 1 --summary-workers 1).",
+  )
+  parser.add_argument(
+    "--import-profile",
+    action="store_true",
+    help="Run the rest of the command under `python -X importtime` and print the import cost of each package.",
+  )
   parser.add_argument(
     "--debug",
     action="store_true",
     help="Print detailed progress information while fetching and summarizing stories.",
   )
-  return parser.parse_args(argv)
+  args = parser.parse_args(argv)
+  # argparse only checks `choices` for values given on the command line, not for defaults
+  # taken from the environment.
+  for option, variable, choices in (
+    ("listing_parser", "PULSE_LISTING_PARSER", LISTING_PARSERS),
+    ("state_backend", "PULSE_STATE_BACKEND", STATE_BACKENDS),
+    ("collect_mode", "PULSE_COLLECT_MODE", COLLECT_MODES),
+  ):
+    if getattr(args, option) not in choices:
+      parser.error(f"{variable}={getattr(args, option)!r} is not one of {', '.join(choices)}.")
+  return args
 
 
 def main(argv: List[str]) -> int:
   args = parse_args(argv)
-  global DEBUG
+  if args.import_profile:
+    return import_profile([arg for arg in argv if arg != "--import-profile"])
+  global DEBUG, EXTRACT_WORKERS, PER_HOST_LIMIT, MAX_CONNECTIONS, RATE_LIMITER, EXTRACT_CACHE_ENABLED, STATE_BACKEND
+  global LISTING_PARSER
   DEBUG = args.debug
+  LISTING_PARSER = args.listing_parser
+  STATE_BACKEND = args.state_backend
+  EXTRACT_CACHE_ENABLED = not args.no_extract_cache
+  EXTRACT_WORKERS = 1 if args.serial else max(1, args.extract_workers)
+  PER_HOST_LIMIT = max(1, args.per_host)
+  MAX_CONNECTIONS = max(1, args.max_connections)
+  RATE_LIMITER = RateLimiter(args.openai_rpm, args.openai_tpm)
   if DEBUG:
     debug_log("Debug logging enabled.")
+  collect_workers = 1 if args.serial else max(1, args.workers)
+  summary_workers = 1 if args.serial else max(1, args.summary_workers)
+  now = None
+  if args.record:
+    open_response_archive(args.record, replaying=False)
+  elif args.replay:
+    if not args.dry_run:
+      # A replay's excerpt-only digest must never replace the published one or touch seen state.
+      print("--replay needs --dry-run.", file=sys.stderr)
+      return 1
+    archive = open_response_archive(args.replay, replaying=True)
+    # Replays are offline end to end and evaluate the window as of the recording, against no
+    # seen state: stories featured since the recording would otherwise drop out. Every
+    # article is extracted afresh, so the replay reproduces (and times) that step too.
+    args.no_openai = True
+    args.no_http_cache = True
+    args.ignore_state = True
+    EXTRACT_CACHE_ENABLED = False
+    now = archive.recorded_at
+    print(f"Replaying {len(archive.index)} recorded responses from {args.replay}.")
+  if args.export_state:
+    store = open_state_store(read_only=True)
+    state = store.export()
+    store.close()
+    save_state(state, args.export_state)
+    print(f"Exported {len(state['seen'])} seen stories to {args.export_state}.")
+    return 0
+  if args.rebuild_index:
+    started = time.perf_counter()
+    days, _ = rebuild_rollup(max(1, args.index_workers), dry_run=args.dry_run)
+    stories = sum(entry["stories_featured"] for entry in days.values())
+    verb = "Parsed" if args.dry_run else "Rebuilt the rollup index from"
+    print(f"{verb} {len(days)} digests ({stories} stories) in {time.perf_counter() - started:.2f}s.")
+    return 0
+  if args.clear_summary_cache:
+    open_summary_cache(False, clear=True)
+    print(f"Cleared summary cache at {SUMMARY_CACHE_FILE}.")
+  if args.watch:
+    if args.batch or args.backfill_days or args.dry_run or args.resume or args.replay:
+      print("--watch cannot be combined with --batch, --backfill-days, --dry-run, --resume or --replay.", file=sys.stderr)
+      return 1
+    return run_watch(
+      skip_openai=args.no_openai,
+      collect_workers=collect_workers,
+      fetch_backend=args.fetch_backend,
+      use_http_cache=not args.no_http_cache,
+      use_summary_cache=not args.no_summary_cache,
+      summary_workers=summary_workers,
+      write_report=not args.no_report,
+      collect_mode=args.collect_mode,
+      polls=max(0, args.watch_polls),
+    )
+  if args.batch:
+    if not args.backfill_days and args.batch_dir is None:
+      print("--batch needs --backfill-days (or --batch-dir to resume a job).", file=sys.stderr)
+      return 1
+    return run_batch_backfill(
+      args.backfill_days or 0,
+      step=args.batch_step,
+      job_dir=args.batch_dir,
+      fetch_limit=args.limit,
+      dry_run=args.dry_run,
+      collect_workers=collect_workers,
+      fetch_backend=args.fetch_backend,
+      use_http_cache=not args.no_http_cache,
+      use_summary_cache=not args.no_summary_cache,
+      poll_seconds=args.batch_poll_seconds,
+    )
   if args.backfill_days:
     return run_backfill(
       args.backfill_days,
       fetch_limit=args.limit,
       skip_openai=args.no_openai,
       dry_run=args.dry_run,
+      collect_workers=collect_workers,
+      fetch_backend=args.fetch_backend,
+      use_http_cache=not args.no_http_cache,
+      use_summary_cache=not args.no_summary_cache,
+      summary_workers=summary_workers,
+      day_workers=max(1, args.backfill_workers),
+      write_report=not args.no_report,
     )
   return run(
     fetch_limit=args.limit,
     skip_openai=args.no_openai,
     ignore_state=args.ignore_state,
     dry_run=args.dry_run,
+    collect_workers=collect_workers,
+    fetch_backend=args.fetch_backend,
+    use_http_cache=not args.no_http_cache,
+    use_summary_cache=not args.no_summary_cache,
+    summary_workers=summary_workers,
+    now=now,
+    write_report=not args.no_report,
+    resume=args.resume,
+    budget_seconds=args.budget,
+    collect_mode=args.collect_mode,
   )
 
 
@@ -0,0 +1,61 @@
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import fetch_pulse  # noqa: E402
+
+VOCABULARY = (
+  "kirkwood council budget library parks stormwater argonne drive residents school board "
+  "farmers market station plaza zoning permit hearing bond transit sidewalk trees festival "
+  "police fire district tax levy meeting vote approved delayed proposal neighbors downtown"
+).split()
+
+
+@pytest.fixture
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  """Point every file fetch_pulse reads or writes into a throwaway tree."""
+  data = tmp_path / "data"
+  content = tmp_path / "content"
+  monkeypatch.setattr(fetch_pulse, "STATE_FILE", data / "pulse_state.json")
+  monkeypatch.setattr(fetch_pulse, "STATE_DB_FILE", data / "pulse_state.sqlite3")
+  monkeypatch.setattr(fetch_pulse, "JOURNAL_FILE", data / "pulse_journal.jsonl")
+  monkeypatch.setattr(fetch_pulse, "CACHE_DIR", data / "cache")
+  monkeypatch.setattr(fetch_pulse, "HTTP_CACHE_DIR", data / "cache" / "http")
+  monkeypatch.setattr(fetch_pulse, "EXTRACT_CACHE_DIR", data / "cache" / "extracted")
+  monkeypatch.setattr(fetch_pulse, "SUMMARY_CACHE_FILE", data / "cache" / "summaries.json")
+  monkeypatch.setattr(fetch_pulse, "BATCH_DIR", data / "batches")
+  monkeypatch.setattr(fetch_pulse, "LATEST_JSON_FILE", content / "pulse" / "latest.json")
+  monkeypatch.setattr(fetch_pulse, "MARKDOWN_DIR", content / "pulse")
+  monkeypatch.setattr(fetch_pulse, "REPORTS_DIR", content / "_reports")
+  monkeypatch.setattr(fetch_pulse, "REPORT_INDEX_FILE", content / "_reports" / "index.json")
+  monkeypatch.setattr(fetch_pulse, "ROLLUP_DIR", content / "_index" / "pulse")
+  monkeypatch.setattr(fetch_pulse, "ROLLUP_SUMMARY_FILE", content / "_index" / "pulse" / "summary.json")
+  return tmp_path
+
+
+def article_text(seed: str, words: int = 150) -> str:
+  """Deterministic filler prose: distinct per seed, identical across runs."""
+  rng = random.Random(seed)
+  return " ".join(rng.choice(VOCABULARY) for _ in range(words)) + "."
+
+
+def make_story(slug: str, index: int, published: datetime, text: str) -> fetch_pulse.Story:
+  url = f"https://{slug}.example/news/{index}"
+  return fetch_pulse.Story(
+    id=fetch_pulse.create_story_id(slug, url),
+    source_slug=slug,
+    source_name=slug.title(),
+    title=f"{slug} story {index}",
+    url=url,
+    published=published,
+    excerpt=text[:80],
+    body=text,
+    tags=[],
+    signature=fetch_pulse.minhash_signature(text),
+  )
@@ -0,0 +1,92 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+from conftest import article_text, make_story
+
+import fetch_pulse
+from fake_openai_server import start_server
+from fetch_pulse import append_jsonl, batch_submit, load_batch_manifest, save_batch_manifest, story_to_record, summary_request_body
+
+NOW = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+
+
+class Crash(Exception):
+  pass
+
+
+@pytest.fixture
+def openai_client(monkeypatch):
+  from openai import OpenAI
+
+  server, state = start_server(0, batch_seconds=0)
+  monkeypatch.setattr(fetch_pulse, "SUMMARY_CACHE", None)
+  yield OpenAI(api_key="test", base_url=f"http://127.0.0.1:{server.server_port}/v1", max_retries=0), state
+  server.shutdown()
+
+
+def prepared_job(tmp_path, count=3):
+  job_dir = tmp_path / "job"
+  job_dir.mkdir()
+  stories = [make_story("kirkwood-times", index, NOW, article_text(f"story {index}")) for index in range(count)]
+  append_jsonl(job_dir / "stories.jsonl", [story_to_record(story) for story in stories])
+  append_jsonl(
+    job_dir / "requests.jsonl",
+    [
+      {"custom_id": story.id, "method": "POST", "url": "/v1/responses", "body": summary_request_body(story)}
+      for story in stories
+    ],
+  )
+  (job_dir / "results.jsonl").touch()
+  save_batch_manifest(job_dir, {"job_id": "job", "days": [], "batches": []})
+  return job_dir
+
+
+def test_submit_collects_every_result(tmp_path, openai_client):
+  client, state = openai_client
+  job_dir = prepared_job(tmp_path)
+  assert batch_submit(job_dir, client, poll_seconds=0) == 0
+  assert len(fetch_pulse.read_jsonl(job_dir / "results.jsonl")) == 3
+  assert state.request_counts["batches.create"] == 1
+
+
+def test_crash_after_batch_create_does_not_submit_twice(tmp_path, openai_client, monkeypatch):
+  client, state = openai_client
+  job_dir = prepared_job(tmp_path)
+  create = client.batches.create
+
+  def create_then_crash(**kwargs):
+    create(**kwargs)
+    raise Crash()
+
+  monkeypatch.setattr(client.batches, "create", create_then_crash)
+  with pytest.raises(Crash):
+    batch_submit(job_dir, client, poll_seconds=0)
+  manifest = load_batch_manifest(job_dir)
+  assert [entry["id"] for entry in manifest["batches"]] == [None]
+  assert manifest["batches"][0]["input_file_id"]
+
+  monkeypatch.setattr(client.batches, "create", create)
+  assert batch_submit(job_dir, client, poll_seconds=0) == 0
+  assert state.request_counts["batches.create"] == 1
+  assert len(fetch_pulse.read_jsonl(job_dir / "results.jsonl")) == 3
+  manifest = json.loads((job_dir / "manifest.json").read_text(encoding="utf-8"))
+  assert manifest["batches"][0]["id"] and manifest["batches"][0]["collected"]
+
+
+def test_crash_before_batch_create_submits_the_recorded_file(tmp_path, openai_client, monkeypatch):
+  client, state = openai_client
+  job_dir = prepared_job(tmp_path)
+  create = client.batches.create
+
+  def crash(**kwargs):
+    raise Crash()
+
+  monkeypatch.setattr(client.batches, "create", crash)
+  with pytest.raises(Crash):
+    batch_submit(job_dir, client, poll_seconds=0)
+
+  monkeypatch.setattr(client.batches, "create", create)
+  assert batch_submit(job_dir, client, poll_seconds=0) == 0
+  assert state.request_counts["batches.create"] == 1
+  assert state.request_counts["files.create"] == 1
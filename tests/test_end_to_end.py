@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import SCRIPTS_DIR
+
+import bench_pulse
+from fake_openai_server import start_server
+
+
+@pytest.fixture(scope="module")
+def servers():
+  fixture = bench_pulse.FixtureState(items=6, article_words=200, latency=0)
+  hosts = bench_pulse.start_fixture_servers(2, fixture)
+  openai_server, openai_state = start_server(0)
+  yield [host.server_port for host in hosts], openai_server, openai_state
+  for host in hosts:
+    host.shutdown()
+  openai_server.shutdown()
+
+
+def run_pipeline(workdir: Path, ports, openai_server, *pipeline_args: str) -> dict:
+  """One fetch_pulse run through the benchmark's child mode, with every path inside `workdir`."""
+  config = {
+    "workdir": str(workdir),
+    "sources_yaml": bench_pulse.sources_yaml(4, ports, html_every=2),
+    "pipeline_args": list(pipeline_args),
+  }
+  env = {
+    **os.environ,
+    "OPENAI_BASE_URL": f"http://127.0.0.1:{openai_server.server_port}/v1",
+    "OPENAI_API_KEY": "test",
+    "PULSE_MAX_FEATURED": "5",
+    "NO_PROXY": "127.0.0.1,localhost",
+  }
+  completed = subprocess.run(
+    [sys.executable, str(SCRIPTS_DIR / "bench_pulse.py"), "--child", json.dumps(config)],
+    capture_output=True,
+    text=True,
+    env=env,
+    timeout=300,
+  )
+  assert completed.returncode == 0, completed.stderr[-2000:]
+  marker = [line for line in completed.stdout.splitlines() if line.startswith(bench_pulse.RESULT_MARKER)]
+  assert marker, completed.stderr[-2000:]
+  return json.loads(marker[-1][len(bench_pulse.RESULT_MARKER) :])
+
+
+def test_daily_run_against_fixture_and_fake_openai(tmp_path, servers):
+  ports, openai_server, openai_state = servers
+  result = run_pipeline(tmp_path, ports, openai_server)
+  assert result["exit_code"] == 0
+
+  latest = json.loads((tmp_path / "content" / "pulse" / "latest.json").read_text(encoding="utf-8"))
+  featured = [item["id"] for item in latest["items"]]
+  assert len(featured) == 5
+  # The lazy merge stops at five stories, but the considered count still covers every source.
+  assert latest["stories_considered"] == 4 * 6
+  assert all(item["ai_summary"] for item in latest["items"])
+  assert openai_state.request_counts.get("responses", 0) >= 5
+
+  digests = list((tmp_path / "content" / "pulse").glob("pulse-*.mdx"))
+  assert len(digests) == 1
+  summary = json.loads((tmp_path / "content" / "_index" / "pulse" / "summary.json").read_text(encoding="utf-8"))
+  assert summary["totals"]["stories"] == 5
+  assert (tmp_path / "data" / "pulse_state.sqlite3").exists()
+  assert not (tmp_path / "data" / "pulse_journal.jsonl").exists()
+
+  # A second run in the same tree skips everything the first one featured.
+  run_pipeline(tmp_path, ports, openai_server)
+  latest = json.loads((tmp_path / "content" / "pulse" / "latest.json").read_text(encoding="utf-8"))
+  assert latest["items"]
+  assert not set(featured) & {item["id"] for item in latest["items"]}
+
+
+def test_replay_reextracts_every_article_offline(tmp_path, servers):
+  ports, openai_server, _ = servers
+  archive = tmp_path / "archive.jsonl.gz"
+  recorded = run_pipeline(tmp_path, ports, openai_server, "--record", str(archive))
+  latest = (tmp_path / "content" / "pulse" / "latest.json").read_text(encoding="utf-8")
+
+  replayed = run_pipeline(tmp_path, ports, openai_server, "--replay", str(archive), "--dry-run")
+  assert replayed["exit_code"] == 0
+  # The extraction store from the recorded run is bypassed, not served back.
+  assert replayed["stats"]["replay_hits"] > 0
+  # The extraction store the recorded run filled is bypassed, so every article is extracted again.
+  assert recorded["stats"]["extract_cache_stored"] > 0
+  assert not any(key.startswith("extract_cache") for key in replayed["stats"])
+  assert replayed["stats"]["bodies_spilled"] == recorded["stats"]["bodies_spilled"]
+  assert (tmp_path / "content" / "pulse" / "latest.json").read_text(encoding="utf-8") == latest
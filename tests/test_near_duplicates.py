@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+
+from conftest import article_text, make_story
+
+import fetch_pulse
+from fetch_pulse import (
+  DUPLICATE_THRESHOLD,
+  NearDuplicateIndex,
+  StoryClusters,
+  cluster_near_duplicates,
+  minhash_signature,
+  signature_similarity,
+)
+
+NOW = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+
+
+def reworded(text: str, every: int = 30) -> str:
+  """The same article with every `every`-th word changed, as a syndicated copy might be."""
+  words = text.split()
+  return " ".join("edited" if index % every == 0 else word for index, word in enumerate(words))
+
+
+def test_signature_is_stable_and_fixed_width():
+  text = article_text("council")
+  signature = minhash_signature(text)
+  assert signature == minhash_signature(text)
+  assert len(signature) == 64 * 8
+  assert minhash_signature("too short") is None
+
+
+def test_similarity_separates_copies_from_different_stories():
+  text = article_text("council")
+  original = minhash_signature(text)
+  assert signature_similarity(original, minhash_signature(text.upper())) == 1.0
+  assert signature_similarity(original, minhash_signature(reworded(text))) >= DUPLICATE_THRESHOLD
+  assert signature_similarity(original, minhash_signature(article_text("parks"))) < DUPLICATE_THRESHOLD
+
+
+def test_index_matches_near_copies_only():
+  index = NearDuplicateIndex()
+  index.add("council", minhash_signature(article_text("council")))
+  index.add("parks", minhash_signature(article_text("parks")))
+  assert index.match(minhash_signature(reworded(article_text("parks")))) == "parks"
+  assert index.match(minhash_signature(article_text("library"))) is None
+
+
+def test_clusters_keep_the_longest_copy_and_list_the_rest():
+  text = article_text("council")
+  short = make_story("kirkwood-times", 1, NOW, text)
+  longer = make_story("webster-kirkwood", 7, NOW - timedelta(hours=1), reworded(text) + " " + article_text("tail", 20))
+  other = make_story("kirkwood-times", 2, NOW - timedelta(hours=2), article_text("parks"))
+
+  clusters = StoryClusters()
+  assert clusters.add(short) is True
+  assert clusters.add(longer) is False
+  assert clusters.add(other) is True
+
+  clustered = clusters.clustered()
+  assert [story.id for story in clustered] == [longer.id, other.id]
+  assert [alternate["id"] for alternate in clustered[0].alternates] == [short.id]
+  assert clustered[1].alternates == []
+  assert set(clusters.signatures) == {short.id, longer.id, other.id}
+
+
+def test_stories_repeating_a_recent_one_are_dropped():
+  yesterday = make_story("kirkwood-times", 1, NOW - timedelta(days=1), article_text("council"))
+  repeat = make_story("stl-today", 3, NOW, reworded(article_text("council")))
+  fresh = make_story("stl-today", 4, NOW, article_text("library"))
+
+  clustered, signatures = cluster_near_duplicates([repeat, fresh], {yesterday.id: yesterday.signature})
+  assert [story.id for story in clustered] == [fresh.id]
+  assert repeat.id in signatures
+
+
+def test_unsignable_stories_stand_alone():
+  clusters = StoryClusters()
+  assert clusters.add(make_story("kirkwood-times", 1, NOW, "Brief."))
+  assert clusters.add(make_story("stl-today", 2, NOW, "Brief."))
+  assert len(clusters.clustered()) == 2
+
+
+def test_async_extraction_signs_pages_off_the_event_loop(workdir, monkeypatch):
+  text = article_text("council", 300)
+  html = f"<html><head><title>Council</title></head><body><article><p>{text}</p></article></body></html>"
+  threads = []
+  sign = fetch_pulse.minhash_signature
+
+  def recording_signature(value):
+    threads.append(threading.current_thread())
+    return sign(value)
+
+  monkeypatch.setattr(fetch_pulse, "minhash_signature", recording_signature)
+
+  async def extract():
+    return threading.current_thread(), await fetch_pulse.run_blocking(fetch_pulse.parse_article, html, "https://kirkwood.example/a")
+
+  loop_thread, extraction = asyncio.run(extract())
+  assert extraction[3] == sign(extraction[0])
+  assert threads and loop_thread not in threads
+
+
+def test_alternates_are_marked_seen_without_keeping_their_signatures():
+  text = article_text("council")
+  copy = make_story("kirkwood-times", 1, NOW, text)
+  longer = make_story("webster-kirkwood", 7, NOW, reworded(text) + " " + article_text("tail", 20))
+  clustered, signatures = cluster_near_duplicates([copy, longer])
+
+  story_ids, kept = fetch_pulse.seen_updates(clustered, signatures)
+  assert story_ids == [longer.id, copy.id]
+  assert kept == {longer.id: signatures[longer.id]}
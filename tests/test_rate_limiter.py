@@ -0,0 +1,48 @@
+import time
+
+from fetch_pulse import RateLimiter
+
+
+def test_acquire_within_capacity_does_not_wait():
+  limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=300)
+  started = time.monotonic()
+  assert all(limiter.acquire(100, timeout=0) for _ in range(3))
+  assert time.monotonic() - started < 0.1
+
+
+def test_acquire_gives_up_when_the_wait_exceeds_the_timeout():
+  limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1000)
+  assert limiter.acquire(10)
+  started = time.monotonic()
+  # The next request refills in a minute; the limiter must say so up front, not sleep first.
+  assert not limiter.acquire(10, timeout=0.5)
+  assert time.monotonic() - started < 0.1
+  assert limiter.level["requests"] < 1
+
+
+def test_acquire_waits_for_the_refill_inside_the_timeout():
+  limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=100_000)
+  limiter.level["requests"] = 0.0
+  started = time.monotonic()
+  assert limiter.acquire(10, timeout=1.0)
+  assert 0.05 <= time.monotonic() - started < 1.0
+
+
+def test_token_bucket_limits_independently_of_requests():
+  limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100)
+  assert limiter.acquire(100, timeout=0)
+  assert not limiter.acquire(50, timeout=0.2)
+
+
+def test_oversized_request_is_capped_at_bucket_capacity():
+  limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=100)
+  assert limiter.acquire(10_000, timeout=0)
+
+
+def test_pause_holds_every_caller_until_it_expires():
+  limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100_000)
+  limiter.pause(0.3)
+  assert not limiter.acquire(1, timeout=0.1)
+  started = time.monotonic()
+  assert limiter.acquire(1, timeout=1.0)
+  assert time.monotonic() - started >= 0.1
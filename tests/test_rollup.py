@@ -0,0 +1,181 @@
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+import fetch_pulse
+from fetch_pulse import (
+  create_story_id,
+  parse_digest_markdown,
+  read_digest_shard,
+  rebuild_rollup,
+  rollup_shard,
+  rollup_totals,
+  update_rollup,
+  write_markdown,
+)
+
+RUN_TIME = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+
+
+def item(source_name, number, *, link=True, alternates=(), priority="medium", score=10):
+  source_id = fetch_pulse.slugify(source_name)
+  url = f"https://{source_id}.example/news/{number}" if link else None
+  return {
+    "id": create_story_id(source_id, url) if url else None,
+    "source": {"id": source_id, "name": source_name},
+    "title": f"Council weighs item {number} (again)",
+    "link": url,
+    "published": None,
+    "ai_summary": f"Aldermen discussed item {number}. Residents asked questions.",
+    "community_impact": "Moderate: affects downtown parking.",
+    "sentiment": "neutral" if score == 0 else "positive",
+    "sentiment_score": score,
+    "priority": priority,
+    "tags": [],
+    "alternates": [
+      {"id": None, "source": {"id": fetch_pulse.slugify(name), "name": name}, "title": "", "link": href}
+      for name, href in alternates
+    ],
+  }
+
+
+def payload(run_time=RUN_TIME, items=None):
+  if items is None:
+    items = [
+      item("Kirkwood Times", 1, alternates=[("Webster-Kirkwood Times", "https://wkt.example/a?b=1"), ("STL Today", "https://stl.example/x")]),
+      item("STL Today", 2, priority="high", score=-35),
+      item("City of Kirkwood", 3, link=False, priority="low", score=0),
+    ]
+  return {
+    "generated_at": run_time.isoformat(),
+    "window_hours": 36,
+    "stories_considered": None,
+    "stories_featured": len(items),
+    "headline": "Budget week in Kirkwood",
+    "overview": "A busy council agenda.",
+    "vibe": {"score": 61, "label": "Steady", "rationale": "Mostly routine business."},
+    "sentiment": {"score": -4},
+    "call_to_action": "Show up Thursday at City Hall.",
+    "items": items,
+  }
+
+
+def test_parse_digest_markdown_reads_back_what_write_markdown_wrote(workdir):
+  written = payload()
+  write_markdown(written, RUN_TIME)
+  path = fetch_pulse.MARKDOWN_DIR / "pulse-2026-03-14.mdx"
+
+  parsed = parse_digest_markdown(path.read_text(encoding="utf-8"))
+  assert parsed is not None
+  assert rollup_shard(parsed) == rollup_shard(written)
+  assert read_digest_shard(path) == rollup_shard(written)
+
+
+def test_parse_digest_markdown_rejects_other_files():
+  assert parse_digest_markdown("---\ntitle: Not a digest\n---\n\nHello.\n") is None
+
+
+def read_summary():
+  return json.loads(fetch_pulse.ROLLUP_SUMMARY_FILE.read_text(encoding="utf-8"))
+
+
+def test_update_rollup_adds_and_drops_days(workdir):
+  yesterday = RUN_TIME - timedelta(days=1)
+  for run_time in (yesterday, RUN_TIME):
+    write_markdown(payload(run_time), run_time)
+    update_rollup([payload(run_time)])
+
+  summary = read_summary()
+  assert list(summary["days"]) == ["2026-03-13", "2026-03-14"]
+  assert summary["totals"]["stories"] == 6
+  assert summary["totals"]["by_priority"] == {"medium": 2, "high": 2, "low": 2}
+  assert summary["archive"] == "../../pulse"
+  assert (fetch_pulse.ROLLUP_DIR / "days" / "2026-03-14.json").exists()
+
+  empty = payload(RUN_TIME, items=[])
+  write_markdown(empty, RUN_TIME)
+  update_rollup([empty])
+  assert list(read_summary()["days"]) == ["2026-03-13"]
+  assert not (fetch_pulse.ROLLUP_DIR / "days" / "2026-03-14.json").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rebuild_matches_incremental_updates(workdir, workers):
+  for offset in range(3):
+    run_time = RUN_TIME - timedelta(days=offset)
+    write_markdown(payload(run_time), run_time)
+    update_rollup([payload(run_time)])
+  incremental = read_summary()
+  (fetch_pulse.ROLLUP_DIR / "days" / "2026-01-01.json").write_text("{}", encoding="utf-8")
+
+  rebuild_rollup(workers=workers)
+  rebuilt = read_summary()
+  assert rebuilt["days"] == incremental["days"]
+  assert rebuilt["totals"] == incremental["totals"]
+  assert rebuilt["sources"] == incremental["sources"]
+  assert not (fetch_pulse.ROLLUP_DIR / "days" / "2026-01-01.json").exists()
+
+
+def test_totals_are_adjusted_without_revisiting_other_days(workdir, monkeypatch):
+  def publish(run_time, items=None, sentiment=-4):
+    written = payload(run_time, items)
+    written["sentiment"]["score"] = sentiment
+    write_markdown(written, run_time)
+    update_rollup([written])
+    return read_summary()
+
+  for offset, sentiment in ((2, 10), (1, -7), (0, 3)):
+    publish(RUN_TIME - timedelta(days=offset), sentiment=sentiment)
+  # From here on, a run that re-totals every day fails.
+  monkeypatch.setattr(fetch_pulse, "rollup_totals", None)
+
+  # Re-running a day replaces its contribution rather than adding to it.
+  summary = publish(RUN_TIME, [item("STL Today", 9, priority="high")], sentiment=20)
+  assert summary["totals"] == rollup_totals(summary["days"])
+  assert summary["totals"]["stories"] == 7 and summary["totals"]["mean_sentiment"] == 7.7
+  # Dropping the first day moves first_day on.
+  summary = publish(RUN_TIME - timedelta(days=2), [])
+  assert summary["totals"] == rollup_totals(summary["days"])
+  assert summary["totals"]["first_day"] == "2026-03-13"
+
+
+def test_summary_without_a_sentiment_total_is_totalled_once(workdir):
+  write_markdown(payload(), RUN_TIME)
+  update_rollup([payload()])
+  summary = read_summary()
+  del summary["totals"]["sentiment_total"]
+  fetch_pulse.ROLLUP_SUMMARY_FILE.write_text(json.dumps(summary), encoding="utf-8")
+
+  later = RUN_TIME + timedelta(days=1)
+  write_markdown(payload(later), later)
+  update_rollup([payload(later)])
+  summary = read_summary()
+  assert summary["totals"] == rollup_totals(summary["days"])
+  assert summary["totals"]["sentiment_total"] == -8
+
+
+def test_missing_summary_is_rebuilt_from_the_archive(workdir):
+  yesterday = RUN_TIME - timedelta(days=1)
+  write_markdown(payload(yesterday), yesterday)
+  write_markdown(payload(), RUN_TIME)
+  update_rollup([payload()])
+  assert list(read_summary()["days"]) == ["2026-03-13", "2026-03-14"]
+
+
+def test_update_leaves_an_index_built_from_another_archive_alone(workdir, monkeypatch, capsys):
+  write_markdown(payload(), RUN_TIME)
+  update_rollup([payload()])
+  before = fetch_pulse.ROLLUP_SUMMARY_FILE.read_text(encoding="utf-8")
+
+  # A run whose digests were redirected elsewhere must not fold them into this index.
+  monkeypatch.setattr(fetch_pulse, "MARKDOWN_DIR", workdir / "elsewhere")
+  later = RUN_TIME + timedelta(days=1)
+  write_markdown(payload(later), later)
+  update_rollup([payload(later)])
+  assert fetch_pulse.ROLLUP_SUMMARY_FILE.read_text(encoding="utf-8") == before
+  assert "leaving it untouched" in capsys.readouterr().err
+
+  rebuild_rollup(workers=1)
+  assert read_summary()["archive"] == "../../../elsewhere"
+  assert list(read_summary()["days"]) == ["2026-03-15"]
@@ -0,0 +1,165 @@
+import gzip
+from datetime import UTC, datetime
+
+import pytest
+
+import fetch_pulse
+from fetch_pulse import FetchedPage, SitemapEntry, SitemapScan, SourceConfig, candidate_story, iter_sitemap, sitemap_date
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://kirkwood.example/news/council-vote</loc>
+    <lastmod>2026-03-13T18:30:00+00:00</lastmod>
+    <image:image><image:loc>https://kirkwood.example/img/council.jpg</image:loc></image:image>
+  </url>
+  <url>
+    <loc>https://kirkwood.example/news/parks-levy</loc>
+    <lastmod>2026-03-13T22:00:00Z</lastmod>
+    <news:news>
+      <news:publication_date>2026-03-12T09:15:00-06:00</news:publication_date>
+      <news:title>Parks levy heads to the ballot</news:title>
+    </news:news>
+  </url>
+  <url>
+    <loc>https://kirkwood.example/news/library-hours</loc>
+    <lastmod>2026-03-11</lastmod>
+  </url>
+  <url>
+    <loc>https://kirkwood.example/about</loc>
+  </url>
+  <url><lastmod>2026-03-13</lastmod></url>
+</urlset>
+"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://kirkwood.example/sitemap-2026-03.xml</loc><lastmod>2026-03-13</lastmod></sitemap>
+  <sitemap><loc>https://kirkwood.example/sitemap-2026-02.xml</loc><lastmod>2026-02-28T12:00:00Z</lastmod></sitemap>
+</sitemapindex>
+"""
+
+EXPECTED_URLS = [
+  ("url", SitemapEntry("https://kirkwood.example/news/council-vote", datetime(2026, 3, 13, 18, 30, tzinfo=UTC))),
+  (
+    "url",
+    SitemapEntry(
+      "https://kirkwood.example/news/parks-levy",
+      datetime(2026, 3, 12, 15, 15, tzinfo=UTC),
+      "Parks levy heads to the ballot",
+    ),
+  ),
+  ("url", SitemapEntry("https://kirkwood.example/news/library-hours", datetime(2026, 3, 12, tzinfo=UTC))),
+  ("url", SitemapEntry("https://kirkwood.example/about")),
+]
+
+
+def test_bare_date_counts_as_the_end_of_that_day():
+  assert sitemap_date("2026-03-11") == datetime(2026, 3, 12, tzinfo=UTC)
+  assert sitemap_date(" 2026-03-11 ") == datetime(2026, 3, 12, tzinfo=UTC)
+
+
+def test_bare_date_of_today_is_capped_at_now():
+  today = datetime.now(tz=UTC).date().isoformat()
+  before = datetime.now(tz=UTC)
+  parsed = sitemap_date(today)
+  assert before <= parsed <= datetime.now(tz=UTC)
+
+
+def test_full_datetimes_are_taken_as_given():
+  assert sitemap_date("2026-03-11T23:59:00Z") == datetime(2026, 3, 11, 23, 59, tzinfo=UTC)
+  assert sitemap_date("2026-03-11T08:00:00-05:00") == datetime(2026, 3, 11, 13, tzinfo=UTC)
+  assert sitemap_date(None) is None
+  assert sitemap_date("") is None
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def parser(request, monkeypatch):
+  if request.param == "stdlib":
+    monkeypatch.setattr(fetch_pulse, "lxml_etree", lambda: None)
+  elif fetch_pulse.lxml_etree() is None:
+    pytest.skip("lxml is not installed")
+  return request.param
+
+
+def test_urlset_entries_with_news_dates_preferred(parser):
+  assert list(iter_sitemap(URLSET)) == EXPECTED_URLS
+
+
+def test_gzipped_sitemap_reads_the_same(parser):
+  assert list(iter_sitemap(gzip.compress(URLSET))) == EXPECTED_URLS
+
+
+def test_sitemap_index_yields_child_sitemaps(parser):
+  assert list(iter_sitemap(INDEX)) == [
+    ("sitemap", SitemapEntry("https://kirkwood.example/sitemap-2026-03.xml", datetime(2026, 3, 14, tzinfo=UTC))),
+    ("sitemap", SitemapEntry("https://kirkwood.example/sitemap-2026-02.xml", datetime(2026, 2, 28, 12, tzinfo=UTC))),
+  ]
+
+
+def test_window_check_keeps_pages_changed_on_the_cutoff_day(parser):
+  cutoff = datetime(2026, 3, 11, 20, tzinfo=UTC)
+  kept = [entry.loc for _, entry in iter_sitemap(URLSET) if entry.lastmod is None or entry.lastmod >= cutoff]
+  assert "https://kirkwood.example/news/library-hours" in kept
+
+
+def scan_of(content, cutoff=datetime(2026, 3, 1, tzinfo=UTC)):
+  source = SourceConfig(name="Kirkwood", type="sitemap", url="https://kirkwood.example/sitemap.xml", slug="kirkwood", max_items=3)
+  scan = SitemapScan(source, cutoff)
+  scan.read(FetchedPage(source.url, content, None, "application/x-gzip"))
+  return scan
+
+
+def long_urlset(count=2000):
+  urls = "".join(
+    f"<url><loc>https://kirkwood.example/news/{index}</loc><lastmod>2026-03-13</lastmod></url>" for index in range(count)
+  )
+  return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'.encode()
+
+
+@pytest.mark.parametrize("damage", ["truncated", "corrupt"])
+def test_damaged_gzip_sitemap_is_skipped_with_a_warning(parser, damage, capsys):
+  packed = gzip.compress(long_urlset())
+  if damage == "truncated":
+    packed = packed[: len(packed) // 2]
+  else:
+    # Garbage right after the 10-byte gzip header: zlib rejects the deflate stream itself.
+    packed = packed[:10] + b"\xff" * 4 + packed[14:]
+
+  scan = scan_of(packed)
+  assert "Could not read sitemap" in capsys.readouterr().err
+  assert len(scan.entries) < 2000
+
+
+MIXED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://kirkwood.example/about</loc></url>
+  <url><loc>https://kirkwood.example/contact</loc></url>
+  <url><loc>https://kirkwood.example/news/library-hours</loc><lastmod>2026-03-12T10:00:00Z</lastmod></url>
+  <url><loc>https://kirkwood.example/tags/council</loc></url>
+  <url><loc>https://kirkwood.example/news/council-vote</loc><lastmod>2026-03-13T18:30:00Z</lastmod></url>
+</urlset>
+"""
+
+
+def test_undated_entries_trail_dated_articles_and_need_a_page_date(parser):
+  candidates = scan_of(MIXED).candidates()
+  assert [candidate.link.rsplit("/", 1)[1] for candidate in candidates] == [
+    "council-vote",
+    "library-hours",
+    "about",
+    "contact",
+    "council",
+  ]
+
+  cutoff = datetime(2026, 3, 12, tzinfo=UTC)
+  text = "Residents packed the council chamber. " * 40
+  undated_page = (text, "About us", None, None)
+  story = candidate_story(candidates[0], undated_page, cutoff)
+  assert story is not None and story.published == datetime(2026, 3, 13, 18, 30, tzinfo=UTC)
+  # No sitemap date and no page date: a static page, not today's news.
+  assert candidate_story(candidates[2], undated_page, cutoff) is None
+  dated_page = (text, "Contact", datetime(2026, 3, 13, 9, tzinfo=UTC), None)
+  assert candidate_story(candidates[3], dated_page, cutoff).published == datetime(2026, 3, 13, 9, tzinfo=UTC)
@@ -0,0 +1,118 @@
+import json
+from datetime import UTC, datetime, timedelta
+
+from conftest import article_text
+
+import fetch_pulse
+from fetch_pulse import (
+  JsonStateStore,
+  SqliteStateStore,
+  minhash_signature,
+  open_state_store,
+  pack_signature,
+  save_state,
+  unpack_signature,
+)
+
+NOW = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+COUNCIL = minhash_signature(article_text("council"))
+PARKS = minhash_signature(article_text("parks"))
+
+
+def sample_state():
+  return {
+    "seen": {
+      "kirkwood-times:aaaaaaaaaaaa": NOW.isoformat(),
+      "webster-kirkwood:bbbbbbbbbbbb": (NOW - timedelta(days=2)).isoformat(),
+      "stl-today:cccccccccccc": (NOW - timedelta(days=40)).isoformat(),
+    },
+    "last_run": NOW.isoformat(),
+    "signatures": {"kirkwood-times:aaaaaaaaaaaa": pack_signature(COUNCIL), "gone:dddddddddddd": pack_signature(PARKS)},
+  }
+
+
+def test_import_then_export_round_trips(tmp_path):
+  store = SqliteStateStore(tmp_path / "state.sqlite3")
+  assert store.import_state(sample_state()) == 3
+  exported = store.export()
+  store.close()
+
+  expected = sample_state()
+  # Signatures of ids that are not in `seen` have nothing to expire with and are dropped.
+  del expected["signatures"]["gone:dddddddddddd"]
+  assert exported == expected
+
+
+def test_signatures_are_packed_in_the_json_file(tmp_path):
+  assert unpack_signature(pack_signature(COUNCIL)) == COUNCIL
+  assert len(pack_signature(COUNCIL)) < len(COUNCIL) * 3 // 4
+
+  store = JsonStateStore(tmp_path / "state.json")
+  store.mark_seen(["kirkwood-times:aaaaaaaaaaaa"], NOW, {"kirkwood-times:aaaaaaaaaaaa": COUNCIL})
+  store.save()
+  on_disk = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))
+  assert on_disk["signatures"] == {"kirkwood-times:aaaaaaaaaaaa": pack_signature(COUNCIL)}
+  assert JsonStateStore(tmp_path / "state.json").signatures() == {"kirkwood-times:aaaaaaaaaaaa": COUNCIL}
+
+
+def test_hex_signatures_from_older_state_still_load(tmp_path):
+  legacy = {"seen": {"kirkwood-times:aaaaaaaaaaaa": NOW.isoformat()}, "signatures": {"kirkwood-times:aaaaaaaaaaaa": COUNCIL}}
+  save_state(legacy, tmp_path / "state.json")
+  assert JsonStateStore(tmp_path / "state.json").signatures() == {"kirkwood-times:aaaaaaaaaaaa": COUNCIL}
+  store = SqliteStateStore(tmp_path / "state.sqlite3")
+  store.import_state(legacy)
+  assert store.signatures() == {"kirkwood-times:aaaaaaaaaaaa": COUNCIL}
+  store.close()
+
+
+def test_sqlite_store_matches_json_store(tmp_path):
+  save_state(sample_state(), tmp_path / "state.json")
+  json_store = JsonStateStore(tmp_path / "state.json")
+  sqlite_store = SqliteStateStore(tmp_path / "state.sqlite3")
+  sqlite_store.import_state(sample_state())
+
+  horizon = NOW - timedelta(days=30)
+  later = NOW + timedelta(hours=24)
+  for store in (json_store, sqlite_store):
+    assert store.prune(horizon) == 1
+    store.mark_seen(["kirkwood-times:eeeeeeeeeeee"], later, {"kirkwood-times:eeeeeeeeeeee": PARKS})
+    assert "kirkwood-times:eeeeeeeeeeee" in store.seen()
+    assert "stl-today:cccccccccccc" not in store.seen()
+  assert dict(sqlite_store.seen()) == dict(json_store.seen())
+  assert sqlite_store.last_run() == json_store.last_run() == later.isoformat()
+  assert sqlite_store.signatures() == {
+    key: value for key, value in json_store.signatures().items() if key in json_store.seen()
+  }
+  sqlite_store.close()
+
+
+def test_first_sqlite_open_imports_the_json_file_and_leaves_it_alone(workdir):
+  save_state(sample_state(), fetch_pulse.STATE_FILE)
+  tracked = fetch_pulse.STATE_FILE.read_bytes()
+
+  store = open_state_store("sqlite")
+  assert len(store.seen()) == 3
+  assert store.last_run() == NOW.isoformat()
+  store.close()
+  # pulse_state.json is committed; the migration must not delete or rewrite it.
+  assert fetch_pulse.STATE_FILE.read_bytes() == tracked
+  assert list(fetch_pulse.STATE_FILE.parent.glob("*.json")) == [fetch_pulse.STATE_FILE]
+
+  # Later opens use the database and never import again.
+  save_state({"seen": {"other:ffffffffffff": NOW.isoformat()}, "last_run": None}, fetch_pulse.STATE_FILE)
+  store = open_state_store("sqlite")
+  assert "other:ffffffffffff" not in store.seen()
+  store.close()
+
+
+def test_read_only_open_leaves_the_database_untouched(workdir):
+  store = open_state_store("sqlite")
+  store.import_state(sample_state())
+  store.close()
+
+  read_only = open_state_store("sqlite", read_only=True)
+  read_only.mark_seen(["kirkwood-times:eeeeeeeeeeee"], NOW)
+  read_only.close()
+  store = open_state_store("sqlite")
+  assert "kirkwood-times:eeeeeeeeeeee" not in store.seen()
+  store.close()
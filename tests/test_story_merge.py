@@ -0,0 +1,151 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from conftest import article_text
+
+import fetch_pulse
+from fetch_pulse import (
+  Candidate,
+  SourceConfig,
+  StoryMerge,
+  candidate_story,
+  cluster_near_duplicates,
+  merge_source_stories,
+  minhash_signature,
+)
+
+NOW = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+CUTOFF = NOW - timedelta(hours=36)
+
+
+def source(slug: str, kind: str = "rss") -> SourceConfig:
+  return SourceConfig(name=slug.title(), type=kind, url=f"https://{slug}.example/", slug=slug, max_items=3)
+
+
+def page(text, title, published):
+  return text, title, published, minhash_signature(text)
+
+
+def build_fixture():
+  """Four sources with interleaved dates, a failed extraction and one cross-source copy.
+
+  Returns (sources, candidates per source, page for each link). A page is the extraction
+  result parse_article would give, or None when extraction fails.
+  """
+  sources = [source("kirkwood-times"), source("webster-kirkwood"), source("stl-today"), source("city-news", "html")]
+  candidates = {}
+  pages = {}
+  for number, config in enumerate(sources[:3]):
+    feed = []
+    for index in range(6):
+      published = NOW - timedelta(hours=number + index * 4)
+      link = f"{config.url}news/{index}"
+      feed.append(Candidate(config, link, f"{config.slug} {index}", published, {"title": f"{config.slug} {index}"}))
+      pages[link] = page(article_text(link), f"{config.slug} {index}", published)
+    candidates[config.slug] = feed
+  # Webster-Kirkwood's newest page fails, so a fourth feed entry has to stand in for it.
+  pages["https://webster-kirkwood.example/news/0"] = None
+  # STL Today's second story is a longer copy of Kirkwood Times' newest one.
+  original = pages["https://kirkwood-times.example/news/0"][0]
+  pages["https://stl-today.example/news/1"] = page(original + " " + article_text("extra", 40), "stl-today 1", NOW - timedelta(hours=6))
+
+  listing = sources[3]
+  candidates[listing.slug] = []
+  for index in range(3):
+    link = f"{listing.url}story-{index}"
+    candidates[listing.slug].append(Candidate(listing, link, f"city-news {index}"))
+    pages[link] = page(article_text(link), f"city-news {index}", NOW - timedelta(hours=index * 5 + 1, minutes=30))
+  return sources, candidates, pages
+
+
+@pytest.fixture(autouse=True)
+def in_memory_bodies(monkeypatch):
+  monkeypatch.setattr(fetch_pulse, "SPILL_BODIES", False)
+
+
+def eager(sources, candidates, pages):
+  """What collect_stories plus cluster_near_duplicates produce: every source read to max_items."""
+  per_source = []
+  for config in sources:
+    stories = []
+    for candidate in candidates[config.slug]:
+      if len(stories) >= config.max_items:
+        break
+      story = candidate_story(candidate, pages[candidate.link], CUTOFF)
+      if story:
+        stories.append(story)
+    per_source.append(stories)
+  collected, _ = merge_source_stories(sources, per_source)
+  clustered, _ = cluster_near_duplicates(collected)
+  return clustered
+
+
+def lazy(sources, candidates, pages, limit):
+  merge = StoryMerge(CUTOFF, limit)
+  for index, config in enumerate(sources):
+    merge.add_source(index, config, candidates[config.slug])
+  extracted = []
+  while batch := merge.next_batch():
+    extracted.extend(candidate.link for candidate in batch)
+    merge.settle([pages[candidate.link] for candidate in batch])
+  _, clustered, _ = merge.finish()
+  return clustered, extracted
+
+
+def members(story):
+  return {story.id} | {alternate["id"] for alternate in story.alternates}
+
+
+@pytest.mark.parametrize("limit", [1, 3, 5, 8])
+def test_lazy_merge_features_what_the_eager_path_would(limit):
+  sources, candidates, pages = build_fixture()
+  expected = eager(sources, candidates, pages)
+  clustered, extracted = lazy(sources, candidates, pages, limit)
+
+  # Same stories in the same places; a cluster may lack copies the merge stopped before reaching.
+  assert len(clustered) >= limit
+  for story, reference in zip(clustered[:limit], expected):
+    assert members(story) <= members(reference)
+  assert len(extracted) == len(set(extracted))
+  if limit < 5:
+    assert len(extracted) < sum(len(feed) for feed in candidates.values())
+
+
+def test_lazy_merge_places_a_cluster_at_its_newest_copy():
+  sources, candidates, pages = build_fixture()
+  expected = eager(sources, candidates, pages)
+  clustered, _ = lazy(sources, candidates, pages, limit=len(expected))
+
+  assert [story.id for story in clustered] == [story.id for story in expected]
+  assert [story.alternates for story in clustered] == [story.alternates for story in expected]
+  # The longer, older STL Today copy represents the cluster but ranks as Kirkwood Times' newest story.
+  assert clustered[0].source_slug == "stl-today"
+  assert [alternate["source"]["id"] for alternate in clustered[0].alternates] == ["kirkwood-times"]
+
+
+def test_next_batch_never_asks_for_more_than_the_missing_stories():
+  sources, candidates, pages = build_fixture()
+  merge = StoryMerge(CUTOFF, limit=2)
+  for index, config in enumerate(sources):
+    merge.add_source(index, config, candidates[config.slug])
+  while batch := merge.next_batch():
+    assert len(batch) <= max(1, merge.limit - merge.distinct - merge.waiting)
+    merge.settle([pages[candidate.link] for candidate in batch])
+  assert merge.distinct == 2
+
+
+@pytest.mark.parametrize("limit", [1, 8])
+def test_considered_count_does_not_shrink_with_the_limit(limit):
+  sources, candidates, pages = build_fixture()
+  per_source = [[candidate_story(candidate, pages[candidate.link], CUTOFF) for candidate in candidates[config.slug]] for config in sources]
+  _, considered = merge_source_stories(
+    sources, [[story for story in stories if story][: config.max_items] for config, stories in zip(sources, per_source)]
+  )
+
+  merge = StoryMerge(CUTOFF, limit)
+  for index, config in enumerate(sources):
+    merge.add_source(index, config, candidates[config.slug])
+  while batch := merge.next_batch():
+    merge.settle([pages[candidate.link] for candidate in batch])
+  merge.finish()
+  assert merge.considered == considered == 12
@@ -0,0 +1,38 @@
+from datetime import UTC, datetime
+
+import pytest
+from conftest import article_text, make_story
+
+import fetch_pulse
+from fake_openai_server import start_server
+from fetch_pulse import summarize_stories
+
+NOW = datetime(2026, 3, 14, 6, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def openai_client(monkeypatch):
+  from openai import OpenAI
+
+  server, _ = start_server(0)
+  monkeypatch.setattr(fetch_pulse, "SUMMARY_CACHE", None)
+  # Other tests build request bodies directly and leave their prompts behind.
+  fetch_pulse.clear_article_prompts()
+  yield OpenAI(api_key="test", base_url=f"http://127.0.0.1:{server.server_port}/v1", max_retries=0)
+  server.shutdown()
+
+
+def test_prompts_are_released_as_each_story_is_summarized(openai_client):
+  stories = [make_story("kirkwood-times", index, NOW, article_text(f"story {index}", 400)) for index in range(6)]
+  held = []
+
+  def on_summary(story, summary):
+    with fetch_pulse._ARTICLE_PROMPTS_LOCK:
+      held.append(((story.title, story.body) in fetch_pulse._ARTICLE_PROMPTS, len(fetch_pulse._ARTICLE_PROMPTS)))
+
+  summaries = summarize_stories(openai_client, stories, workers=2, on_summary=on_summary)
+  assert len(summaries) == 6
+  assert all(summary.summary for summary in summaries)
+  # A summarized story's prompt is gone at once; at most the other worker's is still held.
+  assert held and all(not present and size <= 1 for present, size in held)
+  assert not fetch_pulse._ARTICLE_PROMPTS